@@ -0,0 +1,284 @@
+"""
+A playground file for benchmarking solver performance.
+
+Measures hint latency on representative second-turn states (the largest and
+most expensive candidate sets a solver sees during a game).
+"""
+import gc
+import math
+import time
+import random
+import statistics
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+import config
+from wordle_game.dictionary import load_dictionary
+from wordle_game.wordle_game import WordleGame
+from wordle_game.solver import GreedySolver, MCTSSolver
+from wordle_game.solver_manager import SolverManager
+from wordle_game.candidate_set import CandidateSet
+
+# (first guess, target) pairs giving second-turn states of varied sizes
+SAMPLE_STATES = [
+    ('tares', 'crane'),
+    ('crate', 'boxer'),
+    ('tares', 'pious'),
+    ('crate', 'mommy'),
+    ('jujus', 'frame'),
+]
+REPEATS = 3
+# Answers played per mode by the outcome search benchmark
+OUTCOME_SEARCH_GAMES = 100
+
+
+def second_turn_states(dictionary: List[str]) -> List[Tuple[str, List[str]]]:
+    """Return (label, candidates) for each sample state."""
+    states = []
+    for first_guess, target in SAMPLE_STATES:
+        game = WordleGame(dictionary, target_word=target)
+        game.submit_guess(first_guess)
+        states.append((f"{first_guess}->{target}", game.get_remaining_candidates()))
+    return states
+
+
+def time_hint(solver, candidates: List[str]) -> Tuple[str, float]:
+    """Return the solver's guess and its median latency in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        guess = solver.select_guess(candidates)
+        timings.append((time.perf_counter() - start) * 1000)
+    return guess, statistics.median(timings)
+
+
+def benchmark_greedy_probes(dictionary: List[str]):
+    """Compare greedy hint latency with and without full-dictionary probes."""
+    solvers = {
+        'candidates': GreedySolver(dictionary),
+        'probes': GreedySolver(dictionary, probe_guesses=True),
+    }
+    print(f"{'State':<16} {'Candidates':<12} {'Mode':<12} {'Guess':<8} {'ms':>8}")
+    for label, candidates in second_turn_states(dictionary):
+        for mode, solver in solvers.items():
+            guess, ms = time_hint(solver, candidates)
+            print(f"{label:<16} {len(candidates):<12} {mode:<12} {guess:<8} {ms:>8.1f}")
+
+
+def scan_rollout_id(solver: MCTSSolver, candidate_ids) -> Optional[int]:
+    """Baseline rollout: scan the ordered word list for the first candidate.
+
+    This is how rollouts picked a guess before the word rank lookup.
+    """
+    words = solver.feedback_matrix.words
+    candidates = {words[i] for i in candidate_ids}
+    for word in solver.ordered_words:
+        if word in candidates:
+            return solver.feedback_matrix.id_of(word)
+    return None
+
+
+def benchmark_mcts_simulations(dictionary: List[str]):
+    """Measure MCTS simulation throughput with scanned and ranked rollouts."""
+    ordered_words = SolverManager(dictionary).ordered_words
+    # every repeat searches from scratch rather than continuing the last tree
+    solvers = {
+        'scan': MCTSSolver(dictionary, ordered_words, reuse_tree=False),
+        'rank': MCTSSolver(dictionary, ordered_words, reuse_tree=False),
+    }
+    solvers['scan']._rollout_id = lambda ids: scan_rollout_id(solvers['scan'], ids)
+    print(f"{'State':<16} {'Candidates':<12} {'Mode':<6} {'Guess':<8} {'ms':>8} {'sims/s':>8}")
+    for label, candidates in second_turn_states(dictionary):
+        for mode, solver in solvers.items():
+            random.seed(0)
+            guess, ms = time_hint(solver, candidates)
+            print(f"{label:<16} {len(candidates):<12} {mode:<6} {guess:<8} {ms:>8.1f} "
+                  f"{solver.simulations / ms * 1000:>8.0f}")
+
+
+class ObjectNode:
+    """Baseline: a search tree node as one Python object, as MCTS trees were
+    stored before MCTSTree."""
+
+    def __init__(self, candidate_set: CandidateSet, guess: Optional[str] = None,
+                 parent: Optional['ObjectNode'] = None):
+        self.candidate_set = candidate_set
+        self.guess = guess
+        self.parent = parent
+        self.children: Dict[Tuple[str, int], 'ObjectNode'] = {}
+        self.visits = 0
+        self.value = 0.0
+        self.untried_moves: List[str] = candidate_set.words()
+        self.made_guess = False
+
+    def add_child(self, pattern: int, guess: str) -> 'ObjectNode':
+        feedback_matrix = self.candidate_set.feedback_matrix
+        new_candidates = self.candidate_set & feedback_matrix.consistent_words(
+            feedback_matrix.id_of(guess), pattern)
+        node = ObjectNode(new_candidates, guess, self)
+        self.children[(guess, pattern)] = node
+        return node
+
+    def get_ucb(self, exploration_constant: float) -> float:
+        if self.visits == 0:
+            return float('inf')
+        return self.value / self.visits + exploration_constant * \
+            math.sqrt(math.log(self.parent.visits) / self.visits)
+
+
+def grow_object_tree(solver: MCTSSolver, candidates: CandidateSet,
+                     simulations: int) -> Tuple[ObjectNode, int]:
+    """Baseline: run the solver's default search on a tree of ObjectNodes.
+
+    Returns:
+        Tuple of (root node, number of nodes)
+    """
+    fm = solver.feedback_matrix
+    unranked = len(solver.ordered_words)
+    root, nodes = ObjectNode(candidates), 1
+    for _ in range(simulations):
+        target_word = random.choice(solver.ordered_words[:15])
+        node, guesses = root, 0
+        while not node.untried_moves and node.children:
+            node = max(node.children.values(),
+                       key=lambda child: child.get_ucb(solver.exploration_constant))
+            guesses += 1
+        if node.untried_moves:
+            guess = min(node.untried_moves, key=lambda word: solver.word_ranks[fm.id_of(word)])
+            if solver.word_ranks[fm.id_of(guess)] == unranked:
+                continue
+            node.untried_moves.remove(guess)
+            guesses += 1
+            node = node.add_child(fm.pattern(fm.id_of(guess), fm.id_of(target_word)), guess)
+            nodes += 1
+        reward = solver._simulate(node.candidate_set, target_word, guesses)
+        while node is not None:
+            node.visits += 1
+            node.value += reward
+            node = node.parent
+    return root, nodes
+
+
+def benchmark_mcts_memory(dictionary: List[str]):
+    """Measure the memory held by MCTS trees after 1k and 10k simulations.
+
+    The 'objects' baseline grows the same seeded search from ObjectNodes;
+    'arrays' is MCTSTree without transpositions, so both hold the same nodes.
+    """
+    solver = MCTSSolver(dictionary, SolverManager(dictionary).ordered_words,
+                        reuse_tree=False, transpositions=False)
+    print(f"{'State':<16} {'Candidates':<12} {'Sims':>6} {'Mode':<8} {'Nodes':>7} "
+          f"{'MiB':>7} {'B/node':>7}")
+    for label, candidates in second_turn_states(dictionary):
+        candidate_set = CandidateSet.from_words(solver.feedback_matrix, candidates)
+        for simulations in (1000, 10000):
+            # warm the shared feedback caches so only the tree is measured
+            random.seed(0)
+            solver._run_simulations(solver._new_tree(candidate_set), simulations)
+            gc.collect()
+
+            for mode in ('objects', 'arrays'):
+                random.seed(0)
+                tracemalloc.start()
+                if mode == 'objects':
+                    tree, nodes = grow_object_tree(solver, candidate_set, simulations)
+                else:
+                    tree = solver._new_tree(candidate_set)
+                    solver._run_simulations(tree, simulations)
+                    nodes = len(tree)
+                held, _ = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{label:<16} {len(candidates):<12} {simulations:>6} {mode:<8} "
+                      f"{nodes:>7} {held / 2**20:>7.2f} {held / nodes:>7.0f}")
+                del tree
+                gc.collect()
+
+
+def benchmark_mcts_transpositions(dictionary: List[str]):
+    """Compare MCTS trees with and without merged transpositions."""
+    ordered_words = SolverManager(dictionary).ordered_words
+    solvers = {
+        'tree': MCTSSolver(dictionary, ordered_words, reuse_tree=False,
+                           transpositions=False),
+        'dag': MCTSSolver(dictionary, ordered_words, reuse_tree=False,
+                          transpositions=True),
+    }
+    simulations = 1000
+    # candidate filters computed; repeated transitions reuse a memoized state
+    print(f"{'State':<16} {'Candidates':<12} {'Mode':<6} {'Nodes':>7} {'Filters':>8} "
+          f"{'Merged':>7} {'ms':>8} {'Guess':<8} {'Share':>6}")
+    for label, candidates in second_turn_states(dictionary):
+        for mode, solver in solvers.items():
+            candidate_set = CandidateSet.from_words(solver.feedback_matrix, candidates)
+            random.seed(0)
+            start = time.perf_counter()
+            tree = solver._new_tree(candidate_set)
+            solver._run_simulations(tree, simulations)
+            ms = (time.perf_counter() - start) * 1000
+            action, share = solver._leader(tree)
+            guess = solver.feedback_matrix.words[tree.action_guess[action]]
+            print(f"{label:<16} {len(candidates):<12} {mode:<6} {len(tree):>7} "
+                  f"{tree.filters:>8} {tree.merged:>7} {ms:>8.1f} {guess:<8} "
+                  f"{share:>6.2f}")
+
+
+def benchmark_mcts_outcome_search(dictionary: List[str]):
+    """Play games with the default MCTS search and with outcome search."""
+    ordered_words = SolverManager(dictionary).ordered_words
+    answers = random.Random(config.RANDOM_SEED).sample(
+        load_dictionary(config.WORDLE_ANS_PATH), OUTCOME_SEARCH_GAMES)
+    print(f"{'Mode':<10} {'Games':>6} {'Win rate':>9} {'Guesses':>8} {'Re-roots':>10} "
+          f"{'Reused sims':>12} {'ms/game':>8}")
+    for mode, outcome_search in (('default', False), ('outcomes', True)):
+        before = MCTSSolver.reuse_stats()
+        wins, guesses = 0, 0
+        random.seed(0)
+        start = time.perf_counter()
+        for target in answers:
+            solver = MCTSSolver(dictionary, ordered_words, root_workers=0,
+                                outcome_search=outcome_search)
+            game = WordleGame(dictionary, target_word=target)
+            guess = solver.starting_word()
+            while True:
+                pattern, game_over = game.submit_guess(guess)
+                solver.observe_feedback(guess, pattern)
+                if game_over:
+                    break
+                guess = solver.select_guess(game.get_remaining_candidates())
+            wins += game.game_won
+            guesses += game.guess_count
+        ms = (time.perf_counter() - start) * 1000 / len(answers)
+        after = MCTSSolver.reuse_stats()
+        reroots = after['reroots'] - before['reroots']
+        attempts = reroots + after['reroot_misses'] - before['reroot_misses']
+        reused = after['simulations_reused'] - before['simulations_reused']
+        print(f"{mode:<10} {len(answers):>6} {wins / len(answers):>9.2%} "
+              f"{guesses / len(answers):>8.2f} {f'{reroots}/{attempts}':>10} "
+              f"{reused:>12} {ms:>8.0f}")
+
+
+def main():
+    """Main function to run the benchmarks."""
+    dictionary = load_dictionary(config.DICTIONARY_PATH)
+
+    print("Which benchmark to run?")
+    print("1. Greedy hint latency with and without probe guesses")
+    print("2. MCTS simulations per second")
+    print("3. MCTS tree memory")
+    print("4. MCTS with and without transpositions")
+    print("5. MCTS games with and without outcome search")
+    choice = input("Enter choice (1-5): ")
+    print()
+
+    benchmarks = {
+        "1": benchmark_greedy_probes,
+        "2": benchmark_mcts_simulations,
+        "3": benchmark_mcts_memory,
+        "4": benchmark_mcts_transpositions,
+        "5": benchmark_mcts_outcome_search,
+    }
+    benchmarks.get(choice, benchmark_greedy_probes)(dictionary)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Hint caching service implementation using Supabase.
 import json
 import hashlib
 from typing import Callable, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .supabase_client import get_supabase_client, SupabaseConnectionError
 
@@ -15,6 +15,7 @@ class CacheEntry:
     """Data class representing a cache entry."""
     hint: str
     solver_type: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class HintCacheError(Exception):
@@ -26,29 +27,40 @@ class HintCache:
     """Service for caching and retrieving Wordle game hints."""
 
     @staticmethod
-    def _generate_state_hash(game_state: Dict[str, Any]) -> str:
+    def _generate_state_hash(game_state: Dict[str, Any],
+                             solver_params: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a deterministic hash for a game state.
 
         Args:
             game_state: Dictionary containing game state information
+            solver_params: Optional solver parameters the hint is computed with
 
         Returns:
             str: SHA-256 hash of the canonicalized game state
         """
-        # Create a canonical representation of the game state
-        # Sort dictionary keys to ensure consistent ordering
-        canonical_state = json.dumps(game_state['history'], sort_keys=True)
+        # Key on the accumulated constraints rather than the raw history, so
+        # guess orders that reach the same knowledge share one cache entry
+        canonical_state = game_state.get('constraint_key')
+        if canonical_state is None:
+            canonical_state = json.dumps(game_state['history'], sort_keys=True)
+        # Different parameters give different hints; default parameters keep
+        # the plain state hash so existing entries stay valid
+        if solver_params:
+            canonical_state += '|' + json.dumps(
+                solver_params, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(canonical_state.encode()).hexdigest()
 
     @staticmethod
-    def get_cached_hint(game_state: Dict[str, Any], solver_type: str) -> Optional[CacheEntry]:
+    def get_cached_hint(game_state: Dict[str, Any], solver_type: str,
+                        solver_params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
         """
         Retrieve a cached hint for the given game state and solver type.
 
         Args:
             game_state: Current game state dictionary
             solver_type: Type of solver used (e.g., 'naive', 'greedy', 'mcts')
+            solver_params: Optional solver parameters the hint was computed with
 
         Returns:
             Optional[CacheEntry]: Cache entry if found, None otherwise
@@ -58,10 +70,10 @@ class HintCache:
         """
         try:
             client = get_supabase_client()
-            state_hash = HintCache._generate_state_hash(game_state)
+            state_hash = HintCache._generate_state_hash(game_state, solver_params)
 
             response = (client.table('hint_cache')
-                        .select('hint, solver_type')
+                        .select('hint, solver_type, metadata')
                         .eq('game_state_hash', state_hash)
                         .eq('solver_type', solver_type)
                         .limit(1)
@@ -71,7 +83,8 @@ class HintCache:
                 entry = response.data[0]
                 return CacheEntry(
                     hint=entry['hint'],
-                    solver_type=entry['solver_type']
+                    solver_type=entry['solver_type'],
+                    metadata=entry.get('metadata') or {}
                 )
             return None
 
@@ -79,7 +92,9 @@ class HintCache:
             raise HintCacheError(f"Failed to retrieve cached hint: {str(e)}")
 
     @staticmethod
-    def cache_hint(game_state: Dict[str, Any], hint: str, solver_type: str) -> None:
+    def cache_hint(game_state: Dict[str, Any], hint: str, solver_type: str,
+                   solver_params: Optional[Dict[str, Any]] = None,
+                   metadata: Optional[Dict[str, Any]] = None) -> None:
         """
         Cache a hint for the given game state and solver type.
 
@@ -87,19 +102,22 @@ class HintCache:
             game_state: Current game state dictionary
             hint: The computed hint to cache
             solver_type: Type of solver used
+            solver_params: Optional solver parameters the hint was computed with
+            metadata: Optional search details reported with the hint
 
         Raises:
             HintCacheError: If there's an error storing the hint
         """
         try:
             client = get_supabase_client()
-            state_hash = HintCache._generate_state_hash(game_state)
+            state_hash = HintCache._generate_state_hash(game_state, solver_params)
 
             # Prepare cache entry with only the fields in our schema
             cache_data = {
                 'game_state_hash': state_hash,
                 'solver_type': solver_type,
-                'hint': hint
+                'hint': hint,
+                'metadata': metadata or {}
                 # created_at will be handled by the database default value
             }
 
@@ -116,39 +134,46 @@ class HintCache:
     def get_or_compute_hint(
         game_state: Dict[str, Any],
         solver_type: str,
-        compute_fn: Callable[[], Tuple[str, str, int]]
-    ) -> Tuple[str, bool]:
+        compute_fn: Callable[[], Tuple[str, Dict[str, Any]]],
+        solver_params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, bool, Dict[str, Any]]:
         """
         Get a cached hint or compute and cache a new one.
 
         Args:
             game_state: Current game state dictionary
             solver_type: Type of solver to use
-            compute_fn: Function to compute a new hint if not cached
+            compute_fn: Function returning a new (hint, metadata) if not cached
+            solver_params: Optional solver parameters, part of the cache key
 
         Returns:
-            Tuple[str, bool]: (hint, was_cached)
+            Tuple[str, bool, Dict[str, Any]]: (hint, was_cached, metadata)
 
         Raises:
             HintCacheError: If there's an error with the cache operations
         """
         # Do not cache naive solver
         if solver_type == 'naive':
-            return compute_fn(), False
+            hint, metadata = compute_fn()
+            return hint, False, metadata
 
         try:
             # Try to get cached hint
-            cached = HintCache.get_cached_hint(game_state, solver_type)
+            cached = HintCache.get_cached_hint(game_state, solver_type, solver_params)
             if cached:
-                return cached.hint, True
-
-            # Compute new hint
-            hint = compute_fn()
-
-            # Cache the new hint
-            HintCache.cache_hint(game_state, hint, solver_type)
-
-            return hint, False
+                # Equivalent states can be reached by different guesses, so
+                # skip hints this particular game has already played, leaving
+                # the shared entry for the games that have not
+                if cached.hint not in game_state.get('previous_guesses', []):
+                    return cached.hint, True, cached.metadata
+                hint, metadata = compute_fn()
+                return hint, False, metadata
+
+            # Compute and cache the new hint
+            hint, metadata = compute_fn()
+            HintCache.cache_hint(game_state, hint, solver_type, solver_params, metadata)
+
+            return hint, False, metadata
 
         except Exception as e:
             raise HintCacheError(f"Failed to get or compute hint: {str(e)}")
@@ -9,8 +9,10 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 DICTIONARY_PATH = os.path.join(
     BASE_DIR, os.getenv('DICTIONARY_PATH', 'data/words.txt'))
+# Heuristic word order file; set it empty to derive the order from the dictionary
+_ordered_words_file = os.getenv('ORDERED_WORDS_PATH', 'data/ordered_words.txt')
 ORDERED_WORDS_PATH = os.path.join(
-    BASE_DIR, os.getenv('ORDERED_WORDS_PATH', 'data/ordered_words.txt'))
+    BASE_DIR, _ordered_words_file) if _ordered_words_file else None
 WORDLE_ANS_PATH = os.path.join(
     BASE_DIR, os.getenv('WORDLE_ANS_PATH', 'data/wordle_answers.txt'))
 
@@ -31,11 +33,68 @@ WORD_LENGTH = 5
 # Solver settings
 DEFAULT_SOLVER = 'greedy'
 
+# Score every dictionary word (not only remaining candidates) as a greedy guess
+GREEDY_PROBE_GUESSES = False
+
+# Greedy guesses memoized per candidate set (per worker process)
+GREEDY_MEMO_SIZE = int(os.getenv('GREEDY_MEMO_SIZE', '50000'))
+GREEDY_MEMO_BYTES = int(os.getenv('GREEDY_MEMO_BYTES', str(16 * 2**20)))
+
+# Parallel guess scoring: worker processes (0 or 1 scores serially) and the
+# smallest candidate set worth the inter-process overhead
+SCORING_WORKERS = int(os.getenv('SCORING_WORKERS', '0'))
+SCORING_PARALLEL_MIN_CANDIDATES = int(
+    os.getenv('SCORING_PARALLEL_MIN_CANDIDATES', '1000'))
+
 MCTS_SIMULATIONS = 124
 MCTS_REWARD_MULTIPLIER = 0.6393407479710643
 MCTS_EXPLORATION_CONSTANT = 0.33125383026412164
+# Root-parallel MCTS: worker processes each growing an independent tree (0 or
+# 1 searches serially), and the base of their per-worker seed schedule
+MCTS_ROOT_WORKERS = int(os.getenv('MCTS_ROOT_WORKERS', '0'))
+MCTS_ROOT_SEED = int(os.getenv('MCTS_ROOT_SEED', '0'))
+# Time-budgeted MCTS stops early once the most visited root move has kept
+# its lead, with its visit share moving at most TOLERANCE, for CHECKS checks
+# made every INTERVAL simulations
+MCTS_CONVERGENCE_INTERVAL = 50
+MCTS_CONVERGENCE_CHECKS = 3
+MCTS_CONVERGENCE_TOLERANCE = 0.01
+# Keep each game's MCTS tree between turns, re-rooted at the played move
+MCTS_REUSE_TREE = True
+# Retained MCTS trees across all sessions (per worker): trees / approximate bytes
+MCTS_TREE_CACHE_SIZE = int(os.getenv('MCTS_TREE_CACHE_SIZE', '1000'))
+MCTS_TREE_CACHE_BYTES = int(os.getenv('MCTS_TREE_CACHE_BYTES', str(64 * 2**20)))
+# Merge MCTS nodes reaching the same candidates at the same depth into one
+# node (turning the tree into a DAG)
+MCTS_TRANSPOSITIONS = True
+# Simulate MCTS targets drawn from the root's candidates and follow the
+# feedback each target gives, searching every outcome of a move (otherwise
+# targets are the top ordered words and a move keeps its first outcome)
+MCTS_OUTCOME_SEARCH = False
 
 MINIMAX_DEPTH = 2
+# Deepest iteration of a time-budgeted (iterative deepening) minimax search
+MINIMAX_MAX_ITERATIVE_DEPTH = 4
+# Break worst-case ties at minimax leaves by preferring more feedback buckets
+MINIMAX_TIE_BREAK_BUCKETS = False
+# Root-parallel minimax: worker processes (0 or 1 searches serially) and the
+# smallest root candidate set worth searching in parallel
+MINIMAX_ROOT_WORKERS = int(os.getenv('MINIMAX_ROOT_WORKERS', '0'))
+MINIMAX_PARALLEL_MIN_CANDIDATES = int(
+    os.getenv('MINIMAX_PARALLEL_MIN_CANDIDATES', '100'))
+
+# Minimax transposition table shared across turns and sessions (per worker)
+MINIMAX_TT_SIZE = int(os.getenv('MINIMAX_TT_SIZE', '200000'))
+MINIMAX_TT_BYTES = int(os.getenv('MINIMAX_TT_BYTES', str(64 * 2**20)))
+
+# Cache limits (per worker process): maximum entries and approximate bytes
+FEEDBACK_CACHE_SIZE = int(os.getenv('FEEDBACK_CACHE_SIZE', '100000'))
+FEEDBACK_CACHE_BYTES = int(os.getenv('FEEDBACK_CACHE_BYTES', str(32 * 2**20)))
+FILTER_CACHE_SIZE = int(os.getenv('FILTER_CACHE_SIZE', '10000'))
+FILTER_CACHE_BYTES = int(os.getenv('FILTER_CACHE_BYTES', str(64 * 2**20)))
+CONSISTENT_MASK_CACHE_SIZE = int(os.getenv('CONSISTENT_MASK_CACHE_SIZE', '20000'))
+CONSISTENT_MASK_CACHE_BYTES = int(
+    os.getenv('CONSISTENT_MASK_CACHE_BYTES', str(64 * 2**20)))
 
 # Random seed
 RANDOM_SEED = 42
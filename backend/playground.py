@@ -2,7 +2,7 @@
 
 Tests solvers against a list of words with no guess limit.
 Tracks if word was solved within 6 attempts, but continues until solved.
-Includes caching for GreedySolver to improve speed.
+GreedySolver memoizes its guesses per candidate set, so repeated states are fast.
 """
 import random
 import time
@@ -27,43 +27,6 @@ from wordle_game.solver_manager import SolverManager
 
 MAX_GUESSES = 15
 
-# cache for greedy
-PARTITIONS_CACHE = {}
-INFO_GAIN_CACHE = {}
-
-
-def add_caching_to_greedy():
-    """Add caching to GreedySolver methods."""
-    # save original methods
-    GreedySolver._original_partitions = GreedySolver._compute_partitions
-    GreedySolver._original_info_gain = GreedySolver._compute_expected_info_gain
-
-    # create cached version of partitions method
-    def cached_partitions(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in PARTITIONS_CACHE:
-            PARTITIONS_CACHE[key] = self._original_partitions(
-                guess, candidates)
-        return PARTITIONS_CACHE[key]
-
-    # create cached version of info gain method
-    def cached_info_gain(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in INFO_GAIN_CACHE:
-            INFO_GAIN_CACHE[key] = self._original_info_gain(guess, candidates)
-        return INFO_GAIN_CACHE[key]
-
-    # replace methods with cached versions
-    GreedySolver._compute_partitions = cached_partitions
-    GreedySolver._compute_expected_info_gain = cached_info_gain
-
-
-def remove_caching_from_greedy():
-    """Remove caching from GreedySolver methods."""
-    if hasattr(GreedySolver, '_original_partitions'):
-        GreedySolver._compute_partitions = GreedySolver._original_partitions
-        GreedySolver._compute_expected_info_gain = GreedySolver._original_info_gain
-
 
 def run_game_no_limit(solver: BaseSolver, dictionary: List[str], target_word: str):
     """Run a Wordle game with no guess limit.
@@ -123,86 +86,80 @@ def test_solver(solver_manager: SolverManager, solver_class: Type[BaseSolver], d
         solver_params: Optional parameters for the solver
         print_hard_words: Whether to print words that took many guesses
     """
-    # Add caching for GreedySolver
-    if solver_class == GreedySolver:
-        add_caching_to_greedy()
-
-    try:
-        solver = solver_manager.create_solver(
-            solver_class, dictionary, solver_params)
-        solver_name = solver.get_name()
-
-        print(f"Testing {solver_name} solver...")
-        if solver_params:
-            print("Parameters:", solver_params)
-
-        total_guesses = 0
-        wins_within_6 = 0
-        guess_counts = []
-        guess_distribution = defaultdict(int)
-        long_guess_cases = {}
-
-        start_time = time.time()
-
-        # Test each word
-        for i, word in enumerate(test_words):
-            # Show progress
-            progress = i / len(test_words) * 100
-            sys.stdout.write(f"\r{progress:.1f}% complete...")
-            sys.stdout.flush()
-
-            try:
-                win_within_6, guesses, guess_list = run_game_no_limit(
-                    solver, dictionary, word)
-                wins_within_6 += int(win_within_6)
-                total_guesses += guesses
-                guess_counts.append(guesses)
-                guess_distribution[guesses] += 1
-                if guesses > 10:
-                    long_guess_cases[word] = guess_list
-            except Exception as e:
-                print(f"\nError on word '{word}': {str(e)}")
-                continue
-
-        end_time = time.time()
-
-        win_rate = (wins_within_6 / len(test_words)) * 100
-        avg_guesses = total_guesses / len(guess_counts) if guess_counts else 0
-        median_guesses = statistics.median(guess_counts) if guess_counts else 0
-        time_taken = end_time - start_time
-
-        print("\nResults:")
-        print(f"Win rate (6 guesses or less): {win_rate:.1f}%")
-        print(f"Average guesses needed: {avg_guesses:.2f}")
-        print(f"Median guesses needed: {median_guesses}")
-        print(f"Time taken: {time_taken:.2f} seconds")
-
-        print("\nGuess Distribution:")
-        for guesses, count in sorted(guess_distribution.items()):
-            percentage = (count / len(guess_counts)) * 100
-            if guesses >= MAX_GUESSES:
-                print(f">={guesses}: {count} ({percentage:.1f}%)")
-            else:
-                print(f"{guesses}: {count} ({percentage:.1f}%)")
-
-        if print_hard_words and long_guess_cases:
-            print("\nWords that took more than 10 guesses:")
-            for word, guesses in long_guess_cases.items():
-                print(f"{word}: {guesses}")
-
-        return {
-            "solver": solver_name,
-            "win_rate": win_rate,
-            "avg_guesses": avg_guesses,
-            "median_guesses": median_guesses,
-            "time_taken": time_taken,
-            "parameters": solver_params
-        }
+    solver = solver_manager.create_solver(
+        solver_class, dictionary, solver_params)
+    solver_name = solver.get_name()
+
+    print(f"Testing {solver_name} solver...")
+    if solver_params:
+        print("Parameters:", solver_params)
 
-    finally:
-        # Remove caching for GreedySolver
-        if solver_class == GreedySolver:
-            remove_caching_from_greedy()
+    total_guesses = 0
+    wins_within_6 = 0
+    guess_counts = []
+    guess_distribution = defaultdict(int)
+    long_guess_cases = {}
+
+    start_time = time.time()
+
+    # Test each word
+    for i, word in enumerate(test_words):
+        # Show progress
+        progress = i / len(test_words) * 100
+        sys.stdout.write(f"\r{progress:.1f}% complete...")
+        sys.stdout.flush()
+
+        try:
+            win_within_6, guesses, guess_list = run_game_no_limit(
+                solver, dictionary, word)
+            wins_within_6 += int(win_within_6)
+            total_guesses += guesses
+            guess_counts.append(guesses)
+            guess_distribution[guesses] += 1
+            if guesses > 10:
+                long_guess_cases[word] = guess_list
+        except Exception as e:
+            print(f"\nError on word '{word}': {str(e)}")
+            continue
+
+    end_time = time.time()
+
+    win_rate = (wins_within_6 / len(test_words)) * 100
+    avg_guesses = total_guesses / len(guess_counts) if guess_counts else 0
+    median_guesses = statistics.median(guess_counts) if guess_counts else 0
+    time_taken = end_time - start_time
+
+    print("\nResults:")
+    print(f"Win rate (6 guesses or less): {win_rate:.1f}%")
+    print(f"Average guesses needed: {avg_guesses:.2f}")
+    print(f"Median guesses needed: {median_guesses}")
+    print(f"Time taken: {time_taken:.2f} seconds")
+    if solver_class == GreedySolver:
+        memo = GreedySolver.memo.stats()
+        print(f"Greedy memo hit rate: {memo['hit_rate']:.1%} "
+              f"({memo['hits']} hits, {memo['misses']} misses)")
+
+    print("\nGuess Distribution:")
+    for guesses, count in sorted(guess_distribution.items()):
+        percentage = (count / len(guess_counts)) * 100
+        if guesses >= MAX_GUESSES:
+            print(f">={guesses}: {count} ({percentage:.1f}%)")
+        else:
+            print(f"{guesses}: {count} ({percentage:.1f}%)")
+
+    if print_hard_words and long_guess_cases:
+        print("\nWords that took more than 10 guesses:")
+        for word, guesses in long_guess_cases.items():
+            print(f"{word}: {guesses}")
+
+    return {
+        "solver": solver_name,
+        "win_rate": win_rate,
+        "avg_guesses": avg_guesses,
+        "median_guesses": median_guesses,
+        "time_taken": time_taken,
+        "parameters": solver_params
+    }
 
 
 def main():
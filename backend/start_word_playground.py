@@ -3,7 +3,7 @@ A playground file for testing and experimenting with the code.
 
 Tests different starting words against a list of words using selected solvers.
 Tracks if word was solved within 6 attempts, but continues until solved.
-Includes caching for GreedySolver to improve speed.
+GreedySolver memoizes its guesses per candidate set, so repeated states are fast.
 """
 
 import time
@@ -26,9 +26,6 @@ from wordle_game.solver_manager import SolverManager
 
 MAX_GUESSES = 15
 
-PARTITIONS_CACHE = {}
-INFO_GAIN_CACHE = {}
-
 # Define solver parameters
 SOLVER_PARAMS = {
     NaiveSolver: None,
@@ -42,34 +39,6 @@ SOLVER_PARAMS = {
 }
 
 
-def add_caching_to_greedy():
-    """Add caching to GreedySolver methods."""
-    GreedySolver._original_partitions = GreedySolver._compute_partitions
-    GreedySolver._original_info_gain = GreedySolver._compute_expected_info_gain
-
-    def cached_partitions(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in PARTITIONS_CACHE:
-            PARTITIONS_CACHE[key] = self._original_partitions(guess, candidates)
-        return PARTITIONS_CACHE[key]
-
-    def cached_info_gain(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in INFO_GAIN_CACHE:
-            INFO_GAIN_CACHE[key] = self._original_info_gain(guess, candidates)
-        return INFO_GAIN_CACHE[key]
-
-    GreedySolver._compute_partitions = cached_partitions
-    GreedySolver._compute_expected_info_gain = cached_info_gain
-
-
-def remove_caching_from_greedy():
-    """Remove caching from GreedySolver methods."""
-    if hasattr(GreedySolver, '_original_partitions'):
-        GreedySolver._compute_partitions = GreedySolver._original_partitions
-        GreedySolver._compute_expected_info_gain = GreedySolver._original_info_gain
-
-
 def run_game_with_fixed_start(solver: BaseSolver, dictionary: List[str], target_word: str, first_guess: str):
     """Run a Wordle game starting with a fixed first guess."""
     session = AppSession(
@@ -112,72 +81,67 @@ def run_game_with_fixed_start(solver: BaseSolver, dictionary: List[str], target_
 
 def test_starting_word(solver_manager: SolverManager, solver_class: Type[BaseSolver], start_word: str, dictionary: List[str], test_words: List[str]):
     """Test a starting word with a given solver over multiple target words."""
+    solver = solver_manager.create_solver(solver_class, dictionary, SOLVER_PARAMS)
+    solver_name = solver.get_name()
+    print(f"Testing '{start_word}' with {solver_name}...")
+
+    total_guesses = 0
+    wins_within_6 = 0
+    guess_counts = []
+    guess_distribution = defaultdict(int)
+    long_guess_cases = {}
+
+    start_time = time.time()
+
+    for i, word in enumerate(test_words):
+        progress = i / len(test_words) * 100
+        sys.stdout.write(f"\r{progress:.1f}% complete...")
+        sys.stdout.flush()
+
+        try:
+            win_within_6, guesses, guess_list = run_game_with_fixed_start(
+                solver, dictionary, word, start_word
+            )
+            wins_within_6 += int(win_within_6)
+            total_guesses += guesses
+            guess_counts.append(guesses)
+            guess_distribution[guesses] += 1
+            if guesses > 10:
+                long_guess_cases[word] = guess_list
+        except Exception as e:
+            print(f"\nError on word '{word}': {str(e)}")
+            continue
+
+    end_time = time.time()
+
+    win_rate = (wins_within_6 / len(test_words)) * 100
+    avg_guesses = total_guesses / len(guess_counts) if guess_counts else 0
+    median_guesses = statistics.median(guess_counts) if guess_counts else 0
+    time_taken = end_time - start_time
+
+    print("\n\nResults:")
+    print(f"Starting Word: {start_word}")
+    print(f"Win rate (≤6): {win_rate:.1f}%")
+    print(f"Average guesses: {avg_guesses:.2f}")
+    print(f"Median guesses: {median_guesses}")
+    print(f"Time taken: {time_taken:.2f}s")
     if solver_class == GreedySolver:
-        add_caching_to_greedy()
-
-    try:
-        solver = solver_manager.create_solver(solver_class, dictionary, SOLVER_PARAMS)
-        solver_name = solver.get_name()
-        print(f"Testing '{start_word}' with {solver_name}...")
-
-        total_guesses = 0
-        wins_within_6 = 0
-        guess_counts = []
-        guess_distribution = defaultdict(int)
-        long_guess_cases = {}
-
-        start_time = time.time()
-
-        for i, word in enumerate(test_words):
-            progress = i / len(test_words) * 100
-            sys.stdout.write(f"\r{progress:.1f}% complete...")
-            sys.stdout.flush()
-
-            try:
-                win_within_6, guesses, guess_list = run_game_with_fixed_start(
-                    solver, dictionary, word, start_word
-                )
-                wins_within_6 += int(win_within_6)
-                total_guesses += guesses
-                guess_counts.append(guesses)
-                guess_distribution[guesses] += 1
-                if guesses > 10:
-                    long_guess_cases[word] = guess_list
-            except Exception as e:
-                print(f"\nError on word '{word}': {str(e)}")
-                continue
-
-        end_time = time.time()
-
-        win_rate = (wins_within_6 / len(test_words)) * 100
-        avg_guesses = total_guesses / len(guess_counts) if guess_counts else 0
-        median_guesses = statistics.median(guess_counts) if guess_counts else 0
-        time_taken = end_time - start_time
-
-        print("\n\nResults:")
-        print(f"Starting Word: {start_word}")
-        print(f"Win rate (≤6): {win_rate:.1f}%")
-        print(f"Average guesses: {avg_guesses:.2f}")
-        print(f"Median guesses: {median_guesses}")
-        print(f"Time taken: {time_taken:.2f}s")
-
-        print("Guess Distribution:")
-        for num_guesses in sorted(guess_distribution):
-            count = guess_distribution[num_guesses]
-            print(f"{num_guesses}: {count}")
-
-        return {
-            "start_word": start_word,
-            "solver": solver_name,
-            "win_rate": win_rate,
-            "avg_guesses": avg_guesses,
-            "median_guesses": median_guesses,
-            "time_taken": time_taken
-        }
-
-    finally:
-        if solver_class == GreedySolver:
-            remove_caching_from_greedy()
+        memo = GreedySolver.memo.stats()
+        print(f"Greedy memo hit rate: {memo['hit_rate']:.1%}")
+
+    print("Guess Distribution:")
+    for num_guesses in sorted(guess_distribution):
+        count = guess_distribution[num_guesses]
+        print(f"{num_guesses}: {count}")
+
+    return {
+        "start_word": start_word,
+        "solver": solver_name,
+        "win_rate": win_rate,
+        "avg_guesses": avg_guesses,
+        "median_guesses": median_guesses,
+        "time_taken": time_taken
+    }
 
 
 def main():
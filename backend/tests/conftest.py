@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# The backend is run from its own directory (`import config`), not installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from wordle_game.dictionary import load_dictionary  # noqa: E402
+from wordle_game.feedback_matrix import get_feedback_matrix  # noqa: E402
+# solver_manager and the solver package import each other; load the package first
+import wordle_game.solver  # noqa: E402,F401
+from wordle_game.solver_manager import SolverManager  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def dictionary():
+    return load_dictionary(config.DICTIONARY_PATH)
+
+
+@pytest.fixture(scope='session')
+def feedback_matrix(dictionary):
+    return get_feedback_matrix(dictionary)
+
+
+@pytest.fixture(scope='session')
+def ordered_words(dictionary):
+    return SolverManager(dictionary).ordered_words
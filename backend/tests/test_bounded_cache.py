@@ -0,0 +1,108 @@
+import threading
+
+from wordle_game.bounded_cache import BoundedCache, bounded_cache, cache_stats, get_cache
+
+
+def fixed_size(obj):
+    """Every key and value counts 10 bytes, so an entry is 20."""
+    return 10
+
+
+def test_evicts_least_recently_used_beyond_entry_limit():
+    cache = BoundedCache('test_entries', max_entries=2, max_bytes=1000, sizeof=fixed_size)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'a' is now the most recently used
+    cache.put('c', 3)
+
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.stats()['evictions'] == 1
+    assert len(cache) == 2
+
+
+def test_evicts_to_fit_byte_limit():
+    cache = BoundedCache('test_bytes', max_entries=100, max_bytes=50, sizeof=fixed_size)
+    for key in 'abc':
+        cache.put(key, key)
+
+    assert len(cache) == 2 and cache.current_bytes == 40
+    assert 'a' not in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_skips_entries_larger_than_the_budget_and_disabled_caches():
+    cache = BoundedCache('test_oversized', max_entries=10, max_bytes=15, sizeof=fixed_size)
+    cache.put('a', 1)
+    assert len(cache) == 0 and cache.current_bytes == 0
+
+    disabled = BoundedCache('test_disabled', max_entries=0, max_bytes=1000, sizeof=fixed_size)
+    disabled.put('a', 1)
+    assert disabled.get('a') is None
+
+
+def test_replacing_a_key_keeps_byte_count_exact():
+    cache = BoundedCache('test_replace', max_entries=10, max_bytes=1000, sizeof=fixed_size)
+    cache.put('a', 1)
+    cache.put('a', 2)
+    assert cache.get('a') == 2 and cache.current_bytes == 20
+
+    assert cache.pop('a') == 2 and cache.current_bytes == 0
+    assert cache.pop('a', 'gone') == 'gone'
+
+
+def test_counts_hits_and_misses():
+    cache = BoundedCache('test_counters', max_entries=10, max_bytes=1000)
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('b')
+    cache.pop('a')
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+    assert get_cache('test_counters') is cache
+    assert cache_stats()['test_counters'] == stats
+
+
+def test_clear_keeps_counters():
+    cache = BoundedCache('test_clear', max_entries=10, max_bytes=1000)
+    cache.put('a', 1)
+    cache.get('a')
+    cache.clear()
+    assert len(cache) == 0 and cache.current_bytes == 0
+    assert cache.stats()['hits'] == 1
+
+
+def test_decorator_memoizes_calls():
+    calls = []
+
+    @bounded_cache('test_decorator', max_entries=10, max_bytes=10_000)
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+
+    assert square(3) == 9 and square(3) == 9
+    assert square(3, offset=1) == 10
+    assert calls == [3, 3]
+    assert square.cache.stats()['hits'] == 1
+
+    square.cache_clear()
+    square(3)
+    assert calls == [3, 3, 3]
+
+
+def test_concurrent_puts_stay_within_limits():
+    cache = BoundedCache('test_threads', max_entries=50, max_bytes=1000, sizeof=fixed_size)
+
+    def fill(start):
+        for i in range(start, start + 500):
+            cache.put(i, i)
+            cache.get(i - 1)
+
+    threads = [threading.Thread(target=fill, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) <= 50 and cache.current_bytes <= 1000
+    assert cache.current_bytes == 20 * len(cache)
@@ -0,0 +1,73 @@
+import random
+import sys
+
+import numpy as np
+import pytest
+
+from wordle_game.candidate_set import CandidateSet
+
+
+@pytest.fixture
+def word_sets(dictionary):
+    rng = random.Random(0)
+    return rng.sample(dictionary, 800), rng.sample(dictionary, 800)
+
+
+def test_constructors_agree(dictionary, feedback_matrix):
+    words = random.Random(1).sample(dictionary, 500)
+    ids = feedback_matrix.ids_of(words)
+    mask = np.zeros(len(feedback_matrix), dtype=bool)
+    mask[ids] = True
+
+    from_words = CandidateSet.from_words(feedback_matrix, words)
+    assert CandidateSet.from_ids(feedback_matrix, ids) == from_words
+    assert CandidateSet.from_mask(feedback_matrix, mask) == from_words
+    assert CandidateSet.from_words(feedback_matrix, from_words) is from_words
+    assert from_words.ids().tolist() == sorted(ids.tolist())
+    assert from_words.words() == sorted(words, key=feedback_matrix.id_of)
+    assert list(from_words) == from_words.words()
+    assert len(CandidateSet.full(feedback_matrix)) == len(dictionary)
+
+
+def test_set_operations_match_python_sets(feedback_matrix, word_sets):
+    first, second = word_sets
+    a = CandidateSet.from_words(feedback_matrix, first)
+    b = CandidateSet.from_words(feedback_matrix, second)
+
+    assert set((a & b).words()) == set(first) & set(second)
+    assert set((a - b).words()) == set(first) - set(second)
+    assert len(a & b) == len(set(first) & set(second))
+    assert not CandidateSet.from_words(feedback_matrix, []) and a
+
+
+def test_membership_by_word_and_id(feedback_matrix, word_sets):
+    first, second = word_sets
+    a = CandidateSet.from_words(feedback_matrix, first)
+    outside = next(word for word in second if word not in set(first))
+
+    assert first[0] in a and feedback_matrix.id_of(first[0]) in a
+    assert outside not in a and feedback_matrix.id_of(outside) not in a
+    assert 'zzzzz' not in a
+
+
+def test_equal_sets_share_fingerprint_and_hash(feedback_matrix, word_sets):
+    first, second = word_sets
+    a = CandidateSet.from_words(feedback_matrix, first)
+    shuffled = CandidateSet.from_words(feedback_matrix, list(reversed(first)))
+    b = CandidateSet.from_words(feedback_matrix, second)
+
+    assert a == shuffled and hash(a) == hash(shuffled)
+    assert a.fingerprint == shuffled.fingerprint
+    assert len(a.fingerprint) == 32
+    assert a != b and a.fingerprint != b.fingerprint
+    # dropping a single word changes the fingerprint
+    assert (a - CandidateSet.from_words(feedback_matrix, first[:1])).fingerprint \
+        != a.fingerprint
+
+
+def test_reported_size_covers_member_ids(feedback_matrix, word_sets):
+    a = CandidateSet.from_words(feedback_matrix, word_sets[0])
+    before = sys.getsizeof(a)
+    assert before >= a.ids().nbytes + sys.getsizeof(a.bits)
+    # building the ids does not grow past the size already reported
+    assert sys.getsizeof(a) <= before
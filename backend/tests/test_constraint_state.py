@@ -0,0 +1,46 @@
+import itertools
+import random
+
+from wordle_game.constraint_state import ConstraintState
+from wordle_game.feedback import compute_feedback, decode_pattern, encode_feedback
+
+
+def random_history(dictionary, rng):
+    """Feedback for two to four random guesses against a random target."""
+    target = rng.choice(dictionary)
+    return [(guess, encode_feedback(compute_feedback(guess, target)))
+            for guess in rng.sample(dictionary, rng.randint(2, 4))]
+
+
+def test_matches_agrees_with_feedback(dictionary):
+    rng = random.Random(4)
+    words = rng.sample(dictionary, 1500)
+    for _ in range(40):
+        history = random_history(dictionary, rng)
+        state = ConstraintState.from_history(history)
+        for word in words:
+            consistent = all(compute_feedback(guess, word) == decode_pattern(pattern)
+                             for guess, pattern in history)
+            assert state.matches(word) == consistent, (history, word)
+
+
+def test_key_ignores_guess_order(dictionary):
+    rng = random.Random(5)
+    for _ in range(40):
+        history = random_history(dictionary, rng)
+        states = {ConstraintState.from_history(list(order))
+                  for order in itertools.permutations(history)}
+        assert len(states) == 1
+        assert len({state.key() for state in states}) == 1
+
+
+def test_repeated_feedback_adds_nothing():
+    # a gray repeat of a green 'e' caps 'e' at one occurrence
+    speed = ('speed', encode_feedback((0, 0, 2, 0, 0)))
+    state = ConstraintState.from_history([speed])
+    assert state.merge(*speed) == state
+    assert state.matches('fleck') and not state.matches('fleet')
+
+    belly = state.merge('belly', encode_feedback((0, 2, 0, 0, 0)))
+    assert belly != state and belly.key() != state.key()
+    assert ConstraintState.empty().key() != state.key()
@@ -0,0 +1,107 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import (PATTERN_COUNT, compute_feedback, compute_feedback_batch,
+                                  decode_pattern, encode_feedback, encode_words,
+                                  filter_candidates)
+
+# Words with repeated letters exercise the green-before-yellow letter accounting
+REPEATED_LETTER_WORDS = ['speed', 'geese', 'eerie', 'mamma', 'llama', 'sassy', 'essay',
+                         'skims', 'pipit', 'abide', 'erase', 'amass', 'hello']
+
+
+def legacy_filter(candidates, guess, feedback):
+    """The list-based filter_candidates the feedback matrix replaced.
+
+    It is exact for guesses with distinct letters, but can keep words that a
+    gray repeat of a yellow or green letter rules out.
+    """
+    gray_letters = {guess[i] for i, code in enumerate(feedback) if code == 0}
+    for i, code in enumerate(feedback):
+        if code > 0 and guess[i] in gray_letters:
+            gray_letters.remove(guess[i])
+    filtered = [word for word in candidates if word != guess and not any(
+        letter in gray_letters for letter in word)]
+    return [word for word in filtered if legacy_matches(word, guess, feedback)]
+
+
+def legacy_matches(word, guess, feedback):
+    for i, (letter, code) in enumerate(zip(guess, feedback)):
+        if code == 2 and word[i] != letter:
+            return False
+
+    word_chars = Counter(word)
+    guess_chars = Counter()
+    for letter, code in zip(guess, feedback):
+        if code == 2:
+            word_chars[letter] -= 1
+            if word_chars[letter] == 0:
+                del word_chars[letter]
+
+    for i, (letter, code) in enumerate(zip(guess, feedback)):
+        if code == 1:
+            guess_chars[letter] += 1
+            if letter not in word_chars or word_chars[letter] < guess_chars[letter]:
+                return False
+            if word[i] == letter:
+                return False
+        elif code == 0:
+            if letter in word_chars and word_chars[letter] > guess_chars[letter]:
+                return False
+    return True
+
+
+def test_pattern_codes_round_trip():
+    for pattern in range(PATTERN_COUNT):
+        assert encode_feedback(decode_pattern(pattern)) == pattern
+    assert encode_feedback((2, 2, 2, 2, 2)) == PATTERN_COUNT - 1
+
+
+@pytest.mark.parametrize('distinct_letters', [False, True])
+def test_filter_candidates_matches_list_filter(dictionary, feedback_matrix, distinct_letters):
+    rng = random.Random(2)
+    guesses = [word for word in dictionary if len(set(word)) == len(word)] \
+        if distinct_letters else dictionary
+    for _ in range(200):
+        candidates = rng.sample(dictionary, 1000)
+        guess = rng.choice(guesses)
+        feedback = compute_feedback(guess, rng.choice(candidates))
+
+        filtered = filter_candidates(
+            CandidateSet.from_words(feedback_matrix, candidates), guess,
+            encode_feedback(feedback))
+        expected = [word for word in candidates
+                    if word != guess and compute_feedback(guess, word) == feedback]
+        assert sorted(filtered.words()) == sorted(expected)
+        if distinct_letters:
+            assert sorted(filtered.words()) == sorted(legacy_filter(candidates, guess, feedback))
+
+
+def test_filter_candidates_excludes_solved_guess(feedback_matrix):
+    candidates = CandidateSet.from_words(feedback_matrix, ['crane', 'crate', 'grate'])
+    assert filter_candidates(candidates, 'crane', PATTERN_COUNT - 1).words() == []
+
+
+def test_compute_feedback_batch_defaults_to_the_configured_dictionary(dictionary):
+    rng = random.Random(3)
+    repeated = [word for word in REPEATED_LETTER_WORDS if word in dictionary]
+    guesses = rng.sample(dictionary, 40) + repeated
+    answers = rng.sample(dictionary, 300) + repeated
+    index = {word: i for i, word in enumerate(dictionary)}
+    codes = compute_feedback_batch([index[word] for word in guesses],
+                                   [index[word] for word in answers])
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [[encode_feedback(compute_feedback(guess, answer))
+                               for answer in answers] for guess in guesses]
+
+
+def test_compute_feedback_batch_over_custom_words():
+    ids = np.arange(len(REPEATED_LETTER_WORDS))
+    codes = compute_feedback_batch(ids, ids, encode_words(REPEATED_LETTER_WORDS))
+    assert codes.tolist() == [[encode_feedback(compute_feedback(guess, answer))
+                               for answer in REPEATED_LETTER_WORDS]
+                              for guess in REPEATED_LETTER_WORDS]
@@ -0,0 +1,51 @@
+import random
+
+import numpy as np
+import pytest
+
+import config
+from wordle_game.feedback import PATTERN_COUNT, compute_feedback, encode_feedback
+from wordle_game.feedback_matrix import (FeedbackMatrixArtifactError, dictionary_digest,
+                                         load_word_source, word_source)
+
+# Guesses with repeated letters exercise the green-before-yellow letter accounting
+REPEATED_LETTER_PAIRS = [
+    ('speed', 'abide'), ('speed', 'erase'), ('geese', 'eerie'), ('mamma', 'amass'),
+    ('llama', 'hello'), ('skims', 'tushy'), ('pipit', 'trigs'), ('sassy', 'essay'),
+]
+
+
+def test_matrix_matches_compute_feedback(dictionary, feedback_matrix):
+    rng = random.Random(0)
+    pairs = [(rng.choice(dictionary), rng.choice(dictionary)) for _ in range(5000)]
+    pairs += [pair for pair in REPEATED_LETTER_PAIRS if all(
+        word in feedback_matrix.word_ids for word in pair)]
+    for guess, answer in pairs:
+        expected = encode_feedback(compute_feedback(guess, answer))
+        assert feedback_matrix.pattern(feedback_matrix.id_of(guess),
+                                       feedback_matrix.id_of(answer)) == expected, (guess, answer)
+
+
+def test_matrix_rows_match_compute_feedback(dictionary, feedback_matrix):
+    rng = random.Random(1)
+    answers = rng.sample(dictionary, 500)
+    answer_ids = feedback_matrix.ids_of(answers)
+    for guess in rng.sample(dictionary, 20):
+        expected = [encode_feedback(compute_feedback(guess, answer)) for answer in answers]
+        row = feedback_matrix.row(feedback_matrix.id_of(guess), answer_ids)
+        assert row.tolist() == expected
+        assert feedback_matrix.partition_sizes(feedback_matrix.id_of(guess), answer_ids).tolist() \
+            == np.bincount(expected, minlength=PATTERN_COUNT).tolist()
+
+
+def test_workers_load_words_from_their_source(dictionary, tmp_path):
+    digest = dictionary_digest(dictionary)
+    assert word_source(dictionary, config.DICTIONARY_PATH) == config.DICTIONARY_PATH
+    assert load_word_source(config.DICTIONARY_PATH, digest) == dictionary
+
+    custom = dictionary[:100]
+    assert word_source(custom, config.DICTIONARY_PATH) == custom
+    assert word_source(custom, str(tmp_path / 'missing.txt')) == custom
+    assert load_word_source(custom, dictionary_digest(custom)) == custom
+    with pytest.raises(FeedbackMatrixArtifactError):
+        load_word_source(config.DICTIONARY_PATH, dictionary_digest(custom))
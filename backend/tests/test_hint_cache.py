@@ -0,0 +1,109 @@
+import pytest
+
+from cache_service import hint_cache
+from cache_service.hint_cache import HintCache
+
+
+class FakeQuery:
+    def __init__(self, table):
+        self.table = table
+        self.filters = {}
+        self.row = None
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def limit(self, count):
+        return self
+
+    def upsert(self, row, on_conflict):
+        self.row = row
+        return self
+
+    def execute(self):
+        if self.row is not None:
+            key = (self.row['game_state_hash'], self.row['solver_type'])
+            self.table.rows[key] = dict(self.row)
+            self.table.upserts += 1
+            return self
+        key = (self.filters['game_state_hash'], self.filters['solver_type'])
+        self.data = [self.table.rows[key]] if key in self.table.rows else []
+        return self
+
+
+class FakeTable:
+    def __init__(self):
+        self.rows = {}
+        self.upserts = 0
+
+
+class FakeClient:
+    def __init__(self):
+        self.hint_cache = FakeTable()
+
+    def table(self, name):
+        return FakeQuery(getattr(self, name))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(hint_cache, 'get_supabase_client', lambda: fake)
+    return fake
+
+
+def state(previous_guesses=()):
+    return {'constraint_key': '..e..|ab,,,,|e1|', 'previous_guesses': list(previous_guesses)}
+
+
+def computes(hint, metadata=None):
+    calls = []
+
+    def compute():
+        calls.append(hint)
+        return hint, dict(metadata or {})
+    return compute, calls
+
+
+def test_hit_returns_the_stored_metadata(client):
+    compute, calls = computes('crane', {'playouts': 500})
+    assert HintCache.get_or_compute_hint(state(), 'mcts', compute) == \
+        ('crane', False, {'playouts': 500})
+    assert HintCache.get_or_compute_hint(state(), 'mcts', compute) == \
+        ('crane', True, {'playouts': 500})
+    assert calls == ['crane']
+
+
+def test_solver_params_are_part_of_the_key(client):
+    default, _ = computes('crane')
+    tuned, calls = computes('slate')
+    HintCache.get_or_compute_hint(state(), 'mcts', default)
+
+    params = {'simulations': 50, 'exploration': 2.0}
+    assert HintCache.get_or_compute_hint(state(), 'mcts', tuned, params)[:2] == ('slate', False)
+    reordered = {'exploration': 2.0, 'simulations': 50}
+    assert HintCache.get_or_compute_hint(state(), 'mcts', tuned, reordered)[:2] == ('slate', True)
+    assert HintCache.get_or_compute_hint(state(), 'mcts', default)[:2] == ('crane', True)
+    assert calls == ['slate'] and len(client.hint_cache.rows) == 2
+
+
+def test_played_hint_is_recomputed_without_overwriting(client):
+    first, _ = computes('crane')
+    HintCache.get_or_compute_hint(state(), 'greedy', first)
+
+    replacement, calls = computes('slate')
+    assert HintCache.get_or_compute_hint(state(['crane']), 'greedy', replacement) == \
+        ('slate', False, {})
+    assert calls == ['slate'] and client.hint_cache.upserts == 1
+    assert HintCache.get_or_compute_hint(state(), 'greedy', replacement)[:2] == ('crane', True)
+
+
+def test_naive_hints_are_not_cached(client):
+    compute, calls = computes('crane')
+    HintCache.get_or_compute_hint(state(), 'naive', compute)
+    HintCache.get_or_compute_hint(state(), 'naive', compute)
+    assert calls == ['crane', 'crane'] and not client.hint_cache.rows
@@ -0,0 +1,105 @@
+import json
+import random
+
+import pytest
+
+import config
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import decode_pattern, filter_candidates
+from wordle_game.letter_index import get_letter_index
+from wordle_game.wordle_game import WordleGame
+
+
+def random_histories(dictionary, count, seed):
+    """Histories of games played with random guesses against random targets."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = WordleGame(dictionary, target_word=rng.choice(dictionary))
+        for _ in range(rng.randint(1, 4)):
+            remaining = game.get_remaining_candidates()
+            # mix in-candidate and arbitrary guesses, as players do
+            guess = rng.choice(remaining if remaining and rng.random() < 0.5 else dictionary)
+            if guess in game.previous_guesses:
+                continue
+            game.submit_guess(guess)
+            if game.is_game_over():
+                break
+        yield game
+
+
+@pytest.fixture(scope='module')
+def index(feedback_matrix):
+    return get_letter_index(feedback_matrix)
+
+
+def test_lookups_match_a_dictionary_scan(dictionary, index):
+    assert set(index.with_letter_at('s', 0).words()) == {w for w in dictionary if w[0] == 's'}
+    assert set(index.without_letter_at('e', 4).words()) == {w for w in dictionary if w[4] != 'e'}
+    assert set(index.with_letter_count_at_least('e', 2).words()) == \
+        {w for w in dictionary if w.count('e') >= 2}
+    assert set(index.with_letter_count_at_most('o', 1).words()) == \
+        {w for w in dictionary if w.count('o') <= 1}
+    assert set(index.without_letter('a').words()) == {w for w in dictionary if 'a' not in w}
+
+
+def test_query_matches_filter_candidates(dictionary, feedback_matrix, index):
+    everything = CandidateSet.full(feedback_matrix)
+    for game in random_histories(dictionary, 150, seed=0):
+        expected = everything
+        for guess, pattern in game.history:
+            expected = filter_candidates(expected, guess, pattern)
+        assert index.query(game.history) == expected, game.history
+
+
+def test_from_history_restores_the_played_game(dictionary):
+    for game in random_histories(dictionary, 50, seed=1):
+        restored = WordleGame.from_history(dictionary, game.history)
+        assert restored.candidate_words == game.candidate_words
+        state, expected = restored.get_game_state(), game.get_game_state()
+        assert set(state.pop('previous_guesses')) == set(expected.pop('previous_guesses'))
+        assert state == expected
+        if restored.candidate_words:
+            assert restored.target_word in restored.candidate_words
+
+
+@pytest.fixture(scope='module')
+def client():
+    from cache_service import hint_cache
+    from cache_service.supabase_client import SupabaseConnectionError
+    from web_interface.app import app
+
+    def unavailable():
+        raise SupabaseConnectionError('no cache in tests')
+
+    patch = pytest.MonkeyPatch()
+    patch.setattr(hint_cache, 'get_supabase_client', unavailable)
+    yield app.test_client()
+    patch.undo()
+
+
+def test_hint_for_a_game_without_a_session(dictionary, client):
+    game = WordleGame(dictionary, target_word='pious')
+    game.submit_guess('tares')
+    game.submit_guess('lingo')
+    history = [[guess, list(decode_pattern(pattern))] for guess, pattern in game.history]
+
+    response = client.get('/hint', query_string={
+        'game_id': 'unknown', 'solver': 'greedy', 'history': json.dumps(history)})
+    assert response.status_code == 200
+    assert response.get_json()['hint'] in game.get_remaining_candidates()
+
+
+@pytest.mark.parametrize('history', [
+    [['zzzzz', [0] * config.WORD_LENGTH]],
+    [['tares', [0, 1, 3, 0, 0]]],
+    [['tares', [0, 1]]],
+    {'tares': [0] * config.WORD_LENGTH},
+])
+def test_hint_rejects_invalid_history(client, history):
+    response = client.get('/hint', query_string={
+        'game_id': 'unknown', 'history': json.dumps(history)})
+    assert response.status_code == 400
+
+
+def test_hint_without_session_or_history_is_not_found(client):
+    assert client.get('/hint', query_string={'game_id': 'unknown'}).status_code == 404
@@ -0,0 +1,198 @@
+import random
+import time
+
+import pytest
+
+import config
+from wordle_game.bounded_cache import get_cache
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import compute_feedback, encode_feedback, filter_candidates
+from wordle_game.solver import MCTSSolver
+from wordle_game.solver.mcts_tree import ROOT
+from wordle_game.word_order import get_word_order
+from wordle_game.wordle_game import WordleGame
+
+
+def second_turn_candidates(feedback_matrix, target, opener='tares'):
+    pattern = encode_feedback(compute_feedback(opener, target))
+    return filter_candidates(CandidateSet.full(feedback_matrix), opener, pattern).words()
+
+
+def game_playout(solver, candidates, target, guesses_made):
+    """Reward of a playout played out in a WordleGame, as rollouts once were."""
+    if not candidates:
+        return 0.0
+    game = WordleGame(solver.dictionary, config.MAX_GUESSES - guesses_made, target)
+    game.candidate_words = candidates
+    while not game.is_game_over():
+        guess = next((word for word in solver.ordered_words
+                      if word in game.candidate_words), None)
+        if guess is None:
+            return -1 * solver.reward_multiplier
+        game.submit_guess(guess)
+    won = (1 - game.guess_count / game.max_guesses) if game.game_won else 0
+    return won * solver.reward_multiplier
+
+
+@pytest.fixture
+def retained_trees():
+    cache = get_cache('mcts_trees')
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def searched_outcome(tree):
+    """A (guess id, pattern, child) the search expanded below the root."""
+    for action in tree.actions(ROOT):
+        for edge in tree.edges(action):
+            child = tree.edge_child[edge]
+            if len(tree.candidates(child)) > 1:
+                return tree.action_guess[action], tree.edge_pattern[edge], child
+    raise AssertionError('no outcome with several candidates was searched')
+
+
+def test_observed_feedback_reroots_the_retained_tree(dictionary, feedback_matrix,
+                                                     ordered_words, retained_trees):
+    solver = MCTSSolver(dictionary, ordered_words, simulations=300, root_workers=0)
+    random.seed(0)
+    solver.select_guess(second_turn_candidates(feedback_matrix, 'pious'))
+    tree = retained_trees.get(solver._tree_key)
+    guess_id, pattern, child = searched_outcome(tree)
+    remaining, carried = tree.candidates(child), tree.visits[child]
+
+    before = MCTSSolver.reuse_stats()
+    solver.observe_feedback(feedback_matrix.words[guess_id], pattern)
+    rerooted = retained_trees.get(solver._tree_key)
+    assert rerooted.candidates(ROOT) == remaining
+    assert rerooted.visits[ROOT] == carried
+
+    # the next search continues from the carried simulations
+    solver.select_guess(remaining.words())
+    after = MCTSSolver.reuse_stats()
+    assert after['reroots'] == before['reroots'] + 1
+    assert after['simulations_reused'] == before['simulations_reused'] + carried
+    assert solver.playouts == 300
+    assert retained_trees.get(solver._tree_key).visits[ROOT] == carried + 300
+
+
+def test_unsearched_feedback_drops_the_retained_tree(dictionary, feedback_matrix,
+                                                     ordered_words, retained_trees):
+    solver = MCTSSolver(dictionary, ordered_words, simulations=100, root_workers=0)
+    solver.select_guess(second_turn_candidates(feedback_matrix, 'crane'))
+
+    before = MCTSSolver.reuse_stats()
+    # a word outside the dictionary cannot match a searched move
+    solver.observe_feedback('zzzzz', 0)
+    assert solver._tree_key not in retained_trees
+    assert MCTSSolver.reuse_stats()['reroot_misses'] == before['reroot_misses'] + 1
+
+
+
+@pytest.mark.parametrize('outcome_search', [False, True])
+def test_outcome_search_follows_each_targets_feedback(dictionary, feedback_matrix,
+                                                      ordered_words, outcome_search):
+    solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                        outcome_search=outcome_search)
+    candidates = CandidateSet.from_words(
+        feedback_matrix, second_turn_candidates(feedback_matrix, 'crane'))
+    tree = solver._new_tree(candidates)
+    solver._run_simulations(tree, 400, random.Random(0))
+
+    outcomes = [len(list(tree.edges(action))) for action in tree.actions(ROOT)]
+    assert sum(tree.action_visits[action] for action in tree.actions(ROOT)) == 400
+    if outcome_search:
+        assert max(outcomes) > 1
+        # every outcome is one a root candidate can give
+        for action in tree.actions(ROOT):
+            patterns = set(feedback_matrix.row(tree.action_guess[action],
+                                               candidates.ids()).tolist())
+            assert {tree.edge_pattern[edge] for edge in tree.edges(action)} <= patterns
+    else:
+        assert max(outcomes) == 1
+    assert solver.settings()['outcome_search'] is outcome_search
+
+
+def test_playouts_score_like_a_played_game(dictionary, feedback_matrix, ordered_words):
+    solver = MCTSSolver(dictionary, ordered_words, reward_multiplier=3.0,
+                        reuse_tree=False, root_workers=0)
+    rng = random.Random(2)
+    everything = CandidateSet.full(feedback_matrix)
+    for _ in range(60):
+        # a state some guesses in, and a target that may have been ruled out
+        candidates = everything
+        for _ in range(rng.randint(0, 2)):
+            guess, answer = rng.choice(dictionary), rng.choice(dictionary)
+            candidates = filter_candidates(
+                candidates, guess, feedback_matrix.pattern(
+                    feedback_matrix.id_of(guess), feedback_matrix.id_of(answer)))
+        target = rng.choice(candidates.words() or dictionary) \
+            if rng.random() < 0.8 else rng.choice(dictionary)
+        guesses_made = rng.randint(0, 4)
+        assert solver._simulate(candidates, target, guesses_made) == \
+            game_playout(solver, candidates, target, guesses_made), (target, guesses_made)
+
+    assert solver._simulate(CandidateSet.from_words(feedback_matrix, []), 'crane') == 0.0
+
+
+@pytest.mark.parametrize('order_file', [True, False])
+def test_root_parallel_workers_load_the_word_order(dictionary, feedback_matrix, ordered_words,
+                                                   monkeypatch, order_file):
+    if not order_file:
+        # workers rebuild the dictionary's generated order instead
+        monkeypatch.setattr(config, 'ORDERED_WORDS_PATH', None)
+        ordered_words = get_word_order(feedback_matrix)
+    candidates = second_turn_candidates(feedback_matrix, 'crane')
+    guesses = []
+    for _ in range(2):
+        solver = MCTSSolver(dictionary, ordered_words, simulations=200, root_workers=2)
+        guesses.append(solver.select_guess(candidates))
+        assert solver.playouts == 200
+    solver.root_parallel.shutdown()
+
+    assert guesses[0] == guesses[1] and guesses[0] in dictionary
+
+
+def test_time_budget_stops_at_the_deadline(dictionary, feedback_matrix, ordered_words):
+    candidates = second_turn_candidates(feedback_matrix, 'pious')
+    solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                        time_budget=0.1)
+    playout = solver._playout
+
+    def slow_playout(tree, target_word):
+        time.sleep(0.005)
+        playout(tree, target_word)
+
+    # too few simulations fit in the budget for the best move to converge
+    solver._playout = slow_playout
+    start = time.perf_counter()
+    guess = solver.select_guess(candidates)
+    assert time.perf_counter() - start < 0.1 + 0.05
+    assert 0 < solver.search_info()['playouts'] < config.MCTS_CONVERGENCE_INTERVAL
+    assert guess in dictionary
+
+    solver.time_budget = 0
+    assert solver.select_guess(candidates) == candidates[0]
+    assert solver.search_info()['playouts'] == 0
+
+
+def test_time_budget_stops_once_the_best_move_converges(dictionary, feedback_matrix,
+                                                        ordered_words):
+    candidates = second_turn_candidates(feedback_matrix, 'crane')
+    solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                        time_budget=30)
+    start = time.perf_counter()
+    random.seed(0)
+    solver.select_guess(candidates)
+    assert time.perf_counter() - start < 5
+
+    playouts = solver.search_info()['playouts']
+    interval = config.MCTS_CONVERGENCE_INTERVAL
+    assert playouts % interval == 0
+    assert playouts >= interval * (config.MCTS_CONVERGENCE_CHECKS + 1)
+
+    # a fixed simulation count runs in full
+    fixed = MCTSSolver(dictionary, ordered_words, simulations=playouts + 7, reuse_tree=False,
+                       root_workers=0)
+    fixed.select_guess(candidates)
+    assert fixed.search_info()['playouts'] == playouts + 7
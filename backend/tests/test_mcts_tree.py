@@ -0,0 +1,171 @@
+import gc
+import random
+import tracemalloc
+
+import pytest
+
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import compute_feedback, encode_feedback, filter_candidates
+from wordle_game.solver import MCTSSolver
+from wordle_game.solver.mcts_tree import ROOT
+
+
+def grown_tree(solver, feedback_matrix, target, simulations, opener='tares'):
+    pattern = encode_feedback(compute_feedback(opener, target))
+    candidates = filter_candidates(CandidateSet.full(feedback_matrix), opener, pattern)
+    tree = solver._new_tree(candidates)
+    solver._run_simulations(tree, simulations, random.Random(0))
+    return tree
+
+
+def assert_same_subtree(tree, node, copy, root):
+    """Walk both trees from `node` and `root` and compare everything reachable."""
+    copies = {node: root}
+    queue = [node]
+    while queue:
+        old = queue.pop(0)
+        new = copies[old]
+        assert copy.candidates(new) == tree.candidates(old)
+        assert (copy.visits[new], copy.value[new]) == (tree.visits[old], tree.value[old])
+        assert copy.depth[new] == tree.depth[old] - tree.depth[node]
+        assert copy.has_untried(new) == tree.has_untried(old)
+        if tree.has_untried(old):
+            assert copy.next_move(new) == tree.next_move(old)
+
+        actions, new_actions = list(tree.actions(old)), list(copy.actions(new))
+        assert [tree.action_guess[a] for a in actions] == \
+            [copy.action_guess[a] for a in new_actions]
+        for action, new_action in zip(actions, new_actions):
+            assert copy.action_visits[new_action] == tree.action_visits[action]
+            assert copy.action_value[new_action] == tree.action_value[action]
+            edges, new_edges = list(tree.edges(action)), list(copy.edges(new_action))
+            assert [tree.edge_pattern[e] for e in edges] == \
+                [copy.edge_pattern[e] for e in new_edges]
+            for edge, new_edge in zip(edges, new_edges):
+                assert copy.edge_visits[new_edge] == tree.edge_visits[edge]
+                child, new_child = tree.edge_child[edge], copy.edge_child[new_edge]
+                if child in copies:
+                    # a shared node is copied once and stays shared
+                    assert copies[child] == new_child
+                else:
+                    copies[child] = new_child
+                    queue.append(child)
+    return len(copies)
+
+
+@pytest.mark.parametrize('transpositions', [False, True])
+def test_subtree_keeps_statistics_and_order(dictionary, feedback_matrix, ordered_words,
+                                            transpositions):
+    solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                        transpositions=transpositions, outcome_search=True)
+    tree = grown_tree(solver, feedback_matrix, 'crane', 2000)
+    action = max(tree.actions(ROOT), key=lambda action: tree.action_visits[action])
+    node = tree.edge_child[max(tree.edges(action), key=lambda edge: tree.edge_visits[edge])]
+
+    copy = tree.subtree(node)
+    assert len(copy) < len(tree)
+    assert assert_same_subtree(tree, node, copy, ROOT) == len(copy)
+
+    # the copy can be searched further without touching the original
+    visits = tree.visits[node]
+    solver._run_simulations(copy, 100, random.Random(1))
+    assert copy.visits[ROOT] == visits + 100 and tree.visits[node] == visits
+
+
+@pytest.mark.parametrize('transpositions', [False, True])
+def test_nbytes_tracks_allocated_memory(dictionary, feedback_matrix, ordered_words,
+                                        transpositions):
+    solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                        transpositions=transpositions)
+    # warm the shared feedback caches so only the tree is measured
+    grown_tree(solver, feedback_matrix, 'boxer', 2000)
+    gc.collect()
+
+    tracemalloc.start()
+    tree = grown_tree(solver, feedback_matrix, 'boxer', 2000)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert 0.8 * held <= tree.nbytes() <= 1.25 * held
+
+    # retained trees are sized by nbytes, and a subtree holds less
+    action = next(tree.actions(ROOT))
+    assert tree.subtree(tree.edge_child[tree.first_edge[action]]).nbytes() < tree.nbytes()
+
+
+def two_orders(tree, feedback_matrix, first, second, target):
+    """Expand `first` then `second` and the reverse from the root, as `target`
+    would answer them, and return the two paths of edges."""
+    paths = []
+    for guesses in ((first, second), (second, first)):
+        node, path = ROOT, []
+        for guess in guesses:
+            guess_id, target_id = feedback_matrix.id_of(guess), feedback_matrix.id_of(target)
+            action = tree.add_action(node, guess_id)
+            path.append(tree.add_outcome(action, feedback_matrix.pattern(guess_id, target_id)))
+            node = tree.edge_child[path[-1]]
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize('transpositions', [False, True])
+def test_move_orders_reaching_the_same_candidates_share_a_node(
+        dictionary, feedback_matrix, ordered_words, transpositions):
+    solver = MCTSSolver(dictionary, ordered_words, transpositions=transpositions)
+    tree = solver._new_tree(CandidateSet.full(feedback_matrix))
+    first, second = two_orders(tree, feedback_matrix, 'tares', 'lingo', 'pious')
+    ends = tree.edge_child[first[-1]], tree.edge_child[second[-1]]
+    assert tree.candidates(ends[0]) == tree.candidates(ends[1])
+    # both orders filter their own states
+    assert tree.filters == 4
+
+    tree.backpropagate(first, 1.0)
+    tree.backpropagate(second, 0.5)
+    last_move = tree.edge_action[first[-1]]
+    if transpositions:
+        assert ends[0] == ends[1] and tree.merged == 1 and len(tree) == 4
+        assert (tree.visits[ends[0]], tree.value[ends[0]]) == (2, 1.5)
+        # the move is valued by the shared node, not only its own simulation
+        assert tree.action_mean(last_move) == 0.75
+    else:
+        assert ends[0] != ends[1] and tree.merged == 0 and len(tree) == 5
+        assert (tree.visits[ends[0]], tree.value[ends[0]]) == (1, 1.0)
+        assert tree.action_mean(last_move) == 1.0
+    assert tree.action_visits[last_move] == 1
+    assert tree.node_of(tree.candidates(ends[0]), 2) in ends
+
+
+def test_transitions_are_filtered_once_per_state(dictionary, feedback_matrix, ordered_words):
+    solver = MCTSSolver(dictionary, ordered_words, transpositions=False)
+    tree = solver._new_tree(CandidateSet.full(feedback_matrix))
+    first, second = two_orders(tree, feedback_matrix, 'tares', 'lingo', 'pious')
+    ends = tree.edge_child[first[-1]], tree.edge_child[second[-1]]
+
+    # the same guess and pattern from two nodes holding the same state
+    guess_id = feedback_matrix.id_of('dumpy')
+    pattern = feedback_matrix.pattern(guess_id, feedback_matrix.id_of('pious'))
+    children = [tree.edge_child[tree.add_outcome(tree.add_action(end, guess_id), pattern)]
+                for end in ends]
+    assert tree.filters == 5
+    assert children[0] != children[1]
+    assert tree.candidates(children[0]) is tree.candidates(children[1])
+    # the most visited copy is the one found by its candidates
+    tree.backpropagate(second + [tree.first_edge[tree.first_action[ends[1]]]], 1.0)
+    assert tree.node_of(tree.candidates(children[0]), 3) == children[1]
+
+
+def test_searches_merge_transpositions(dictionary, feedback_matrix, ordered_words):
+    trees = {}
+    for transpositions in (False, True):
+        solver = MCTSSolver(dictionary, ordered_words, reuse_tree=False, root_workers=0,
+                            transpositions=transpositions, outcome_search=True)
+        trees[transpositions] = grown_tree(solver, feedback_matrix, 'crane', 3000)
+    tree, dag = trees[False], trees[True]
+
+    assert tree.merged == 0 and dag.merged > 0
+    assert len(dag) < len(tree)
+    # every outcome edge either created a node or merged into one
+    assert len(dag.edge_child) == len(dag) - 1 + dag.merged
+    # repeated transitions are not filtered again
+    assert dag.filters <= len(dag.edge_child) and tree.filters < len(tree.edge_child)
+    # no two DAG nodes hold the same candidates at the same depth
+    assert len({(dag.state[node], dag.depth[node]) for node in range(len(dag))}) == len(dag)
@@ -0,0 +1,147 @@
+import random
+import time
+
+import pytest
+
+import config
+from wordle_game.bounded_cache import get_cache
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import compute_feedback, encode_feedback, filter_candidates
+from wordle_game.solver import MinimaxSolver
+from wordle_game.solver.parallel_minimax import get_root_search
+
+
+def second_turn_candidates(dictionary, feedback_matrix, count, seed, opener='tares'):
+    """Candidate lists of more than two words left after `opener`."""
+    rng = random.Random(seed)
+    everything = CandidateSet.full(feedback_matrix)
+    states = []
+    for target in rng.sample(dictionary, count):
+        pattern = encode_feedback(compute_feedback(opener, target))
+        candidates = filter_candidates(everything, opener, pattern).words()
+        if len(candidates) > 2:
+            states.append(candidates)
+    return states
+
+
+@pytest.fixture
+def transpositions():
+    cache = get_cache('minimax_transpositions')
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_table_is_bounded_and_shared(dictionary, ordered_words, transpositions):
+    assert transpositions.max_entries == config.MINIMAX_TT_SIZE
+    assert transpositions.max_bytes == config.MINIMAX_TT_BYTES
+    assert MinimaxSolver.transposition_stats()['evictions'] == transpositions.stats()['evictions']
+
+
+def test_warm_table_returns_the_cold_result(dictionary, feedback_matrix, ordered_words,
+                                            transpositions):
+    states = second_turn_candidates(dictionary, feedback_matrix, 8, seed=4)
+    cold = []
+    for candidates in states:
+        transpositions.clear()
+        cold.append(MinimaxSolver(dictionary, ordered_words).select_guess(candidates))
+
+    # a new solver (another session) reuses the entries left by the first
+    MinimaxSolver(dictionary, ordered_words).select_guess(states[0])
+    other = MinimaxSolver(dictionary, ordered_words)
+    before = MinimaxSolver.transposition_stats()
+    for candidates, expected in zip(states, cold):
+        assert other.select_guess(candidates) == expected
+        assert other.select_guess(list(reversed(candidates))) == expected
+    after = MinimaxSolver.transposition_stats()
+    assert after['hits'] > before['hits']
+    assert after['nodes_saved'] > before['nodes_saved']
+
+
+def test_repeated_search_expands_no_nodes(dictionary, feedback_matrix, ordered_words,
+                                          transpositions):
+    candidates = second_turn_candidates(dictionary, feedback_matrix, 1, seed=5)[0]
+    solver = MinimaxSolver(dictionary, ordered_words)
+    guess = solver.select_guess(candidates)
+    searched = MinimaxSolver.transposition_stats()['nodes_searched']
+    assert solver.select_guess(candidates) == guess
+    assert MinimaxSolver.transposition_stats()['nodes_searched'] == searched
+
+
+def test_entries_are_not_shared_across_tie_breaks(dictionary, feedback_matrix, ordered_words,
+                                                  transpositions):
+    # at depth 1 the root is a leaf, where the tie-break applies
+    differing = 0
+    for candidates in second_turn_candidates(dictionary, feedback_matrix, 12, seed=8):
+        transpositions.clear()
+        expected = MinimaxSolver(dictionary, ordered_words, max_depth=1,
+                                 tie_break_buckets=True).select_guess(candidates)
+        transpositions.clear()
+        plain = MinimaxSolver(dictionary, ordered_words, max_depth=1).select_guess(candidates)
+        assert MinimaxSolver(dictionary, ordered_words, max_depth=1,
+                             tie_break_buckets=True).select_guess(candidates) == expected
+        differing += plain != expected
+    assert differing
+
+
+def test_unhurried_iterative_deepening_matches_fixed_depth(dictionary, feedback_matrix,
+                                                          ordered_words, transpositions):
+    fixed = MinimaxSolver(dictionary, ordered_words, max_depth=2)
+    anytime = MinimaxSolver(dictionary, ordered_words, max_depth=2, time_budget=60)
+    for candidates in second_turn_candidates(dictionary, feedback_matrix, 6, seed=9):
+        transpositions.clear()
+        expected = fixed.select_guess(candidates)
+        transpositions.clear()
+        assert anytime.select_guess(candidates) == expected
+
+
+def test_spent_budget_returns_the_first_iteration(dictionary, feedback_matrix, ordered_words,
+                                                  transpositions):
+    shallow = MinimaxSolver(dictionary, ordered_words, max_depth=1)
+    hurried = MinimaxSolver(dictionary, ordered_words, max_depth=4, time_budget=0)
+    for candidates in second_turn_candidates(dictionary, feedback_matrix, 6, seed=10):
+        transpositions.clear()
+        expected = shallow.select_guess(candidates)
+        transpositions.clear()
+        assert hurried.select_guess(candidates) == expected
+
+
+def test_search_stops_near_the_deadline(dictionary, ordered_words, transpositions):
+    budget = 0.2
+    solver = MinimaxSolver(dictionary, ordered_words,
+                           max_depth=config.MINIMAX_MAX_ITERATIVE_DEPTH, time_budget=budget)
+    candidates = random.Random(11).sample(dictionary, 3000)
+    start = time.perf_counter()
+    guess = solver.select_guess(candidates)
+    # the first iteration always completes; deeper ones stop at the deadline
+    assert time.perf_counter() - start < budget + 1
+    assert guess in dictionary
+
+
+@pytest.fixture
+def root_search(feedback_matrix):
+    pool = get_root_search(feedback_matrix, workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize('tie_break_buckets', [False, True])
+def test_parallel_root_search_matches_serial(dictionary, feedback_matrix, ordered_words,
+                                             transpositions, root_search, tie_break_buckets):
+    serial = MinimaxSolver(dictionary, ordered_words, root_workers=0,
+                           tie_break_buckets=tie_break_buckets)
+    parallel = MinimaxSolver(dictionary, ordered_words, root_workers=2,
+                             tie_break_buckets=tie_break_buckets)
+    states = [candidates for candidates
+              in second_turn_candidates(dictionary, feedback_matrix, 12, seed=3)
+              if root_search.is_parallel(len(candidates))]
+    assert states
+
+    for candidates in states[:4]:
+        # Each search starts cold so neither reads the other's results
+        transpositions.clear()
+        expected = serial.select_guess(candidates)
+        assert not serial.search_info()['root_parallel']
+        transpositions.clear()
+        assert parallel.select_guess(candidates) == expected, len(candidates)
+        assert parallel.search_info()['root_parallel']
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from wordle_game.candidate_set import CandidateSet
+from wordle_game.feedback import compute_feedback, encode_feedback, filter_candidates
+from wordle_game.opening_book import (BOOK_VERSION, OpeningBook, OpeningBookError,
+                                      build_solver_hints, load_book, write_book)
+from wordle_game.solver import BaseSolver, GreedySolver
+
+
+class PickSolver(BaseSolver):
+    """Cheap deterministic solver whose guesses depend on its `offset`."""
+
+    def __init__(self, offset=0):
+        self.offset = offset
+        self.searches = 0
+
+    def settings(self):
+        return {'offset': self.offset}
+
+    def select_guess(self, candidates):
+        self.searches += 1
+        return candidates[self.offset % len(candidates)]
+
+    def starting_word(self):
+        return 'tares'
+
+    @classmethod
+    def get_name(cls):
+        return 'pick'
+
+
+def second_turn(dictionary, feedback_matrix, target):
+    pattern = encode_feedback(compute_feedback('tares', target))
+    return filter_candidates(CandidateSet.full(feedback_matrix), 'tares', pattern).words()
+
+
+@pytest.fixture
+def book(feedback_matrix):
+    book = OpeningBook(feedback_matrix)
+    build_solver_hints(book, PickSolver())
+    return book
+
+
+def test_book_answers_every_second_turn_state(dictionary, feedback_matrix, book):
+    solver = PickSolver()
+    for target in ('pious', 'crane', 'lingo', 'fjord'):
+        candidates = second_turn(dictionary, feedback_matrix, target)
+        if len(candidates) > 2:
+            assert book.lookup(solver, candidates) == solver.select_guess(candidates)
+    assert book.lookup(PickSolver(), dictionary[:10]) is None
+
+
+def test_hints_built_with_other_settings_are_ignored(dictionary, feedback_matrix, book):
+    candidates = second_turn(dictionary, feedback_matrix, 'pious')
+    assert book.lookup(PickSolver(offset=1), candidates) is None
+
+    # rebuilding with the new settings replaces the stale hints
+    rebuilt = PickSolver(offset=1)
+    build_solver_hints(book, rebuilt)
+    assert book.lookup(rebuilt, candidates) == candidates[1]
+    assert book.lookup(PickSolver(), candidates) is None
+
+
+def test_configuration_is_part_of_the_key(dictionary, feedback_matrix):
+    book = OpeningBook(feedback_matrix)
+    candidates = CandidateSet.from_words(
+        feedback_matrix, second_turn(dictionary, feedback_matrix, 'pious'))
+    default = GreedySolver(dictionary, probe_guesses=False)
+    book.add(default, candidates, 'pious')
+
+    assert book.lookup(default, candidates.words()) == 'pious'
+    assert book.lookup(GreedySolver(dictionary, probe_guesses=True), candidates.words()) is None
+
+
+def test_round_trip_and_stale_files(tmp_path, feedback_matrix, book):
+    path = str(tmp_path / 'book.json')
+    write_book(path, book)
+    loaded = load_book(path, feedback_matrix)
+    assert loaded.hints == book.hints and loaded.settings == book.settings
+
+    with open(path) as f:
+        content = json.load(f)
+    for key, value in (('version', BOOK_VERSION - 1), ('dictionary_digest', 'other')):
+        with open(path, 'w') as f:
+            json.dump(dict(content, **{key: value}), f)
+        with pytest.raises(OpeningBookError):
+            load_book(path, feedback_matrix)
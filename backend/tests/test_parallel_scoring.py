@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+import pytest
+
+from wordle_game.feedback_matrix import (FeedbackMatrixArtifactError, artifact_path,
+                                         dictionary_digest, map_artifact)
+from wordle_game.solver.parallel_scoring import ScoringExecutor
+
+
+@pytest.fixture(scope='module')
+def executors(feedback_matrix):
+    serial = ScoringExecutor(feedback_matrix, workers=0)
+    parallel = ScoringExecutor(feedback_matrix, workers=2, min_parallel_candidates=1)
+    yield serial, parallel
+    parallel.shutdown()
+
+
+def test_parallel_scoring_matches_serial(dictionary, feedback_matrix, executors):
+    serial, parallel = executors
+    rng = random.Random(0)
+    guess_ids = feedback_matrix.ids_of(rng.sample(dictionary, 3000))
+    for size in (5, 200, 2000):
+        candidate_ids = feedback_matrix.ids_of(rng.sample(dictionary, size))
+        assert parallel.is_parallel(size) and not serial.is_parallel(size)
+        np.testing.assert_array_equal(
+            parallel.expected_information_gain(guess_ids, candidate_ids),
+            serial.expected_information_gain(guess_ids, candidate_ids))
+        np.testing.assert_array_equal(parallel.worst_case_sizes(guess_ids, candidate_ids),
+                                      serial.worst_case_sizes(guess_ids, candidate_ids))
+        np.testing.assert_array_equal(
+            parallel.rank_by_information_gain(guess_ids, candidate_ids),
+            serial.rank_by_information_gain(guess_ids, candidate_ids))
+        for tie_break_buckets in (False, True):
+            assert parallel.best_worst_case(guess_ids, candidate_ids, tie_break_buckets) \
+                == serial.best_worst_case(guess_ids, candidate_ids, tie_break_buckets)
+
+
+def test_only_large_requests_use_the_pool(feedback_matrix):
+    executor = ScoringExecutor(feedback_matrix, workers=4, min_parallel_candidates=500)
+    assert executor.is_parallel(500) and not executor.is_parallel(499)
+    assert not ScoringExecutor(feedback_matrix, workers=1).is_parallel(len(feedback_matrix))
+
+
+def test_workers_map_the_artifact_by_digest(dictionary, feedback_matrix):
+    path = artifact_path(dictionary)
+    patterns = map_artifact(path, len(dictionary), dictionary_digest(dictionary))
+    assert patterns.shape == feedback_matrix.patterns.shape
+    assert not patterns.flags.writeable
+    np.testing.assert_array_equal(patterns[:50], feedback_matrix.patterns[:50])
+
+    with pytest.raises(FeedbackMatrixArtifactError):
+        map_artifact(path, len(dictionary), dictionary_digest(dictionary[:-1] + ['zzzzz']))
+    with pytest.raises(FeedbackMatrixArtifactError):
+        map_artifact(path, len(dictionary) - 1, dictionary_digest(dictionary))
@@ -0,0 +1,52 @@
+import math
+import random
+
+import numpy as np
+
+from wordle_game.solver.greedy_solver import GreedySolver
+from wordle_game.solver.parallel_scoring import ScoringExecutor
+from wordle_game.solver.scoring import expected_information_gain, rank_by_information_gain
+
+
+def information_gain(feedback_matrix, guess_id, candidate_ids):
+    """Per-guess entropy reduction, as GreedySolver scored one guess at a time."""
+    sizes = feedback_matrix.partition_sizes(guess_id, candidate_ids)
+    sizes = sizes[sizes > 0]
+    total = len(candidate_ids)
+    return math.log2(total) - float(np.sum(sizes * np.log2(sizes))) / total
+
+
+def test_scores_match_per_guess_entropy(feedback_matrix):
+    rng = random.Random(6)
+    candidate_ids = np.sort(rng.sample(range(len(feedback_matrix)), 400))
+    guess_ids = np.array(rng.sample(range(len(feedback_matrix)), 200))
+    scores = expected_information_gain(feedback_matrix, guess_ids, candidate_ids)
+    assert np.allclose(scores, [information_gain(feedback_matrix, guess, candidate_ids)
+                                for guess in guess_ids])
+
+
+def test_ranking_orders_best_first_and_keeps_ties_in_order(feedback_matrix):
+    rng = random.Random(7)
+    candidate_ids = np.sort(rng.sample(range(len(feedback_matrix)), 300))
+    # every guess appears twice, so each pair ties
+    guess_ids = np.repeat(rng.sample(range(len(feedback_matrix)), 100), 2)
+    ranking = rank_by_information_gain(feedback_matrix, guess_ids, candidate_ids)
+    scores = expected_information_gain(feedback_matrix, guess_ids, candidate_ids)
+
+    assert sorted(ranking.tolist()) == list(range(len(guess_ids)))
+    assert np.all(np.diff(scores[ranking]) <= 0)
+    for first, second in zip(ranking[::2], ranking[1::2]):
+        assert first + 1 == second
+
+    serial = ScoringExecutor(feedback_matrix, workers=0)
+    assert serial.rank_by_information_gain(guess_ids, candidate_ids).tolist() == ranking.tolist()
+
+
+def test_greedy_guess_is_the_top_ranked_candidate(dictionary, feedback_matrix):
+    solver = GreedySolver(dictionary, probe_guesses=False)
+    rng = random.Random(8)
+    for _ in range(10):
+        candidate_ids = np.sort(rng.sample(range(len(feedback_matrix)), rng.randint(3, 200)))
+        candidates = [feedback_matrix.words[i] for i in candidate_ids]
+        ranking = rank_by_information_gain(feedback_matrix, candidate_ids, candidate_ids)
+        assert solver.select_guess(candidates) == candidates[ranking[0]]
@@ -0,0 +1,52 @@
+import json
+import random
+
+import pytest
+
+import config
+from wordle_game.feedback_matrix import get_feedback_matrix
+from wordle_game.solver_manager import SolverManager
+from wordle_game.word_order import (ORDER_VERSION, WordOrderError, build_order, get_word_order,
+                                    load_order, order_path)
+
+
+@pytest.fixture
+def small_matrix(dictionary, tmp_path, monkeypatch):
+    """Feedback matrix of a small dictionary, with data files in a temp dir."""
+    monkeypatch.setattr(config, 'DATA_DIR', str(tmp_path))
+    words = sorted(random.Random(12).sample(dictionary, 300))
+    return get_feedback_matrix(words)
+
+
+def test_order_ranks_by_letter_overlap(small_matrix):
+    words = small_matrix.words
+    letter_sets = [set(word) for word in words]
+
+    def overlap(i):
+        return sum(len(letter_sets[i] & other) for other in letter_sets)
+
+    expected = sorted(range(len(words)),
+                      key=lambda i: (-overlap(i), -len(letter_sets[i]), i))
+    assert build_order(small_matrix) == [words[i] for i in expected]
+
+
+def test_order_is_cached_on_disk(small_matrix):
+    words = get_word_order(small_matrix)
+    path = order_path(small_matrix)
+    assert load_order(path, small_matrix) == words == build_order(small_matrix)
+
+    with open(path) as f:
+        content = json.load(f)
+    for key, value in (('version', ORDER_VERSION + 1), ('dictionary_digest', 'other')):
+        with open(path, 'w') as f:
+            json.dump(dict(content, **{key: value}), f)
+        with pytest.raises(WordOrderError):
+            load_order(path, small_matrix)
+
+
+def test_manager_derives_the_order_without_an_order_file(dictionary, feedback_matrix,
+                                                         monkeypatch):
+    monkeypatch.setattr(config, 'ORDERED_WORDS_PATH', '')
+    ordered_words = SolverManager(dictionary).ordered_words
+    assert ordered_words == get_word_order(feedback_matrix)
+    assert sorted(ordered_words) == sorted(dictionary)
@@ -1,12 +1,17 @@
 import uuid
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from typing import Dict
+from typing import Dict, List, Tuple
 import config
 import json
 
 from web_interface.app_session import AppSession
 from wordle_game.dictionary import load_dictionary
+from wordle_game.feedback import decode_pattern, encode_feedback
+from wordle_game.feedback_matrix import get_feedback_matrix
+from wordle_game.opening_book import get_opening_book
+from wordle_game.bounded_cache import cache_stats
+from wordle_game.solver import MinimaxSolver, MCTSSolver
 from cache_service.hint_cache import HintCache, SupabaseConnectionError, HintCacheError
 
 app = Flask(__name__)
@@ -24,12 +29,60 @@ SESSIONS: Dict[str, AppSession] = {}
 # Load dictionary
 word_list = load_dictionary(config.DICTIONARY_PATH)
 
+# Map the shared feedback matrix and load the opening book up front so
+# requests never build them
+feedback_matrix = get_feedback_matrix(word_list)
+get_opening_book(feedback_matrix)
+
+
+def serialize_game_state(game_state: dict) -> dict:
+    """Convert a game state's pattern codes into feedback lists for JSON."""
+    return {
+        **game_state,
+        'history': [[guess, decode_pattern(pattern)]
+                    for guess, pattern in game_state['history']]
+    }
+
+
+def deserialize_history(history: list) -> List[Tuple[str, int]]:
+    """Convert a history of [guess, feedback list] pairs into pattern codes.
+
+    Raises:
+        ValueError: If a guess is not a dictionary word or a feedback list is
+            not WORD_LENGTH values of 0, 1 or 2
+    """
+    if not isinstance(history, list):
+        raise ValueError('History must be a list of [guess, feedback] pairs')
+    pairs = []
+    for entry in history:
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+            raise ValueError(f"Invalid history entry: {entry}")
+        guess, feedback = entry
+        if not isinstance(guess, str) or guess.lower() not in feedback_matrix.word_ids:
+            raise ValueError(f"Invalid guess: {guess}")
+        if not isinstance(feedback, (list, tuple)) or len(feedback) != config.WORD_LENGTH \
+                or any(not isinstance(code, int) or code not in (0, 1, 2)
+                       for code in feedback):
+            raise ValueError(f"Invalid feedback for {guess}: {feedback}")
+        pairs.append((guess.lower(), encode_feedback(tuple(feedback))))
+    return pairs
+
 
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({'status': 'ok'}), 200
 
 
+@app.route('/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """Report size, limits and hit/miss/eviction counters of the solver caches."""
+    return jsonify({
+        'caches': cache_stats(),
+        'minimax': MinimaxSolver.transposition_stats(),
+        'mcts': MCTSSolver.reuse_stats()
+    }), 200
+
+
 @app.route('/newgame', methods=['POST'])
 def new_game():
     """Start a new game with optional solver selection."""
@@ -51,7 +104,7 @@ def new_game():
     return jsonify({
         'game_id': game_id,
         'solver_type': solver_type,
-        'state': session.get_game_state()
+        'state': serialize_game_state(session.get_game_state())
     })
 
 
@@ -68,10 +121,10 @@ def make_guess():
         return jsonify({'error': 'Game not found'}), 404
 
     try:
-        feedback, _ = session.submit_guess(data['guess'])
+        pattern, _ = session.submit_guess(data['guess'])
         return jsonify({
-            'feedback': feedback,
-            'state': session.get_game_state(),
+            'feedback': decode_pattern(pattern),
+            'state': serialize_game_state(session.get_game_state()),
             'game_id': game_id
         })
     except ValueError as e:
@@ -80,10 +133,15 @@ def make_guess():
 
 @app.route('/hint', methods=['GET'])
 def get_hint():
-    """Get a hint from a solver with caching support."""
+    """Get a hint from a solver with caching support.
+
+    A game without a session here (played elsewhere, or started on another
+    worker) can pass its `history` as JSON [guess, feedback] pairs instead.
+    """
     game_id = request.args.get('game_id', 'default')
     solver_type = request.args.get('solver', config.DEFAULT_SOLVER)
     solver_params = request.args.get('solver_params', None)
+    history = request.args.get('history', None)
 
     # Parse solver parameters if provided
     if solver_params:
@@ -93,6 +151,12 @@ def get_hint():
             return jsonify({'error': 'Invalid solver parameters format'}), 400
 
     session = SESSIONS.get(game_id)
+    if not session and history:
+        try:
+            session = AppSession.from_history(
+                word_list, deserialize_history(json.loads(history)))
+        except (json.JSONDecodeError, ValueError) as e:
+            return jsonify({'error': f'Invalid history: {e}'}), 400
     if not session:
         return jsonify({'error': 'Game not found'}), 404
     if session.is_game_over():
@@ -102,28 +166,30 @@ def get_hint():
         # Get current game state
         game_state = session.get_game_state()
 
-        # Define hint computation function
+        # Define hint computation function, keeping the search details
         def compute_hint():
             hint, _, _ = session.get_hint(solver_type, solver_params)
-            return hint
+            return hint, dict(session.solver_manager.last_hint_info)
 
         # Try to get cached hint or compute new one
         try:
-            hint, was_cached = HintCache.get_or_compute_hint(
+            hint, was_cached, metadata = HintCache.get_or_compute_hint(
                 game_state=game_state,
                 solver_type=solver_type,
-                compute_fn=compute_hint
+                compute_fn=compute_hint,
+                solver_params=solver_params
             )
         except (SupabaseConnectionError, HintCacheError) as e:
             # If caching fails, fall back to direct computation
             app.logger.error(f"Cache error: {str(e)}")
-            hint = compute_hint()
+            hint, metadata = compute_hint()
             was_cached = False
 
         return jsonify({
             'hint': hint,
             'solver_type': solver_type,
             'cached': was_cached,
+            'metadata': metadata,
             'game_id': game_id
         })
 
@@ -204,5 +270,5 @@ def mirror_game():
     return jsonify({
         'game_id': new_game_id,
         'solver_type': solver_type,
-        'state': new_session.get_game_state()
+        'state': serialize_game_state(new_session.get_game_state())
     })
@@ -23,9 +23,29 @@ class AppSession:
         )
         self.solver_manager = SolverManager(dictionary_words)
 
-    def submit_guess(self, guess: str) -> Tuple[Tuple[int, ...], bool]:
-        """Submit a guess to the game."""
-        return self.game_state.submit_guess(guess)
+    @classmethod
+    def from_history(cls, dictionary_words: List[str], history: List[Tuple[str, int]],
+                     max_guesses: int = MAX_GUESSES) -> 'AppSession':
+        """Restore a session for a game played elsewhere from its guess history.
+
+        Args:
+            dictionary_words: List of valid words for the game
+            history: List of (guess, pattern code) pairs already played
+            max_guesses: Maximum number of allowed guesses
+
+        Returns:
+            A session whose game is in the state reached after the history
+        """
+        session = cls(dictionary_words, max_guesses)
+        session.game_state = WordleGame.from_history(
+            dictionary_words, history, max_guesses)
+        return session
+
+    def submit_guess(self, guess: str) -> Tuple[int, bool]:
+        """Submit a guess to the game, returning its feedback pattern code."""
+        pattern, game_over = self.game_state.submit_guess(guess)
+        self.solver_manager.observe_feedback(guess, pattern)
+        return pattern, game_over
 
     def get_hint(self, solver_type: Optional[str] = None, solver_params: Optional[Dict[str, Any]] = None) -> Tuple[str, str, int]:
         """Get a hint using the specified or active solver.
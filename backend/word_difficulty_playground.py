@@ -9,34 +9,6 @@ from wordle_game.solver import *
 from wordle_game.solver_manager import SolverManager
 
 MAX_GUESSES = 15
-PARTITIONS_CACHE = {}
-INFO_GAIN_CACHE = {}
-
-
-def add_caching_to_greedy():
-    GreedySolver._original_partitions = GreedySolver._compute_partitions
-    GreedySolver._original_info_gain = GreedySolver._compute_expected_info_gain
-
-    def cached_partitions(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in PARTITIONS_CACHE:
-            PARTITIONS_CACHE[key] = self._original_partitions(guess, candidates)
-        return PARTITIONS_CACHE[key]
-
-    def cached_info_gain(self, guess, candidates):
-        key = (guess, frozenset(candidates))
-        if key not in INFO_GAIN_CACHE:
-            INFO_GAIN_CACHE[key] = self._original_info_gain(guess, candidates)
-        return INFO_GAIN_CACHE[key]
-
-    GreedySolver._compute_partitions = cached_partitions
-    GreedySolver._compute_expected_info_gain = cached_info_gain
-
-
-def remove_caching_from_greedy():
-    if hasattr(GreedySolver, '_original_partitions'):
-        GreedySolver._compute_partitions = GreedySolver._original_partitions
-        GreedySolver._compute_expected_info_gain = GreedySolver._original_info_gain
 
 
 def run_game_with_fixed_start(solver: BaseSolver, dictionary: List[str], target_word: str, first_guess: str):
@@ -70,7 +42,6 @@ def main():
     test_words = load_dictionary(config.WORDLE_ANS_PATH)
     start_word = "slate"
 
-    # add_caching_to_greedy()
     solver_manager = SolverManager(dictionary)
     # solver = solver_manager.create_solver(NaiveSolver, dictionary, {})
     # solver = solver_manager.create_solver(MinimaxSolver, dictionary, {})
@@ -103,8 +74,6 @@ def main():
     for word, guesses, guess_list in hard_words:
         print(f"{word}: {guesses} guesses -> {guess_list}")
 
-    # remove_caching_from_greedy()
-
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,6 +4,8 @@ Wordle Solver - A package implementing multiple algorithms for solving Wordle pu
 
 from .wordle_game import WordleGame
 from .dictionary import load_dictionary
+from .candidate_set import CandidateSet
+from .constraint_state import ConstraintState
 
 __version__ = '0.1.0'
-__all__ = ['WordleGame', 'load_dictionary']
+__all__ = ['WordleGame', 'load_dictionary', 'CandidateSet', 'ConstraintState']
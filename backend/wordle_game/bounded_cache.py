@@ -0,0 +1,165 @@
+"""
+Bounded, instrumented LRU caches for long-running worker processes.
+
+Each cache is capped both by entry count and by an approximate byte budget,
+evicts least recently used entries first and counts hits, misses and
+evictions. Every cache registers itself by name so the web app can report
+their statistics.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# All caches created in this process, keyed by name
+_CACHES: Dict[str, 'BoundedCache'] = {}
+
+_MISSING = object()
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximate the memory held by a cache key or value in bytes.
+
+    Tuples are measured one level deep, which covers the argument tuples used
+    as keys by `bounded_cache`.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(sys.getsizeof(item) for item in obj)
+    return size
+
+
+class BoundedCache:
+    """Thread-safe LRU cache bounded by entry count and approximate bytes."""
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int,
+                 sizeof: Callable[[Any], int] = approximate_size):
+        """Initialize the cache and register it under `name`.
+
+        Args:
+            name: Name reported in cache statistics
+            max_entries: Maximum number of entries kept (0 disables caching)
+            max_bytes: Maximum approximate size of keys and values in bytes
+            sizeof: Function estimating the size of a key or value
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _CACHES[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting least recently used entries to fit."""
+        size = self._sizeof(key) + self._sizeof(value)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while (len(self._entries) > self.max_entries
+                   or self.current_bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return the value for `key` without counting a lookup."""
+        with self._lock:
+            entry = self._entries.pop(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            self.current_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache's size, limits and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def bounded_cache(name: str, max_entries: int, max_bytes: int) -> Callable:
+    """Memoize a function with a named BoundedCache.
+
+    The wrapped function exposes the cache as `.cache` and keeps the
+    `cache_clear()` helper offered by `functools.lru_cache`.
+
+    Args:
+        name: Name reported in cache statistics
+        max_entries: Maximum number of cached calls
+        max_bytes: Maximum approximate size of cached arguments and results
+
+    Returns:
+        Decorator applying the cache
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache = BoundedCache(name, max_entries, max_bytes)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = fn(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def get_cache(name: str) -> Optional[BoundedCache]:
+    """Return a registered cache by name."""
+    return _CACHES.get(name)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return statistics for every registered cache, keyed by name."""
+    return {name: cache.stats() for name, cache in _CACHES.items()}
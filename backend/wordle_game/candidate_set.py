@@ -0,0 +1,126 @@
+"""
+Candidate word sets stored as fixed-width bitsets over dictionary word ids.
+"""
+
+import sys
+import hashlib
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .feedback_matrix import FeedbackMatrix
+
+# Size of an empty member ids array, and of each id it holds
+_EMPTY_IDS_SIZE = sys.getsizeof(np.empty(0, dtype=np.intp))
+_ID_ITEMSIZE = np.dtype(np.intp).itemsize
+
+
+class CandidateSet:
+    """Immutable set of dictionary words backed by a bitset over word ids.
+
+    Bit i is set when the word with id i (its index in the feedback matrix's
+    word list) is a candidate. Iteration yields words in dictionary order.
+    """
+
+    __slots__ = ('feedback_matrix', 'bits', '_ids')
+
+    def __init__(self, feedback_matrix: 'FeedbackMatrix', bits: int):
+        """Initialize the set.
+
+        Args:
+            feedback_matrix: Feedback matrix defining the word ids
+            bits: Bitset with bit i set for each member word id i
+        """
+        self.feedback_matrix = feedback_matrix
+        self.bits = bits
+        self._ids: Optional[np.ndarray] = None
+
+    @classmethod
+    def full(cls, feedback_matrix: 'FeedbackMatrix') -> 'CandidateSet':
+        """Create a set containing every dictionary word."""
+        return cls(feedback_matrix, (1 << len(feedback_matrix)) - 1)
+
+    @classmethod
+    def from_mask(cls, feedback_matrix: 'FeedbackMatrix', mask: np.ndarray) -> 'CandidateSet':
+        """Create a set from a boolean array indexed by word id."""
+        packed = np.packbits(mask, bitorder='little').tobytes()
+        return cls(feedback_matrix, int.from_bytes(packed, 'little'))
+
+    @classmethod
+    def from_ids(cls, feedback_matrix: 'FeedbackMatrix', ids: Iterable[int]) -> 'CandidateSet':
+        """Create a set from word ids."""
+        mask = np.zeros(len(feedback_matrix), dtype=bool)
+        mask[np.fromiter(ids, dtype=np.int64)] = True
+        return cls.from_mask(feedback_matrix, mask)
+
+    @classmethod
+    def from_words(cls, feedback_matrix: 'FeedbackMatrix', words: Iterable[str]) -> 'CandidateSet':
+        """Create a set from dictionary words."""
+        if isinstance(words, CandidateSet):
+            return words
+        return cls.from_ids(feedback_matrix, (feedback_matrix.id_of(word) for word in words))
+
+    def ids(self) -> np.ndarray:
+        """Return the member word ids in ascending order."""
+        if self._ids is None:
+            n = len(self.feedback_matrix)
+            packed = np.frombuffer(
+                self.bits.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+            self._ids = np.flatnonzero(
+                np.unpackbits(packed, count=n, bitorder='little'))
+        return self._ids
+
+    def words(self) -> List[str]:
+        """Return the member words in dictionary order."""
+        words = self.feedback_matrix.words
+        return [words[i] for i in self.ids()]
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of the set, identical across processes and restarts."""
+        n = len(self.feedback_matrix)
+        return hashlib.blake2b(self.bits.to_bytes((n + 7) // 8, 'little'),
+                               digest_size=16).hexdigest()
+
+    def __and__(self, other: 'CandidateSet') -> 'CandidateSet':
+        return CandidateSet(self.feedback_matrix, self.bits & other.bits)
+
+    def __sub__(self, other: 'CandidateSet') -> 'CandidateSet':
+        return CandidateSet(self.feedback_matrix, self.bits & ~other.bits)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words())
+
+    def __contains__(self, word: Union[str, int]) -> bool:
+        if isinstance(word, str):
+            word_id = self.feedback_matrix.word_ids.get(word)
+            if word_id is None:
+                return False
+        else:
+            word_id = int(word)
+        return bool(self.bits >> word_id & 1)
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, CandidateSet)
+                and self.feedback_matrix is other.feedback_matrix
+                and self.bits == other.bits)
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __sizeof__(self) -> int:
+        # The ids array is counted even before `ids()` builds it, so a set
+        # stored in a size-bounded cache cannot outgrow its recorded size
+        ids_bytes = len(self) * _ID_ITEMSIZE if self._ids is None else self._ids.nbytes
+        return (object.__sizeof__(self) + sys.getsizeof(self.bits)
+                + _EMPTY_IDS_SIZE + ids_bytes)
+
+    def __repr__(self) -> str:
+        return f"CandidateSet({len(self)} words)"
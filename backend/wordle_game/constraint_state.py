@@ -0,0 +1,147 @@
+"""
+Accumulated knowledge from a game's feedback, independent of guess order.
+"""
+
+from typing import List, Optional, Tuple
+
+import config
+from .feedback import decode_pattern
+
+_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+
+class ConstraintState:
+    """Immutable summary of every constraint learned from past feedback.
+
+    Holds the known green letters, the letters excluded at each position and
+    the minimum/maximum count of each letter. Merging a guess only touches a
+    fixed number of fields, and two histories that teach the same facts
+    produce equal states with the same canonical key.
+    """
+
+    __slots__ = ('greens', 'excluded', 'min_counts', 'max_counts', '_key')
+
+    def __init__(self, greens: Tuple[Optional[str], ...], excluded: Tuple[int, ...],
+                 min_counts: Tuple[int, ...], max_counts: Tuple[int, ...]):
+        """Initialize the state.
+
+        Args:
+            greens: Known letter per position, or None when unknown
+            excluded: Per-position bitmask of letters ruled out there
+                (bit 0 = 'a')
+            min_counts: Minimum number of occurrences of each letter
+            max_counts: Maximum number of occurrences of each letter
+        """
+        # Normalize facts implied by other facts so equal knowledge compares equal
+        min_counts = list(min_counts)
+        excluded = list(excluded)
+        absent = sum(1 << c for c in range(26) if max_counts[c] == 0)
+        for i, letter in enumerate(greens):
+            if letter is None:
+                excluded[i] &= ~absent
+            else:
+                excluded[i] = 0
+        for letter in set(filter(None, greens)):
+            c = _ALPHABET.index(letter)
+            min_counts[c] = max(min_counts[c], greens.count(letter))
+
+        self.greens = tuple(greens)
+        self.excluded = tuple(excluded)
+        self.min_counts = tuple(min_counts)
+        self.max_counts = tuple(max_counts)
+        self._key: Optional[str] = None
+
+    @classmethod
+    def empty(cls) -> 'ConstraintState':
+        """Return the state before any guess has been made."""
+        return cls((None,) * config.WORD_LENGTH, (0,) * config.WORD_LENGTH,
+                   (0,) * 26, (config.WORD_LENGTH,) * 26)
+
+    @classmethod
+    def from_history(cls, history: List[Tuple[str, int]]) -> 'ConstraintState':
+        """Build the state for a list of (guess, pattern) pairs."""
+        state = cls.empty()
+        for guess, pattern in history:
+            state = state.merge(guess, pattern)
+        return state
+
+    def merge(self, guess: str, pattern: int) -> 'ConstraintState':
+        """Return the state after also observing `pattern` for `guess`.
+
+        Args:
+            guess: The guessed word
+            pattern: Feedback pattern code observed for the guess
+
+        Returns:
+            New state combining the existing constraints with the new ones
+        """
+        greens = list(self.greens)
+        excluded = list(self.excluded)
+        min_counts = list(self.min_counts)
+        max_counts = list(self.max_counts)
+
+        hits = [0] * 26
+        missed = 0
+        for i, (letter, code) in enumerate(zip(guess, decode_pattern(pattern))):
+            c = _ALPHABET.index(letter)
+            if code == 2:
+                greens[i] = letter
+            else:
+                excluded[i] |= 1 << c
+            if code > 0:
+                hits[c] += 1
+            else:
+                missed |= 1 << c
+
+        for c in {_ALPHABET.index(letter) for letter in guess}:
+            min_counts[c] = max(min_counts[c], hits[c])
+            if missed >> c & 1:
+                max_counts[c] = min(max_counts[c], hits[c])
+
+        return ConstraintState(tuple(greens), tuple(excluded),
+                               tuple(min_counts), tuple(max_counts))
+
+    def matches(self, word: str) -> bool:
+        """Check a word against every constraint in a single pass."""
+        counts = [0] * 26
+        for i, letter in enumerate(word):
+            known = self.greens[i]
+            if known is not None and letter != known:
+                return False
+            c = ord(letter) - 97
+            if self.excluded[i] >> c & 1:
+                return False
+            counts[c] += 1
+
+        for c in range(26):
+            if not self.min_counts[c] <= counts[c] <= self.max_counts[c]:
+                return False
+        return True
+
+    def key(self) -> str:
+        """Return a short canonical string identifying the knowledge state.
+
+        Format: known greens ('.' if unknown), per-position excluded letters,
+        then minimum and maximum letter counts that constrain anything.
+        """
+        if self._key is None:
+            greens = ''.join(letter or '.' for letter in self.greens)
+            excluded = ','.join(
+                ''.join(_ALPHABET[c] for c in range(26) if mask >> c & 1)
+                for mask in self.excluded)
+            minimums = ''.join(f"{_ALPHABET[c]}{n}"
+                               for c, n in enumerate(self.min_counts) if n > 0)
+            maximums = ''.join(f"{_ALPHABET[c]}{n}"
+                               for c, n in enumerate(self.max_counts)
+                               if n < config.WORD_LENGTH)
+            self._key = f"{greens}|{excluded}|{minimums}|{maximums}"
+        return self._key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ConstraintState) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return f"ConstraintState({self.key()!r})"
@@ -1,10 +1,25 @@
-from functools import lru_cache
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from collections import Counter
+import numpy as np
 import config
+from .candidate_set import CandidateSet
+from .bounded_cache import bounded_cache
+from .dictionary import load_dictionary
 
+# Number of distinct feedback patterns, encoded as base-3 integers
+PATTERN_COUNT = 3 ** config.WORD_LENGTH
 
-@lru_cache(maxsize=None)
+# Pattern code of a fully green (solved) guess
+ALL_GREEN_PATTERN = PATTERN_COUNT - 1
+
+# Number of guess rows computed per vectorized block in compute_feedback_batch
+_BATCH_CHUNK_SIZE = 512
+
+# Encoded configured dictionary, the default word ids of compute_feedback_batch
+_DEFAULT_LETTERS: Optional[np.ndarray] = None
+
+
+@bounded_cache('compute_feedback', config.FEEDBACK_CACHE_SIZE, config.FEEDBACK_CACHE_BYTES)
 def compute_feedback(guess: str, target: str) -> Tuple[int, ...]:
     """Compute Wordle feedback for a guess against a target word.
 
@@ -40,82 +55,129 @@ def compute_feedback(guess: str, target: str) -> Tuple[int, ...]:
     return tuple(feedback)
 
 
-@lru_cache(maxsize=None)
-def filter_candidates(candidates: Tuple[str, ...], guess: str, feedback: Tuple[int, ...]) -> Tuple[str, ...]:
+def encode_feedback(feedback: Tuple[int, ...]) -> int:
+    """Encode a feedback tuple as a base-3 pattern code.
+
+    Args:
+        feedback: Tuple of feedback values (2: green, 1: yellow, 0: gray)
+
+    Returns:
+        Pattern code with the first letter as the most significant digit
+    """
+    code = 0
+    for value in feedback:
+        code = code * 3 + value
+    return code
+
+
+def decode_pattern(pattern: int) -> Tuple[int, ...]:
+    """Decode a base-3 pattern code into a feedback tuple.
+
+    Args:
+        pattern: Pattern code produced by `encode_feedback`
+
+    Returns:
+        Tuple of feedback values (2: green, 1: yellow, 0: gray)
+    """
+    feedback = [0] * config.WORD_LENGTH
+    for i in range(config.WORD_LENGTH - 1, -1, -1):
+        pattern, feedback[i] = divmod(pattern, 3)
+    return tuple(feedback)
+
+
+@bounded_cache('filter_candidates', config.FILTER_CACHE_SIZE, config.FILTER_CACHE_BYTES)
+def filter_candidates(candidates: CandidateSet, guess: str, pattern: int) -> CandidateSet:
     """Filter the candidate words based on the feedback from a guess.
 
     Args:
-        candidates: List of possible target words
+        candidates: Set of possible target words
         guess: The word that was guessed
-        feedback: Tuple of feedback values (2: green, 1: yellow, 0: gray)
+        pattern: Feedback pattern code observed for the guess
 
     Returns:
-        Filtered list of candidates that match the feedback pattern
+        Candidates that would have produced the same feedback for the guess
+        (the guess itself excluded)
     """
-    filtered = []
-    guess = guess.lower()
-    gray_letters = {guess[i] for i, code in enumerate(feedback) if code == 0}
+    feedback_matrix = candidates.feedback_matrix
+    return candidates & feedback_matrix.consistent_words(
+        feedback_matrix.id_of(guess.lower()), pattern)
+
 
-    # remove letters that appear elsewhere as yellow or green
-    for i, code in enumerate(feedback):
-        # if letter is green/yellow somewhere else
-        if code > 0 and guess[i] in gray_letters:
-            gray_letters.remove(guess[i])  # it's not really "gray"
+def encode_words(words: List[str]) -> np.ndarray:
+    """Encode words as a (len(words), WORD_LENGTH) array of letter indices."""
+    raw = np.frombuffer("".join(words).encode('ascii'), dtype=np.uint8)
+    return (raw - ord('a')).reshape(len(words), config.WORD_LENGTH)
 
-    # filter words that contain any gray letters first
-    filtered_candidates = [word for word in candidates if word != guess and not any(
-        letter in gray_letters for letter in word)]
 
-    # now apply feedback checking
-    filtered = [word for word in filtered_candidates if matches_feedback(
-        word, guess, feedback)]
+def _default_letters() -> np.ndarray:
+    """Return the configured dictionary encoded by `encode_words`, loading it once."""
+    global _DEFAULT_LETTERS
+    if _DEFAULT_LETTERS is None:
+        _DEFAULT_LETTERS = encode_words(load_dictionary(config.DICTIONARY_PATH))
+    return _DEFAULT_LETTERS
 
-    return tuple(filtered)
 
+def compute_feedback_batch(guess_ids: np.ndarray, answer_ids: np.ndarray,
+                           letters: Optional[np.ndarray] = None) -> np.ndarray:
+    """Compute feedback pattern codes for many guesses against many targets.
 
-@lru_cache(maxsize=None)
-def matches_feedback(word: str, guess: str, feedback: Tuple[int, ...]) -> bool:
-    """Check if a word matches the feedback pattern from a guess.
+    Pattern codes are base-3 integers with the first letter as the most
+    significant digit (2 = green, 1 = yellow, 0 = gray), matching
+    `compute_feedback` including its repeated-letter handling.
 
     Args:
-        word: Word to check
-        guess: The guessed word
-        feedback: Tuple of feedback values
+        guess_ids: Ids of the guessed words (rows of `letters`)
+        answer_ids: Ids of the target words (rows of `letters`)
+        letters: Encoded dictionary from `encode_words` the ids index into;
+            defaults to the configured dictionary (`config.DICTIONARY_PATH`)
 
     Returns:
-        True if the word matches the feedback pattern
+        uint8 array of shape (len(guess_ids), len(answer_ids)) of pattern codes
     """
-    # Quick check: Correct positions (green) must match
-    for i, (letter, code) in enumerate(zip(guess, feedback)):
-        if code == 2 and word[i] != letter:
-            return False
-
-    # Count remaining letters for yellow checks
-    word_chars = Counter(word)
-    guess_chars = Counter()
-
-    # Remove green matches from counts
-    for i, (letter, code) in enumerate(zip(guess, feedback)):
-        if code == 2:
-            word_chars[letter] -= 1
-            if word_chars[letter] == 0:
-                del word_chars[letter]
-
-    # Check yellow positions and build guess character counts
-    for i, (letter, code) in enumerate(zip(guess, feedback)):
-        if code == 1:
-            guess_chars[letter] += 1
-            # Letter must exist in remaining word characters
-            if letter not in word_chars or word_chars[letter] < guess_chars[letter]:
-                return False
-
-            # Additional check: yellow letter should not be in the same position
-            if word[i] == letter:
-                return False
-        elif code == 0:
-            # If the letter was marked as gray, it shouldn't appear in remaining positions
-            # unless it appears elsewhere as yellow or green
-            if letter in word_chars and word_chars[letter] > guess_chars[letter]:
-                return False
-
-    return True
+    if letters is None:
+        letters = _default_letters()
+    guesses = letters[np.asarray(guess_ids)]
+    answers = letters[np.asarray(answer_ids)]
+    letter_counts = np.zeros((26, len(answers)), dtype=np.uint8)
+    for i in range(config.WORD_LENGTH):
+        np.add.at(letter_counts, (answers[:, i], np.arange(len(answers))), 1)
+
+    # Guesses that repeat letters in the same positions share the yellow
+    # bookkeeping, so each layout is computed with a fixed set of operations
+    same = guesses[:, :, None] == guesses[:, None, :]
+    layouts, layout_ids = np.unique(
+        same.reshape(len(guesses), -1), axis=0, return_inverse=True)
+
+    codes = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for layout_id, layout in enumerate(layouts):
+        rows = np.flatnonzero(layout_ids.ravel() == layout_id)
+        layout = layout.reshape(config.WORD_LENGTH, config.WORD_LENGTH)
+        for start in range(0, len(rows), _BATCH_CHUNK_SIZE):
+            chunk = rows[start:start + _BATCH_CHUNK_SIZE]
+            codes[chunk] = _layout_block(
+                guesses[chunk], answers, letter_counts, layout)
+    return codes
+
+
+def _layout_block(guesses: np.ndarray, answers: np.ndarray,
+                  letter_counts: np.ndarray, same: np.ndarray) -> np.ndarray:
+    """Feedback for guesses that all share one repeated-letter layout.
+
+    A non-green guess letter is yellow when the answer still has more unmatched
+    copies of it than the guess has already spent on earlier non-green
+    positions, which mirrors the two-pass logic of `compute_feedback`.
+    """
+    green = [guesses[:, i, None] == answers[None, :, i]
+             for i in range(config.WORD_LENGTH)]
+
+    codes = np.zeros((len(guesses), len(answers)), dtype=np.uint8)
+    for i in range(config.WORD_LENGTH):
+        available = letter_counts[guesses[:, i]]
+        spent = np.zeros_like(available)
+        for j in np.flatnonzero(same[i]):
+            available = available - green[j]
+            if j < i:
+                spent = spent + ~green[j]
+        yellow = ~green[i] & (spent < available)
+        codes = codes * 3 + np.where(green[i], 2, yellow).astype(np.uint8)
+    return codes
@@ -0,0 +1,336 @@
+"""
+Precomputed guess x answer feedback patterns for a dictionary.
+
+Every (guess, answer) pair is stored as a single base-3 pattern code in the
+range 0..3**WORD_LENGTH - 1, with the first letter as the most significant
+digit (gray=0, yellow=1, green=2).
+
+The matrix is persisted as a versioned binary artifact under `config.DATA_DIR`
+and memory-mapped read-only, so every worker process on a host shares the
+same physical pages. Build or verify it offline with:
+    python -m wordle_game.feedback_matrix build
+    python -m wordle_game.feedback_matrix verify
+"""
+
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import argparse
+import tempfile
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import config
+from .feedback import PATTERN_COUNT, compute_feedback_batch, encode_words
+from .dictionary import load_dictionary
+from .candidate_set import CandidateSet
+from .bounded_cache import BoundedCache
+
+# Artifact layout: fixed-size header followed by the raw row-major matrix
+ARTIFACT_MAGIC = b'WRDLFBMX'
+ARTIFACT_VERSION = 1
+_HEADER_FORMAT = '<8sIII32s'
+_HEADER_SIZE = 64
+
+# Matrices already loaded in this process, keyed by dictionary digest
+_MATRICES: Dict[str, 'FeedbackMatrix'] = {}
+
+# Masks of words consistent with a (guess, pattern), shared by all matrices
+_CONSISTENT_MASKS = BoundedCache(
+    'consistent_words', config.CONSISTENT_MASK_CACHE_SIZE,
+    config.CONSISTENT_MASK_CACHE_BYTES)
+
+
+class FeedbackMatrix:
+    """Lookup table of feedback pattern codes indexed by word id."""
+
+    def __init__(self, words: List[str], patterns: np.ndarray):
+        """Initialize the matrix.
+
+        Args:
+            words: Dictionary words; a word's id is its index in this list
+            patterns: uint8 array of shape (len(words), len(words)) where
+                patterns[guess_id, answer_id] is the pattern code
+        """
+        self.words = words
+        self.word_ids: Dict[str, int] = {
+            word: i for i, word in enumerate(words)}
+        self.digest = dictionary_digest(words)
+        self.letters = encode_words(words)
+        self.patterns = patterns
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def id_of(self, word: str) -> int:
+        """Return the id of a dictionary word."""
+        return self.word_ids[word]
+
+    def ids_of(self, words: Sequence[str]) -> np.ndarray:
+        """Return the ids of several dictionary words as an int array."""
+        return np.fromiter((self.word_ids[word] for word in words),
+                           dtype=np.int32, count=len(words))
+
+    def pattern(self, guess_id: int, answer_id: int) -> int:
+        """Return the pattern code for a single guess/answer pair."""
+        return int(self.patterns[guess_id, answer_id])
+
+    def row(self, guess_id: int, answer_ids: np.ndarray) -> np.ndarray:
+        """Return the pattern codes of one guess against many answers."""
+        return self.patterns[guess_id, answer_ids]
+
+    def partition_sizes(self, guess_id: int, answer_ids: np.ndarray) -> np.ndarray:
+        """Return how many answers fall into each pattern bucket for a guess.
+
+        Args:
+            guess_id: Id of the guessed word
+            answer_ids: Ids of the possible target words
+
+        Returns:
+            int array of length PATTERN_COUNT indexed by pattern code
+        """
+        return np.bincount(self.row(guess_id, answer_ids), minlength=PATTERN_COUNT)
+
+    def consistent_words(self, guess_id: int, pattern: int) -> CandidateSet:
+        """Return the words consistent with observing `pattern` for a guess.
+
+        The guess itself is excluded. Masks are computed once per
+        (guess, pattern) and kept in a bounded cache, so filtering a candidate
+        set is a single bitwise AND.
+
+        Args:
+            guess_id: Id of the guessed word
+            pattern: Pattern code observed for the guess
+
+        Returns:
+            CandidateSet of every dictionary word that yields `pattern`
+        """
+        key = (self.digest, guess_id, pattern)
+        mask = _CONSISTENT_MASKS.get(key)
+        if mask is None:
+            matches = self.patterns[guess_id] == pattern
+            matches[guess_id] = False
+            mask = CandidateSet.from_mask(self, matches)
+            _CONSISTENT_MASKS.put(key, mask)
+        return mask
+
+
+class FeedbackMatrixArtifactError(Exception):
+    """Raised when a feedback matrix artifact is missing, stale or corrupt."""
+    pass
+
+
+def dictionary_digest(words: List[str]) -> str:
+    """Return a stable digest identifying a word list and word length."""
+    content = f"{config.WORD_LENGTH}\n" + "\n".join(words)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def word_source(words: List[str], path: str) -> Union[str, List[str]]:
+    """Return what another process needs to load `words` itself.
+
+    Worker processes are started with this instead of the word list: the
+    file `path` when it holds exactly these words, or the words themselves
+    (e.g. for a custom dictionary) otherwise.
+    """
+    try:
+        if load_dictionary(path) == words:
+            return path
+    except (FileNotFoundError, ValueError):
+        pass
+    return list(words)
+
+
+def load_word_source(source: Union[str, List[str]], digest: str) -> List[str]:
+    """Load the words of a `word_source`, checking their dictionary digest.
+
+    Raises:
+        FeedbackMatrixArtifactError: If the words do not match the digest
+    """
+    from_file = isinstance(source, str)
+    words = load_dictionary(source) if from_file else source
+    if dictionary_digest(words) != digest:
+        raise FeedbackMatrixArtifactError(
+            f"{source if from_file else 'Word list'} does not match the dictionary")
+    return words
+
+
+def artifact_path(words: List[str]) -> str:
+    """Return the artifact path for a word list under `config.DATA_DIR`."""
+    digest = dictionary_digest(words)
+    return os.path.join(
+        config.DATA_DIR, f"feedback_matrix_v{ARTIFACT_VERSION}_{digest[:16]}.bin")
+
+
+def write_artifact(path: str, words: List[str], patterns: np.ndarray) -> None:
+    """Atomically write a pattern matrix artifact.
+
+    The file is written next to its destination and renamed into place, so
+    concurrent readers never observe a partially written matrix.
+
+    Args:
+        path: Destination path of the artifact
+        words: Dictionary words the matrix was built from
+        patterns: Pattern matrix for the words
+    """
+    header = struct.pack(
+        _HEADER_FORMAT, ARTIFACT_MAGIC, ARTIFACT_VERSION, config.WORD_LENGTH,
+        len(words), bytes.fromhex(dictionary_digest(words)))
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header.ljust(_HEADER_SIZE, b'\0'))
+            f.write(np.ascontiguousarray(patterns, dtype=np.uint8).tobytes())
+        # mkstemp creates the file owner-only; workers may run as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def open_artifact(path: str, words: List[str]) -> np.ndarray:
+    """Memory-map a pattern matrix artifact read-only.
+
+    Args:
+        path: Path of the artifact
+        words: Dictionary words the matrix is expected to match
+
+    Returns:
+        Read-only uint8 array of shape (len(words), len(words)) backed by the
+        shared file mapping
+
+    Raises:
+        FeedbackMatrixArtifactError: If the artifact does not match the words
+    """
+    return map_artifact(path, len(words), dictionary_digest(words))
+
+
+def map_artifact(path: str, count: int, digest: str) -> np.ndarray:
+    """Memory-map an artifact known only by its word count and digest.
+
+    Lets processes that never load the word list (such as scoring workers)
+    map the matrix with the same header checks as `open_artifact`.
+
+    Args:
+        path: Path of the artifact
+        count: Number of dictionary words
+        digest: `dictionary_digest` of the dictionary words
+
+    Returns:
+        Read-only uint8 array of shape (count, count)
+
+    Raises:
+        FeedbackMatrixArtifactError: If the artifact does not match
+    """
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapping) != _HEADER_SIZE + count * count:
+        mapping.close()
+        raise FeedbackMatrixArtifactError(
+            f"Feedback matrix artifact has unexpected size: {path}")
+
+    header = struct.unpack_from(_HEADER_FORMAT, mapping)
+    expected = (ARTIFACT_MAGIC, ARTIFACT_VERSION, config.WORD_LENGTH, count,
+                bytes.fromhex(digest))
+    if header != expected:
+        mapping.close()
+        raise FeedbackMatrixArtifactError(
+            f"Feedback matrix artifact does not match the dictionary: {path}")
+
+    return np.frombuffer(mapping, dtype=np.uint8, count=count * count,
+                         offset=_HEADER_SIZE).reshape(count, count)
+
+
+def build_patterns(words: List[str]) -> np.ndarray:
+    """Compute the full pattern matrix for a word list.
+
+    Args:
+        words: Dictionary words
+
+    Returns:
+        uint8 array of shape (len(words), len(words)) of pattern codes
+    """
+    letters = encode_words(words)
+    ids = np.arange(len(words))
+    return compute_feedback_batch(ids, ids, letters)
+
+
+def get_feedback_matrix(words: List[str]) -> FeedbackMatrix:
+    """Get the feedback matrix for a word list, building it at most once.
+
+    The matrix is cached in memory for the process. It is memory-mapped from
+    its artifact under `config.DATA_DIR`; if the artifact is missing or stale
+    it is rebuilt and written first.
+
+    Args:
+        words: Dictionary words
+
+    Returns:
+        The FeedbackMatrix for the word list
+    """
+    digest = dictionary_digest(words)
+    if digest in _MATRICES:
+        return _MATRICES[digest]
+
+    path = artifact_path(words)
+    try:
+        patterns = open_artifact(path, words)
+    except (FileNotFoundError, FeedbackMatrixArtifactError):
+        write_artifact(path, words, build_patterns(words))
+        patterns = open_artifact(path, words)
+
+    matrix = FeedbackMatrix(list(words), patterns)
+    _MATRICES[digest] = matrix
+    return matrix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build or verify the feedback matrix artifact for a dictionary."""
+    from .dictionary import load_dictionary
+
+    parser = argparse.ArgumentParser(
+        description="Build or verify the precomputed feedback matrix artifact.")
+    parser.add_argument('command', choices=['build', 'verify'])
+    parser.add_argument('--dictionary', default=config.DICTIONARY_PATH,
+                        help="Dictionary file (defaults to config.DICTIONARY_PATH)")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild even if a valid artifact already exists")
+    args = parser.parse_args(argv)
+
+    words = load_dictionary(args.dictionary)
+    path = artifact_path(words)
+
+    if args.command == 'build':
+        if not args.force:
+            try:
+                open_artifact(path, words)
+                print(f"Artifact already up to date: {path}")
+                return 0
+            except (FileNotFoundError, FeedbackMatrixArtifactError):
+                pass
+        write_artifact(path, words, build_patterns(words))
+        print(f"Wrote {len(words)}x{len(words)} feedback matrix to {path}")
+        return 0
+
+    try:
+        patterns = open_artifact(path, words)
+    except (FileNotFoundError, FeedbackMatrixArtifactError) as e:
+        print(f"Invalid artifact: {e}")
+        return 1
+    if not np.array_equal(patterns, build_patterns(words)):
+        print(f"Artifact contents do not match a fresh build: {path}")
+        return 1
+    print(f"Artifact verified: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Inverted letter/position index over a dictionary for constraint queries.
+
+Every lookup returns a CandidateSet, so a game history (summarized as a
+ConstraintState) compiles into a conjunction of constraints that resolves by
+intersecting bitsets instead of re-filtering the dictionary once per past
+guess.
+"""
+
+from functools import reduce
+from typing import Dict, List, Tuple
+
+import numpy as np
+import config
+from .candidate_set import CandidateSet
+from .feedback_matrix import FeedbackMatrix
+from .constraint_state import ConstraintState
+
+# Indexes already built in this process, keyed by dictionary digest
+_INDEXES: Dict[str, 'LetterIndex'] = {}
+
+
+class LetterIndex:
+    """Prebuilt bitsets of words by letter position and letter count."""
+
+    def __init__(self, feedback_matrix: FeedbackMatrix):
+        """Build the index.
+
+        Args:
+            feedback_matrix: Feedback matrix defining the dictionary word ids
+        """
+        self.feedback_matrix = feedback_matrix
+        self.all_words = CandidateSet.full(feedback_matrix)
+        letters = feedback_matrix.letters
+        counts = np.zeros((len(letters), 26), dtype=np.uint8)
+        for i in range(config.WORD_LENGTH):
+            np.add.at(counts, (np.arange(len(letters)), letters[:, i]), 1)
+
+        # _at_position[i][letter]: words with `letter` at position i
+        self._at_position = [
+            [CandidateSet.from_mask(feedback_matrix, letters[:, i] == letter)
+             for letter in range(26)]
+            for i in range(config.WORD_LENGTH)]
+        # _at_least[letter][k]: words containing `letter` at least k times
+        self._at_least = [
+            [CandidateSet.from_mask(feedback_matrix, counts[:, letter] >= k)
+             for k in range(config.WORD_LENGTH + 2)]
+            for letter in range(26)]
+
+    def with_letter_at(self, letter: str, position: int) -> CandidateSet:
+        """Words with `letter` at `position`."""
+        return self._at_position[position][_letter_id(letter)]
+
+    def without_letter_at(self, letter: str, position: int) -> CandidateSet:
+        """Words without `letter` at `position`."""
+        return self._complement(self.with_letter_at(letter, position))
+
+    def with_letter_count_at_least(self, letter: str, count: int) -> CandidateSet:
+        """Words containing `letter` at least `count` times."""
+        return self._at_least[_letter_id(letter)][min(count, config.WORD_LENGTH + 1)]
+
+    def with_letter_count_at_most(self, letter: str, count: int) -> CandidateSet:
+        """Words containing `letter` at most `count` times."""
+        return self._complement(self.with_letter_count_at_least(letter, count + 1))
+
+    def without_letter(self, letter: str) -> CandidateSet:
+        """Words not containing `letter`."""
+        return self.with_letter_count_at_most(letter, 0)
+
+    def compile_constraints(self, state: ConstraintState) -> List[CandidateSet]:
+        """Compile accumulated constraints into a conjunction of index lookups.
+
+        Args:
+            state: Constraints learned from past feedback
+
+        Returns:
+            CandidateSets whose intersection is the words satisfying `state`
+        """
+        terms = []
+        for i, letter in enumerate(state.greens):
+            if letter is not None:
+                terms.append(self.with_letter_at(letter, i))
+            for c in range(26):
+                if state.excluded[i] >> c & 1:
+                    terms.append(self._complement(self._at_position[i][c]))
+
+        for c in range(26):
+            if state.min_counts[c] > 0:
+                terms.append(self._at_least[c][state.min_counts[c]])
+            if state.max_counts[c] < config.WORD_LENGTH:
+                terms.append(self._complement(
+                    self._at_least[c][state.max_counts[c] + 1]))
+        return terms
+
+    def resolve(self, state: ConstraintState) -> CandidateSet:
+        """Return the words satisfying every constraint in `state`."""
+        return reduce(lambda a, b: a & b, self.compile_constraints(state), self.all_words)
+
+    def query(self, history: List[Tuple[str, int]]) -> CandidateSet:
+        """Return the words consistent with a whole game history.
+
+        Args:
+            history: List of (guess, pattern) pairs
+
+        Returns:
+            CandidateSet of the remaining candidates, excluding past guesses
+        """
+        guessed = CandidateSet.from_words(
+            self.feedback_matrix, [guess for guess, _ in history])
+        return self.resolve(ConstraintState.from_history(history)) - guessed
+
+    def _complement(self, words: CandidateSet) -> CandidateSet:
+        return self.all_words - words
+
+
+def _letter_id(letter: str) -> int:
+    return ord(letter) - ord('a')
+
+
+def get_letter_index(feedback_matrix: FeedbackMatrix) -> LetterIndex:
+    """Get the letter index for a feedback matrix, building it at most once."""
+    index = _INDEXES.get(feedback_matrix.digest)
+    if index is None:
+        index = LetterIndex(feedback_matrix)
+        _INDEXES[feedback_matrix.digest] = index
+    return index
@@ -0,0 +1,280 @@
+"""
+Precomputed solver hints for the opening turns of a game.
+
+Each solver always plays the same first word, so its second turn is one of at
+most 3**WORD_LENGTH candidate sets, and these are the largest and slowest
+sets to search. The opening book stores every solver's hint for each of those
+states (and optionally for every third-turn state after its own second
+guess), keyed by the candidate set's fingerprint, so the hint becomes a
+dictionary lookup. Each solver's hints record a digest of the settings they
+were built with (`BaseSolver.settings`); a solver configured differently
+finds no hints and searches as usual until the book is rebuilt.
+
+The book is a small versioned JSON file under `config.DATA_DIR`. Build it
+offline after the feedback matrix:
+    python -m wordle_game.opening_book build
+    python -m wordle_game.opening_book build --solvers greedy minimax_2 --turns 3
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import config
+from .feedback import ALL_GREEN_PATTERN, filter_candidates
+from .feedback_matrix import FeedbackMatrix, get_feedback_matrix
+from .candidate_set import CandidateSet
+
+BOOK_VERSION = 2
+
+# Books already loaded in this process, keyed by dictionary digest
+_BOOKS: Dict[str, 'OpeningBook'] = {}
+
+
+class OpeningBookError(Exception):
+    """Raised when an opening book file is missing, stale or corrupt."""
+    pass
+
+
+class OpeningBook:
+    """Hints per solver name, keyed by candidate set fingerprint."""
+
+    def __init__(self, feedback_matrix: FeedbackMatrix,
+                 hints: Optional[Dict[str, Dict[str, str]]] = None,
+                 settings: Optional[Dict[str, str]] = None):
+        """Initialize the book.
+
+        Args:
+            feedback_matrix: Feedback matrix defining the dictionary
+            hints: Mapping of solver name to {fingerprint: hint}
+            settings: Mapping of solver name to the `settings_digest` its
+                hints were built with
+        """
+        self.feedback_matrix = feedback_matrix
+        self.hints: Dict[str, Dict[str, str]] = hints or {}
+        self.settings: Dict[str, str] = settings or {}
+
+    def lookup(self, solver, candidates: List[str]) -> Optional[str]:
+        """Return the stored hint for a solver and candidate list, if any.
+
+        Hints built with other solver settings are ignored.
+        """
+        solver_hints = self.hints.get(solver.get_name())
+        if not solver_hints or not self.matches(solver):
+            return None
+        fingerprint = CandidateSet.from_words(
+            self.feedback_matrix, candidates).fingerprint
+        return solver_hints.get(fingerprint)
+
+    def matches(self, solver) -> bool:
+        """Whether the solver's hints were built with its current settings."""
+        return self.settings.get(solver.get_name()) == settings_digest(solver)
+
+    def add(self, solver, candidates: CandidateSet, hint: str) -> None:
+        """Store a solver's hint for a candidate set."""
+        name = solver.get_name()
+        self.settings[name] = settings_digest(solver)
+        self.hints.setdefault(name, {})[candidates.fingerprint] = hint
+
+    def discard(self, solver_name: str) -> None:
+        """Remove every hint of a solver."""
+        self.hints.pop(solver_name, None)
+        self.settings.pop(solver_name, None)
+
+    def solvers(self) -> List[str]:
+        """Return the names of the solvers with stored hints."""
+        return list(self.hints)
+
+    def __len__(self) -> int:
+        return sum(len(solver_hints) for solver_hints in self.hints.values())
+
+
+def settings_digest(solver) -> str:
+    """Return a digest of the settings determining a solver's guesses."""
+    content = json.dumps(solver.settings(), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def book_path(feedback_matrix: FeedbackMatrix) -> str:
+    """Return the opening book path for a dictionary under `config.DATA_DIR`."""
+    return os.path.join(
+        config.DATA_DIR,
+        f"opening_book_v{BOOK_VERSION}_{feedback_matrix.digest[:16]}.json")
+
+
+def write_book(path: str, book: OpeningBook) -> None:
+    """Atomically write an opening book file.
+
+    Args:
+        path: Destination path of the book
+        book: Book to write
+    """
+    content = {
+        'version': BOOK_VERSION,
+        'dictionary_digest': book.feedback_matrix.digest,
+        'settings': book.settings,
+        'hints': book.hints,
+    }
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(content, f, separators=(',', ':'), sort_keys=True)
+        # mkstemp creates the file owner-only; workers may run as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_book(path: str, feedback_matrix: FeedbackMatrix) -> OpeningBook:
+    """Load an opening book file.
+
+    Args:
+        path: Path of the book
+        feedback_matrix: Feedback matrix the book is expected to match
+
+    Returns:
+        The loaded OpeningBook
+
+    Raises:
+        OpeningBookError: If the book is unreadable or built for another
+            dictionary or book version
+    """
+    try:
+        with open(path) as f:
+            content = json.load(f)
+    except (OSError, ValueError) as e:
+        raise OpeningBookError(f"Cannot read opening book {path}: {e}") from e
+
+    if (content.get('version') != BOOK_VERSION
+            or content.get('dictionary_digest') != feedback_matrix.digest):
+        raise OpeningBookError(
+            f"Opening book does not match the dictionary: {path}")
+    return OpeningBook(feedback_matrix, content['hints'], content['settings'])
+
+
+def get_opening_book(feedback_matrix: FeedbackMatrix) -> OpeningBook:
+    """Get the opening book for a dictionary, loading it at most once.
+
+    A missing or stale book file yields an empty book, so hints fall back to
+    a normal search.
+    """
+    book = _BOOKS.get(feedback_matrix.digest)
+    if book is None:
+        try:
+            book = load_book(book_path(feedback_matrix), feedback_matrix)
+        except OpeningBookError:
+            book = OpeningBook(feedback_matrix)
+        _BOOKS[feedback_matrix.digest] = book
+    return book
+
+
+def _next_states(candidates: CandidateSet, guess: str) -> Iterator[CandidateSet]:
+    """Yield the candidate set left by each possible feedback for a guess."""
+    feedback_matrix = candidates.feedback_matrix
+    patterns = np.unique(feedback_matrix.row(
+        feedback_matrix.id_of(guess), candidates.ids()))
+    for pattern in patterns.tolist():
+        if pattern != ALL_GREEN_PATTERN:
+            yield filter_candidates(candidates, guess, pattern)
+
+
+def build_solver_hints(book: OpeningBook, solver, turns: int = 2,
+                       progress: Optional[Callable[[int], None]] = None) -> None:
+    """Add a solver's hints for every reachable opening state to the book.
+
+    Args:
+        book: Book to add the hints to
+        solver: Solver to compute hints with (its name keys the hints, and
+            hints it built earlier with other settings are replaced)
+        turns: Last turn to cover (2 = second guesses, 3 = also third guesses)
+        progress: Optional callback receiving the number of states solved
+    """
+    if not book.matches(solver):
+        book.discard(solver.get_name())
+    states = [(CandidateSet.full(book.feedback_matrix), solver.starting_word(), 1)]
+    solved = 0
+    while states:
+        candidates, guess, turn = states.pop()
+        for state in _next_states(candidates, guess):
+            # Two or fewer candidates are answered without any search
+            if len(state) <= 2:
+                continue
+            hint = solver.select_guess(state.words())
+            book.add(solver, state, hint)
+            solved += 1
+            if progress:
+                progress(solved)
+            if turn + 1 < turns:
+                states.append((state, hint, turn + 1))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build or inspect the opening book for a dictionary."""
+    from .dictionary import load_dictionary
+    # The solver package must be imported before the solver manager
+    from . import solver  # noqa: F401
+    from .solver_manager import SolverManager
+
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the precomputed opening book.")
+    parser.add_argument('command', choices=['build', 'info'])
+    parser.add_argument('--dictionary', default=config.DICTIONARY_PATH,
+                        help="Dictionary file (defaults to config.DICTIONARY_PATH)")
+    parser.add_argument('--solvers', nargs='+', default=['greedy'],
+                        help="Solver names to build hints for (default: greedy)")
+    parser.add_argument('--turns', type=int, choices=[2, 3], default=2,
+                        help="Last turn covered by the book (default: 2)")
+    args = parser.parse_args(argv)
+
+    words = load_dictionary(args.dictionary)
+    feedback_matrix = get_feedback_matrix(words)
+    path = book_path(feedback_matrix)
+
+    manager = SolverManager(words)
+    if args.command == 'info':
+        try:
+            book = load_book(path, feedback_matrix)
+        except OpeningBookError as e:
+            print(f"Invalid opening book: {e}")
+            return 1
+        for name in book.solvers():
+            try:
+                current = book.matches(manager.get_solver(name))
+            except ValueError:
+                current = False
+            status = '' if current else ' (stale: built with other settings)'
+            print(f"{name}: {len(book.hints[name])} states{status}")
+        return 0
+
+    # Extend an existing book so solvers can be built one at a time
+    try:
+        book = load_book(path, feedback_matrix)
+    except OpeningBookError:
+        book = OpeningBook(feedback_matrix)
+
+    for name in args.solvers:
+        solver = manager.get_solver(name)
+        book.discard(solver.get_name())
+        build_solver_hints(
+            book, solver, args.turns,
+            progress=lambda n: print(f"\r{solver.get_name()}: {n} states", end=''))
+        print()
+
+    write_book(path, book)
+    print(f"Wrote {len(book)} opening hints to {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 
 class BaseSolver(ABC):
@@ -17,6 +17,31 @@ class BaseSolver(ABC):
         """
         pass
 
+    def settings(self) -> Dict[str, Any]:
+        """Return the settings that determine this solver's guesses.
+
+        Precomputed hints (the opening book) are only used by a solver whose
+        settings match the ones they were built with.
+        """
+        return {}
+
+    def search_info(self) -> Dict[str, Any]:
+        """Return details of the last `select_guess` search (e.g. work done)."""
+        return {}
+
+    def observe_feedback(self, guess: str, pattern: int) -> None:
+        """Update any state carried between turns after a guess is played.
+
+        Whoever plays the game calls this after every guess (`AppSession`
+        does so through `SolverManager.observe_feedback`); a solver used
+        without it simply starts each turn from scratch.
+
+        Args:
+            guess: The word that was played
+            pattern: Feedback pattern code observed for the guess
+        """
+        pass
+
     @abstractmethod
     def starting_word(self) -> str:
         """Return the starting word for the solver."""
@@ -1,19 +1,43 @@
-from typing import List, Dict, Tuple
-import math
-from collections import defaultdict
+from typing import Any, Dict, List
+import numpy as np
 from .base_solver import BaseSolver
-from ..feedback import compute_feedback
+from .parallel_scoring import get_scoring_executor
+from ..feedback_matrix import get_feedback_matrix
+from ..candidate_set import CandidateSet
+from ..bounded_cache import BoundedCache
+import config
+
+# Guesses already chosen, shared by every GreedySolver in the process and
+# keyed by (dictionary digest, candidate set fingerprint, probe_guesses)
+_GUESS_MEMO = BoundedCache(
+    'greedy_guesses', config.GREEDY_MEMO_SIZE, config.GREEDY_MEMO_BYTES)
 
 
 class GreedySolver(BaseSolver):
     """A solver that uses information gain to select guesses."""
 
-    def __init__(self):
+    # Process-wide memo of selected guesses (exposes hit/miss counters)
+    memo = _GUESS_MEMO
+
+    def __init__(self, dictionary_words: List[str], probe_guesses: bool = config.GREEDY_PROBE_GUESSES):
+        """Initialize the solver.
+
+        Args:
+            dictionary_words: List of valid 5-letter words
+            probe_guesses: Whether to also consider non-candidate dictionary
+                words ("probes") that may split the candidates better
+        """
         self.made_guess = False
+        self.probe_guesses = probe_guesses
+        self.feedback_matrix = get_feedback_matrix(dictionary_words)
+        self.scoring = get_scoring_executor(self.feedback_matrix)
 
     def starting_word(self) -> str:
         return "tares"
 
+    def settings(self) -> Dict[str, Any]:
+        return {'probe_guesses': self.probe_guesses}
+
     def select_guess(self, candidates: List[str]) -> str:
         """Select a guess that maximizes expected information gain.
 
@@ -21,73 +45,71 @@ class GreedySolver(BaseSolver):
             candidates: List of currently valid candidate words
 
         The strategy:
-        1. For each possible guess, compute how it would partition the remaining candidates
-        2. Calculate the expected information gain from each partition
+        1. For every possible guess at once, build a histogram of how it would partition the remaining candidates
+        2. Calculate the expected information gain from each histogram
         3. Choose the guess that gives the highest expected information gain
 
+        The choice only depends on the set of candidates, so it is memoized
+        by the set's fingerprint and reused across solver instances.
+
         Returns:
             The word with highest expected information gain
         """
         if len(candidates) <= 2:
             return candidates[0]
 
-        best_score = float('-inf')
-        best_guess = None
-
-        # Consider all remaining candidates as possible guesses
-        for guess in candidates:
-            score = self._compute_expected_info_gain(guess, candidates)
-            if score > best_score:
-                best_score = score
-                best_guess = guess
+        candidate_ids = self.feedback_matrix.ids_of(candidates)
+        if not np.all(candidate_ids[1:] > candidate_ids[:-1]):
+            # Keep dictionary order so ties break the same way for any input
+            candidate_ids = np.sort(candidate_ids)
+            candidates = [self.feedback_matrix.words[i] for i in candidate_ids]
 
-        return best_guess if best_guess else candidates[0]
+        key = (self.feedback_matrix.digest,
+               CandidateSet.from_ids(self.feedback_matrix, candidate_ids).fingerprint,
+               self.probe_guesses)
+        guess = _GUESS_MEMO.get(key)
+        if guess is None:
+            guess = self._score_guesses(candidates, candidate_ids)
+            _GUESS_MEMO.put(key, guess)
+        return guess
 
-    def _compute_expected_info_gain(self, guess: str, candidates: List[str]) -> float:
-        """Compute the expected information gain for a guess.
+    def _score_guesses(self, candidates: List[str], candidate_ids: np.ndarray) -> str:
+        """Score the possible guesses and return the best one.
 
         Args:
-            guess: The word to evaluate
-            candidates: List of currently valid candidate words
+            candidates: List of currently valid candidate words, in dictionary order
+            candidate_ids: Ids of the candidate words
 
         Returns:
-            Expected information gain (in bits)
+            The word with highest expected information gain
         """
-        # Get the current entropy (before guess)
-        initial_entropy = math.log2(len(candidates))
-
-        # Compute partitions for this guess
-        partitions = self._compute_partitions(guess, candidates)
-
-        # Compute expected entropy after guess
-        total_words = len(candidates)
-        expected_entropy = 0.0
+        if self.probe_guesses:
+            return self._select_probe_guess(candidates, candidate_ids)
 
-        for feedback_pattern, words in partitions.items():
-            prob = len(words) / total_words
-            if prob > 0:
-                expected_entropy += prob * math.log2(len(words))
+        # Consider all remaining candidates as possible guesses; the ranking
+        # keeps the first candidate among equal scores
+        ranking = self.scoring.rank_by_information_gain(candidate_ids, candidate_ids)
+        return candidates[int(ranking[0])]
 
-        # Information gain is reduction in entropy
-        return initial_entropy - expected_entropy
-
-    def _compute_partitions(self, guess: str, candidates: List[str]) -> Dict[Tuple[int, ...], List[str]]:
-        """Compute how a guess would partition the remaining candidates.
+    def _select_probe_guess(self, candidates: List[str], candidate_ids: np.ndarray) -> str:
+        """Select the best guess from the whole dictionary.
 
         Args:
-            guess: The word to evaluate
             candidates: List of currently valid candidate words
+            candidate_ids: Ids of the candidate words
 
         Returns:
-            Dictionary mapping feedback patterns to lists of matching words
+            The highest scoring word, preferring a candidate (which could win
+            immediately) over a probe with the same score
         """
-        partitions = defaultdict(list)
-
-        for word in candidates:
-            feedback = compute_feedback(guess, word)
-            partitions[feedback].append(word)
-
-        return dict(partitions)
+        guess_ids = np.arange(len(self.feedback_matrix))
+        scores = self.scoring.expected_information_gain(guess_ids, candidate_ids)
+        best = np.isclose(scores, scores.max(), rtol=0, atol=1e-9)
+
+        best_candidates = best[candidate_ids]
+        if best_candidates.any():
+            return candidates[int(np.argmax(best_candidates))]
+        return self.feedback_matrix.words[int(np.argmax(best))]
 
     @classmethod
     def get_name(cls) -> str:
@@ -43,8 +43,9 @@ class MCTSSolverOptimizer:
 
             # Play game
             while not game.is_game_over():
-                guess = solver.select_guess(game.candidate_words)
-                game.submit_guess(guess)
+                guess = solver.select_guess(game.get_remaining_candidates())
+                pattern, _ = game.submit_guess(guess)
+                solver.observe_feedback(guess, pattern)
 
             # Calculate score components
             total_guesses += game.guess_count
@@ -1,64 +1,42 @@
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+import time
+import threading
+import uuid
 import random
 import math
 
-from ..wordle_game import WordleGame
+import numpy as np
+
 from .base_solver import BaseSolver
-from ..feedback import compute_feedback, filter_candidates
+from .parallel_mcts import get_root_parallel_pool
+from .mcts_tree import ROOT, MCTSTree
+from ..feedback_matrix import dictionary_digest, get_feedback_matrix
+from ..candidate_set import CandidateSet
+from ..bounded_cache import BoundedCache, approximate_size
 import config
 
 
-class MCTSNode:
-    """Node in the Monte Carlo Tree Search with candidate set state."""
-
-    def __init__(self, candidate_set: List[str], guess: Optional[str] = None, parent: Optional['MCTSNode'] = None):
-        self.candidate_set = candidate_set  # Current valid words given past feedback
-        self.guess = guess
-        self.parent = parent
-        # Use a composite key (guess, feedback) to avoid collisions when feedbacks match
-        self.children: Dict[Tuple[str, Tuple[int, ...]], 'MCTSNode'] = {}
-        self.visits = 0
-        self.value = 0.0
-        self.untried_moves: List[str] = candidate_set.copy()
-        self.made_guess = False
-
-    def add_child(self, feedback: Tuple[int, ...], guess: str) -> 'MCTSNode':
-        """Add a child node with updated candidate set based on feedback.
-
-        Args:
-            feedback: Tuple of ints representing the feedback for the guess
-            guess: The guess that was made
-
-        Returns:
-            The child node that was added
-        """
-        new_candidates = list(filter_candidates(
-            tuple(self.candidate_set), guess, feedback))
-        node = MCTSNode(candidate_set=new_candidates, guess=guess, parent=self)
-        self.children[(guess, feedback)] = node
-        return node
+def _tree_size(obj: Any) -> int:
+    """Approximate the memory held by a retained tree (or its cache key) in bytes."""
+    return obj.nbytes() if isinstance(obj, MCTSTree) else approximate_size(obj)
 
-    def update(self, result: float):
-        """Update node statistics.
 
-        Args:
-            result: The result of the simulation
-        """
-        self.visits += 1
-        self.value += result
+# Search trees kept between turns, one per solver (i.e. per game session),
+# keyed by the solver's tree key
+_RETAINED_TREES = BoundedCache(
+    'mcts_trees', config.MCTS_TREE_CACHE_SIZE, config.MCTS_TREE_CACHE_BYTES,
+    sizeof=_tree_size)
 
-    def get_ucb(self, exploration_constant: float) -> float:
-        """Get the UCB1 value for this node.
+# Played moves found in a retained tree (or not), and the simulations their
+# subtrees carried into the next search
+_REUSE_STATS = {'reroots': 0, 'reroot_misses': 0, 'simulations_reused': 0}
+_REUSE_STATS_LOCK = threading.Lock()
 
-        Args:
-            exploration_constant: Controls exploration vs exploitation tradeoff
 
-        Returns:
-            The UCB1 value for this node
-        """
-        if self.visits == 0:
-            return float('inf')
-        return (self.value / self.visits) + exploration_constant * math.sqrt(math.log(self.parent.visits) / self.visits)
+def _count_reuse(stat: str, amount: int = 1) -> None:
+    """Add to a tree reuse counter (requests are served on several threads)."""
+    with _REUSE_STATS_LOCK:
+        _REUSE_STATS[stat] += amount
 
 
 class MCTSSolver(BaseSolver):
@@ -67,7 +45,12 @@ class MCTSSolver(BaseSolver):
     def __init__(self, dictionary_words: List[str], ordered_words: List[str],
                  simulations: int = config.MCTS_SIMULATIONS,
                  exploration_constant: float = config.MCTS_EXPLORATION_CONSTANT,
-                 reward_multiplier: float = config.MCTS_REWARD_MULTIPLIER):
+                 reward_multiplier: float = config.MCTS_REWARD_MULTIPLIER,
+                 reuse_tree: bool = config.MCTS_REUSE_TREE,
+                 root_workers: int = config.MCTS_ROOT_WORKERS,
+                 time_budget: Optional[float] = None,
+                 transpositions: bool = config.MCTS_TRANSPOSITIONS,
+                 outcome_search: bool = config.MCTS_OUTCOME_SEARCH):
         """Initialize the solver.
 
         Args:
@@ -76,12 +59,38 @@ class MCTSSolver(BaseSolver):
             simulations: Number of MCTS simulations to run
             exploration_constant: Controls exploration vs exploitation in UCB1
             reward_multiplier: Scales the reward values
+            reuse_tree: Keep the search tree between turns and continue from
+                the subtree of the move actually played
+            root_workers: Worker processes each growing an independent tree
+                with a share of the simulations (0 or 1 searches serially);
+                trees are not kept between turns in parallel mode
+            time_budget: Optional seconds per guess; when set, simulations
+                run until the budget is spent or the best move converges
+                instead of a fixed `simulations` count
+            transpositions: Share one node (and its statistics) between move
+                sequences reaching the same candidates at the same depth
+            outcome_search: Draw simulated targets from the root's candidates
+                and follow (or expand) the outcome each one gives, instead of
+                drawing them from the top ordered words and following the
+                outcome a move was expanded with
         """
         self.dictionary = dictionary_words
+        self.feedback_matrix = get_feedback_matrix(dictionary_words)
         self.simulations = simulations
         self.ordered_words = ordered_words
+        self.word_ranks = self._rank_words(ordered_words)
+        self._order_digest = dictionary_digest(ordered_words)
         self.exploration_constant = exploration_constant
         self.reward_multiplier = reward_multiplier
+        self.reuse_tree = reuse_tree
+        self._tree_key = uuid.uuid4().hex
+        self.root_parallel = get_root_parallel_pool(
+            self.feedback_matrix, ordered_words, root_workers)
+        self.time_budget = time_budget
+        self.transpositions = transpositions
+        self.outcome_search = outcome_search
+        # Simulations run by the last search
+        self.playouts = 0
 
     def starting_word(self) -> str:
         return "crate"
@@ -95,65 +104,247 @@ class MCTSSolver(BaseSolver):
         Returns:
             The most promising word according to MCTS
         """
+        self.playouts = 0
         if len(candidates) == 1:
             return candidates[0]
 
-        # Initialize root node with full candidate set
-        root = MCTSNode(candidate_set=candidates.copy())
+        deadline = None if self.time_budget is None \
+            else time.perf_counter() + self.time_budget
+        simulations = self.simulations if deadline is None else None
+
+        candidate_set = CandidateSet.from_words(self.feedback_matrix, candidates)
+        if self.root_parallel.is_parallel():
+            statistics, self.playouts = self.root_parallel.search(
+                self, candidate_set.ids(), simulations, deadline)
+            if not statistics:
+                return candidates[0]
+            # Choose best move by visits summed over the workers' trees
+            guess_id = max(statistics, key=lambda key: statistics[key][0])
+            return self.feedback_matrix.words[guess_id]
+
+        # Continue the retained tree if it was re-rooted at this state,
+        # otherwise initialize root node with full candidate set
+        tree = _RETAINED_TREES.get(self._tree_key) if self.reuse_tree else None
+        if tree is not None and tree.candidates(ROOT) == candidate_set:
+            _count_reuse('simulations_reused', tree.visits[ROOT])
+        else:
+            tree = self._new_tree(candidate_set)
+
+        self.playouts = self._run_simulations(tree, simulations, deadline=deadline)
+
+        if self.reuse_tree:
+            _RETAINED_TREES.put(self._tree_key, tree)
 
-        # Run simulations
-        for _ in range(self.simulations):
-            node = root
-            curr_guesses = 0
-            target_word = random.choice(self.ordered_words[:15])
-
-            # Selection
-            while not node.untried_moves and node.children:
-                node = self._select_ucb(node)
-                curr_guesses += 1
+        # Choose best move
+        if not tree.has_actions(ROOT):
+            return candidates[0]
+        best = max(tree.actions(ROOT), key=lambda action: tree.action_visits[action])
+        return self.feedback_matrix.words[tree.action_guess[best]]
 
-            # Expansion
-            if node.untried_moves:
-                guess = self._rollout(node.untried_moves)
-                if guess is None:
-                    continue  # Skip expansion if no valid guess exists
+    def _new_tree(self, candidates: CandidateSet) -> MCTSTree:
+        """Create a search tree rooted at a candidate set."""
+        return MCTSTree(candidates, self.word_ranks, len(self.ordered_words),
+                        self.transpositions)
 
-                node.untried_moves.remove(guess)
-                curr_guesses += 1
-                feedback = compute_feedback(guess, target_word)
-                node = node.add_child(feedback, guess)
+    def _run_simulations(self, tree: MCTSTree, simulations: Optional[int],
+                         rng: Optional[random.Random] = None,
+                         deadline: Optional[float] = None) -> int:
+        """Grow a search tree by running simulations from its root.
 
-            # Simulation
-            reward = self._simulate(
-                node.candidate_set, target_word, curr_guesses)
+        Args:
+            tree: Search tree to grow
+            simulations: Number of simulations to run, or None to run until
+                the deadline passes or the root's best move converges
+            rng: Random generator choosing the simulated targets (defaults to
+                the `random` module's global generator)
+            deadline: Optional `time.perf_counter()` value after which no
+                more simulations are started
 
-            # Backpropagation
-            while node is not None:
-                node.update(reward)
-                node = node.parent
+        Returns:
+            The number of simulations run
+        """
+        choose = (rng or random).choice
+        targets = tree.candidates(ROOT).words() if self.outcome_search \
+            else self.ordered_words[:15]
+        playouts = 0
+        leader, stable_checks = None, 0
+        while simulations is None or playouts < simulations:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            if simulations is None and playouts and \
+                    playouts % config.MCTS_CONVERGENCE_INTERVAL == 0:
+                previous = leader
+                leader = self._leader(tree)
+                stable_checks = stable_checks + 1 if self._is_stable(previous, leader) else 0
+                if stable_checks >= config.MCTS_CONVERGENCE_CHECKS:
+                    break
+            self._playout(tree, choose(targets))
+            playouts += 1
+        return playouts
+
+    def _playout(self, tree: MCTSTree, target_word: str) -> None:
+        """Run one selection, expansion, simulation and backpropagation pass.
 
-        # Choose best move
-        best_child = max(root.children.values(),
-                         key=lambda child: child.visits)
-        return best_child.guess if best_child.guess is not None else candidates[0]
+        Args:
+            tree: Search tree to grow
+            target_word: The target word to simulate
+        """
+        node = ROOT
+        target_id = self.feedback_matrix.id_of(target_word)
+        # Edges taken from the root; a node can have several parents, so
+        # results are backpropagated along this path only
+        path = []
+
+        while True:
+            # Expansion: try the node's next untried move
+            if tree.has_untried(node):
+                guess_id = tree.next_move(node)
+                if guess_id is None:
+                    return  # Skip expansion if no valid guess exists
+
+                tree.mark_tried(node)
+                action = tree.add_action(node, guess_id)
+                edge = tree.add_outcome(
+                    action, self.feedback_matrix.pattern(guess_id, target_id))
+                path.append(edge)
+                node = tree.edge_child[edge]
+                break
+            if not tree.has_actions(node):
+                break
+
+            # Selection: follow the outcome the move was expanded with, or
+            # with outcome search the one the target gives, expanding it if
+            # this pattern was not seen before
+            action = self._select_ucb(tree, node)
+            expanded = False
+            if self.outcome_search:
+                pattern = self.feedback_matrix.pattern(tree.action_guess[action], target_id)
+                edge = tree.outcome(action, pattern)
+                expanded = edge is None
+                if expanded:
+                    edge = tree.add_outcome(action, pattern)
+            else:
+                edge = tree.first_edge[action]
+            path.append(edge)
+            node = tree.edge_child[edge]
+            if expanded:
+                break
+
+        # Simulation
+        reward = self._simulate(
+            tree.candidates(node), target_word, len(path))
+
+        # Backpropagation
+        tree.backpropagate(path, reward)
+
+    @staticmethod
+    def _leader(tree: MCTSTree) -> Optional[Tuple[int, float]]:
+        """Return the most visited root move and its share of the root's visits."""
+        if not tree.has_actions(ROOT) or not tree.visits[ROOT]:
+            return None
+        action = max(tree.actions(ROOT), key=lambda action: tree.action_visits[action])
+        return action, tree.action_visits[action] / tree.visits[ROOT]
+
+    @staticmethod
+    def _is_stable(previous: Optional[Tuple[int, float]],
+                   current: Optional[Tuple[int, float]]) -> bool:
+        """Whether the leading child and its visit share held between two checks."""
+        return previous is not None and current is not None \
+            and previous[0] == current[0] \
+            and abs(previous[1] - current[1]) <= config.MCTS_CONVERGENCE_TOLERANCE
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            'simulations': self.simulations,
+            'exploration_constant': self.exploration_constant,
+            'reward_multiplier': self.reward_multiplier,
+            'reuse_tree': self.reuse_tree,
+            'transpositions': self.transpositions,
+            'outcome_search': self.outcome_search,
+            'time_budget': self.time_budget,
+            'root_workers': self.root_parallel.workers,
+            'root_seed': self.root_parallel.seed,
+            'ordered_words': self._order_digest,
+        }
+
+    def search_info(self) -> Dict[str, Any]:
+        return {'playouts': self.playouts}
+
+    def observe_feedback(self, guess: str, pattern: int) -> None:
+        """Re-root the retained tree at the candidates left by the played move.
+
+        The new root is the node one move below the old root holding exactly
+        the remaining candidates, whichever simulated move and pattern
+        reached it (with transpositions several can).
 
-    def _select_ucb(self, node: MCTSNode) -> MCTSNode:
-        """Select a child node using UCB1.
+        Args:
+            guess: The word that was played
+            pattern: Feedback pattern code observed for the guess
+        """
+        tree = _RETAINED_TREES.pop(self._tree_key)
+        if tree is None:
+            return
+
+        guess_id = self.feedback_matrix.word_ids.get(guess)
+        node = None
+        if guess_id is not None:
+            remaining = tree.candidates(ROOT) & \
+                self.feedback_matrix.consistent_words(guess_id, pattern)
+            node = tree.node_of(remaining, 1)
+        if node is None:
+            _count_reuse('reroot_misses')
+            return
+
+        _count_reuse('reroots')
+        _RETAINED_TREES.put(self._tree_key, tree.subtree(node))
+
+    @staticmethod
+    def reuse_stats() -> Dict[str, Any]:
+        """Return retained tree cache counters and the re-rooting hit rate."""
+        with _REUSE_STATS_LOCK:
+            reuse_stats = dict(_REUSE_STATS)
+        attempts = reuse_stats['reroots'] + reuse_stats['reroot_misses']
+        return {
+            **_RETAINED_TREES.stats(),
+            **reuse_stats,
+            'reroot_rate': reuse_stats['reroots'] / attempts if attempts else 0.0
+        }
+
+    def _select_ucb(self, tree: MCTSTree, node: int) -> int:
+        """Select a move using UCB1 adapted for a DAG.
+
+        The value term is the move's mean over the (possibly shared) nodes it
+        leads to, while the exploration term counts only the simulations that
+        chose this move here, since a shared node can be visited more often
+        than its parents. In a plain tree both match standard UCB1.
 
         Args:
-            node: The node to select a child from
+            tree: Search tree holding the node
+            node: The node to select a move from
 
         Returns:
-            The child node with the highest UCB1 value
+            The move with the highest UCB1 value
         """
-        return max(node.children.values(),
-                   key=lambda child: child.get_ucb(self.exploration_constant))
+        action_visits = tree.action_visits
+        log_parent_visits = math.log(tree.visits[node])
 
-    def _simulate(self, candidates: List[str], target_word: str, curr_guesses: int = 0) -> float:
+        def ucb(action: int) -> float:
+            if action_visits[action] == 0:
+                return float('inf')
+            return tree.action_mean(action) + self.exploration_constant * \
+                math.sqrt(log_parent_visits / action_visits[action])
+
+        return max(tree.actions(node), key=ucb)
+
+    def _simulate(self, candidates: CandidateSet, target_word: str, curr_guesses: int = 0) -> float:
         """Run a random simulation from the current node.
 
+        The playout works on candidate ids and pattern codes directly: each
+        guess keeps the candidates whose pattern matches the target's, as
+        `WordleGame.submit_guess` would, without building a game.
+
         Args:
-            candidates: List of currently valid words
+            candidates: Set of currently valid words
             target_word: The target word to simulate
             curr_guesses: The number of guesses made so far
 
@@ -164,39 +355,63 @@ class MCTSSolver(BaseSolver):
             return 0.0
 
         # Adjust remaining guesses to account for moves already made
-        remaining_guesses = config.MAX_GUESSES - curr_guesses
-        simulation = WordleGame(
-            self.dictionary, remaining_guesses, target_word)
-        simulation.candidate_words = list(candidates)
+        max_guesses = config.MAX_GUESSES - curr_guesses
+        target_id = self.feedback_matrix.id_of(target_word)
+        candidate_ids = candidates.ids()
 
         # Run the simulation
-        while not simulation.is_game_over():
-            guess = self._rollout(simulation.candidate_words)
-            if guess is None:
+        for guess_count in range(1, max_guesses + 1):
+            guess_id = self._rollout_id(candidate_ids)
+            if guess_id is None:
                 return -1 * self.reward_multiplier
 
-            simulation.submit_guess(guess)
+            # Compute the reward based on remaining guesses if the game is won
+            if guess_id == target_id:
+                return (1 - guess_count / max_guesses) * self.reward_multiplier
+
+            # not all green, so the guess itself is filtered out too
+            patterns = self.feedback_matrix.row(guess_id, candidate_ids)
+            candidate_ids = candidate_ids[
+                patterns == self.feedback_matrix.pattern(guess_id, target_id)]
 
-        # Compute the reward based on remaining guesses if the game is won
-        reward = (1 - simulation.guess_count /
-                  simulation.max_guesses) if simulation.game_won else 0
-        return reward * self.reward_multiplier
+        return 0.0
 
-    def _rollout(self, candidates: List[str]) -> Optional[str]:
-        """Return the best guess from the remaining candidates in the sorted word list.
+    def _rank_words(self, ordered_words: List[str]) -> np.ndarray:
+        """Map each word id to its position in the heuristic ordering.
 
         Args:
-            candidates: List of currently valid words
+            ordered_words: List of words ordered by heuristic value
 
         Returns:
-            The best guess from the remaining candidates
+            int array indexed by word id; words missing from the ordering get
+            len(ordered_words)
         """
-        # Return most optimal word in heuristic ordering
-        for word in self.ordered_words:
-            if word in candidates:
-                return word
+        ranks = np.full(len(self.feedback_matrix), len(ordered_words), dtype=np.int32)
+        # reversed so a word listed twice keeps its first (best) rank
+        for rank in range(len(ordered_words) - 1, -1, -1):
+            word_id = self.feedback_matrix.word_ids.get(ordered_words[rank])
+            if word_id is not None:
+                ranks[word_id] = rank
+        return ranks
+
+    def _rollout_id(self, candidate_ids: np.ndarray) -> Optional[int]:
+        """Return the id of the candidate ranked best by the heuristic ordering.
+
+        Args:
+            candidate_ids: Ids of the currently valid words
 
-        return None
+        Returns:
+            The best candidate's id, or None if no candidate is ranked
+        """
+        if len(candidate_ids) == 0:
+            return None
+
+        # Return most optimal word in heuristic ordering
+        ranks = self.word_ranks[candidate_ids]
+        best = int(ranks.argmin())
+        if ranks[best] == len(self.ordered_words):
+            return None
+        return int(candidate_ids[best])
 
     @classmethod
     def get_name(cls) -> str:
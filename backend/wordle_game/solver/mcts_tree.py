@@ -0,0 +1,373 @@
+"""
+Array-backed Monte Carlo search trees.
+
+A tree stores its nodes, moves and outcome edges as parallel `array.array`
+columns indexed by id instead of one Python object per node, which keeps
+memory and garbage collector work flat as simulations grow.
+
+- Nodes hold a candidate state, its depth below the root, an untried-move
+  cursor and the statistics of every simulation through them.
+- Moves (actions) hold a guess tried at a node and the statistics of the
+  simulations that chose it there.
+- Edges hold one feedback pattern observed for a move and lead to the node
+  of the candidates that pattern leaves. A move is expanded with the pattern
+  of the target simulated through it first; further outcomes can be added.
+
+Different move orders often leave exactly the same candidates (guessing A
+then B, or B then A). With transpositions enabled those paths share one node
+per (candidate state, depth), so the tree becomes a DAG: the shared node is
+expanded and filtered once, and its value averages every simulation that
+reached it. The depth is part of the key because a simulation's reward
+depends on the guesses already used.
+
+Candidate sets are interned by fingerprint, so nodes reaching the same set
+share one CandidateSet, and the state a guess and pattern lead to is memoized
+per state, so each transition is filtered once however many nodes take it. A
+node's untried moves are never materialized: moves
+are tried in heuristic rank order, so each state keeps its ranked candidate
+ids once and a node only tracks a cursor into them.
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from ..candidate_set import CandidateSet
+
+# Id of the root node of every tree
+ROOT = 0
+
+_NODE_COLUMNS = ('visits', 'value', 'state', 'depth', 'cursor', 'first_action', 'last_action')
+_ACTION_COLUMNS = ('action_node', 'action_guess', 'action_visits', 'action_value',
+                   'first_edge', 'next_action')
+_EDGE_COLUMNS = ('edge_action', 'edge_child', 'edge_pattern', 'edge_visits', 'next_edge')
+
+
+def _table_nbytes(table: dict) -> int:
+    """Approximate bytes of a lookup table and its keys (values not included)."""
+    total = sys.getsizeof(table)
+    for key in table:
+        total += sys.getsizeof(key)
+        if isinstance(key, tuple):
+            total += sum(sys.getsizeof(part) for part in key)
+    return total
+
+
+class MCTSTree:
+    """Search tree (a DAG with transpositions) held in parallel arrays."""
+
+    def __init__(self, root_candidates: CandidateSet, word_ranks: np.ndarray, unranked: int,
+                 transpositions: bool = True):
+        """Initialize a tree holding only the root.
+
+        Args:
+            root_candidates: Candidate words at the root
+            word_ranks: Heuristic rank of each word id
+            unranked: Rank given to words missing from the heuristic ordering;
+                they are never tried as moves
+            transpositions: Share one node between moves reaching the same
+                candidates at the same depth
+        """
+        self._init_storage(word_ranks, unranked, transpositions)
+        self._add_node(self._intern(root_candidates), 0)
+
+    def _init_storage(self, word_ranks: np.ndarray, unranked: int,
+                      transpositions: bool) -> None:
+        """Create the empty columns and lookup tables."""
+        self.word_ranks = word_ranks
+        self.unranked = unranked
+        self.transpositions = transpositions
+        # Outcomes that led to an existing node instead of a new one, and
+        # candidate filters computed (the rest were memoized transitions)
+        self.merged = 0
+        self.filters = 0
+
+        # Interned candidate sets, their sizes and (lazily) their ranked moves
+        self.states: List[CandidateSet] = []
+        self.state_sizes = array('q')
+        self._state_ids: Dict[str, int] = {}
+        self._ranked_moves: Dict[int, array] = {}
+        # (state, depth) -> node, when merging transpositions
+        self._nodes: Dict[Tuple[int, int], int] = {}
+        # (state, guess id, pattern) -> resulting state
+        self._transitions: Dict[Tuple[int, int, int], int] = {}
+
+        self.visits = array('q')
+        self.value = array('d')
+        self.state = array('q')
+        self.depth = array('q')
+        self.cursor = array('q')
+        self.first_action = array('q')
+        self.last_action = array('q')
+
+        self.action_node = array('q')
+        self.action_guess = array('q')
+        self.action_visits = array('q')
+        self.action_value = array('d')
+        self.first_edge = array('q')
+        self.next_action = array('q')
+
+        self.edge_action = array('q')
+        self.edge_child = array('q')
+        self.edge_pattern = array('q')
+        self.edge_visits = array('q')
+        self.next_edge = array('q')
+
+    def _intern(self, candidates: CandidateSet) -> int:
+        """Return the state id of a candidate set, adding it if new."""
+        fingerprint = candidates.fingerprint
+        state = self._state_ids.get(fingerprint)
+        if state is None:
+            state = len(self.states)
+            self.states.append(candidates)
+            self.state_sizes.append(len(candidates))
+            self._state_ids[fingerprint] = state
+        return state
+
+    def _add_node(self, state: int, depth: int) -> int:
+        """Append a node without any moves."""
+        node = len(self.visits)
+        self.visits.append(0)
+        self.value.append(0.0)
+        self.state.append(state)
+        self.depth.append(depth)
+        self.cursor.append(0)
+        self.first_action.append(-1)
+        self.last_action.append(-1)
+        if self.transpositions:
+            self._nodes[(state, depth)] = node
+        return node
+
+    def add_action(self, node: int, guess_id: int) -> int:
+        """Add a move guessing a word at a node, after its existing moves.
+
+        Returns:
+            The new move's id
+        """
+        action = len(self.action_node)
+        self.action_node.append(node)
+        self.action_guess.append(guess_id)
+        self.action_visits.append(0)
+        self.action_value.append(0.0)
+        self.first_edge.append(-1)
+        self.next_action.append(-1)
+
+        if self.first_action[node] < 0:
+            self.first_action[node] = action
+        else:
+            self.next_action[self.last_action[node]] = action
+        self.last_action[node] = action
+        return action
+
+    def _add_edge(self, action: int, child: int, pattern: int) -> int:
+        """Append an outcome edge, linking it first among the move's edges."""
+        edge = len(self.edge_action)
+        self.edge_action.append(action)
+        self.edge_child.append(child)
+        self.edge_pattern.append(pattern)
+        self.edge_visits.append(0)
+        self.next_edge.append(self.first_edge[action])
+        self.first_edge[action] = edge
+        return edge
+
+    def add_outcome(self, action: int, pattern: int) -> int:
+        """Add the outcome of a move for a feedback pattern.
+
+        The outcome leads to the existing node for the resulting candidates
+        and depth when transpositions are merged, and to a new node otherwise.
+        The resulting state is memoized per (state, guess, pattern), so a
+        transition already seen from another node is not filtered again.
+
+        Args:
+            action: Move id
+            pattern: Feedback pattern code for the move's guess
+
+        Returns:
+            The new edge's id
+        """
+        node = self.action_node[action]
+        guess_id = self.action_guess[action]
+        transition = (self.state[node], guess_id, pattern)
+        state = self._transitions.get(transition)
+        if state is None:
+            candidates = self.states[self.state[node]]
+            state = self._intern(candidates & candidates.feedback_matrix.consistent_words(
+                guess_id, pattern))
+            self._transitions[transition] = state
+            self.filters += 1
+        depth = self.depth[node] + 1
+        child = self._nodes.get((state, depth)) if self.transpositions else None
+        if child is None:
+            child = self._add_node(state, depth)
+        else:
+            self.merged += 1
+        return self._add_edge(action, child, pattern)
+
+    def outcome(self, action: int, pattern: int) -> Optional[int]:
+        """Return the edge of a move for a feedback pattern, if expanded."""
+        edge = self.first_edge[action]
+        while edge >= 0:
+            if self.edge_pattern[edge] == pattern:
+                return edge
+            edge = self.next_edge[edge]
+        return None
+
+    def candidates(self, node: int) -> CandidateSet:
+        """Return the candidate words at a node."""
+        return self.states[self.state[node]]
+
+    def actions(self, node: int) -> Iterator[int]:
+        """Yield a node's moves in the order they were tried."""
+        action = self.first_action[node]
+        while action >= 0:
+            yield action
+            action = self.next_action[action]
+
+    def edges(self, action: int) -> Iterator[int]:
+        """Yield a move's outcome edges, most recently added first."""
+        edge = self.first_edge[action]
+        while edge >= 0:
+            yield edge
+            edge = self.next_edge[edge]
+
+    def has_actions(self, node: int) -> bool:
+        """Whether a node has been expanded at least once."""
+        return self.first_action[node] >= 0
+
+    def action_mean(self, action: int) -> float:
+        """Mean simulation result of a move that has been visited.
+
+        With transpositions, each outcome is valued by its (possibly shared)
+        node's mean, weighted by how often the move led there, so a move
+        benefits from every simulation through the nodes it reaches. In a
+        plain tree this equals the mean of the move's own simulations.
+        """
+        if not self.transpositions:
+            return self.action_value[action] / self.action_visits[action]
+        visits, value = self.visits, self.value
+        total = 0.0
+        for edge in self.edges(action):
+            child = self.edge_child[edge]
+            total += self.edge_visits[edge] * value[child] / visits[child]
+        return total / self.action_visits[action]
+
+    def node_of(self, candidates: CandidateSet, depth: int) -> Optional[int]:
+        """Return the most visited node holding a candidate set at a depth, if any."""
+        state = self._state_ids.get(candidates.fingerprint)
+        if state is None:
+            return None
+        if self.transpositions:
+            return self._nodes.get((state, depth))
+        nodes = [node for node in range(len(self.visits))
+                 if self.state[node] == state and self.depth[node] == depth]
+        return max(nodes, key=self.visits.__getitem__, default=None)
+
+    def has_untried(self, node: int) -> bool:
+        """Whether any candidate at the node has not been tried as a move."""
+        return self.cursor[node] < self.state_sizes[self.state[node]]
+
+    def next_move(self, node: int) -> Optional[int]:
+        """Return the best ranked untried move's word id, or None if only
+        unranked candidates are left."""
+        moves = self._ranked(self.state[node])
+        cursor = self.cursor[node]
+        return moves[cursor] if cursor < len(moves) else None
+
+    def mark_tried(self, node: int) -> None:
+        """Advance past the move returned by `next_move`."""
+        self.cursor[node] += 1
+
+    def _ranked(self, state: int) -> array:
+        """Return a state's ranked candidate ids, best first."""
+        moves = self._ranked_moves.get(state)
+        if moves is None:
+            ids = self.states[state].ids()
+            ranks = self.word_ranks[ids]
+            ranked = ranks < self.unranked
+            order = np.argsort(ranks[ranked], kind='stable')
+            moves = array('q', ids[ranked][order].tolist())
+            self._ranked_moves[state] = moves
+        return moves
+
+    def backpropagate(self, path: List[int], result: float) -> None:
+        """Add a simulation result to the root and every move, edge and node on its path.
+
+        Args:
+            path: Outcome edges taken from the root, in order
+            result: The result of the simulation
+        """
+        self.visits[ROOT] += 1
+        self.value[ROOT] += result
+        for edge in path:
+            action = self.edge_action[edge]
+            self.action_visits[action] += 1
+            self.action_value[action] += result
+            self.edge_visits[edge] += 1
+            child = self.edge_child[edge]
+            self.visits[child] += 1
+            self.value[child] += result
+
+    def subtree(self, node: int) -> 'MCTSTree':
+        """Copy the part of the tree reachable from `node` into a new tree rooted there.
+
+        Node, move and edge statistics, untried cursors and move and edge
+        order are preserved; depths are counted from the new root.
+        """
+        tree = MCTSTree.__new__(MCTSTree)
+        tree._init_storage(self.word_ranks, self.unranked, self.transpositions)
+        base_depth = self.depth[node]
+        copies: Dict[int, int] = {}
+
+        def copy_node(old: int) -> int:
+            state = tree._intern(self.states[self.state[old]])
+            if self.state[old] in self._ranked_moves:
+                tree._ranked_moves.setdefault(state, self._ranked_moves[self.state[old]])
+            new = tree._add_node(state, self.depth[old] - base_depth)
+            tree.visits[new] = self.visits[old]
+            tree.value[new] = self.value[old]
+            tree.cursor[new] = self.cursor[old]
+            copies[old] = new
+            return new
+
+        # Nodes are copied when first reached, then their moves and edges in order
+        copy_node(node)
+        queue = [node]
+        while queue:
+            old = queue.pop(0)
+            for action in self.actions(old):
+                new_action = tree.add_action(copies[old], self.action_guess[action])
+                tree.action_visits[new_action] = self.action_visits[action]
+                tree.action_value[new_action] = self.action_value[action]
+                # edges are linked newest first, so copy them oldest first
+                for edge in reversed(list(self.edges(action))):
+                    child = self.edge_child[edge]
+                    if child not in copies:
+                        copy_node(child)
+                        queue.append(child)
+                    new_edge = tree._add_edge(new_action, copies[child], self.edge_pattern[edge])
+                    tree.edge_visits[new_edge] = self.edge_visits[edge]
+                    tree._transitions[(tree.state[copies[old]], self.action_guess[action],
+                                       self.edge_pattern[edge])] = tree.state[copies[child]]
+        return tree
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the tree in bytes.
+
+        Interned candidate sets are counted with their bitsets and any
+        materialized id arrays, and lookup tables with their keys.
+        """
+        columns = [getattr(self, name)
+                   for name in _NODE_COLUMNS + _ACTION_COLUMNS + _EDGE_COLUMNS]
+        return (sum(sys.getsizeof(column) for column in columns)
+                + sys.getsizeof(self.state_sizes)
+                + sys.getsizeof(self.states)
+                + sum(sys.getsizeof(state) for state in self.states)
+                + _table_nbytes(self._state_ids)
+                + _table_nbytes(self._nodes)
+                + _table_nbytes(self._transitions)
+                + _table_nbytes(self._ranked_moves)
+                + sum(sys.getsizeof(moves) for moves in self._ranked_moves.values()))
+
+    def __len__(self) -> int:
+        return len(self.visits)
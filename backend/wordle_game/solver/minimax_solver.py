@@ -1,21 +1,44 @@
-from typing import List, Dict, Tuple
+import time
+import threading
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from collections import defaultdict
+import numpy as np
 from .base_solver import BaseSolver
-from ..feedback import compute_feedback
-from wordle_game.dictionary import load_dictionary
+from ..feedback_matrix import dictionary_digest, get_feedback_matrix
+from ..candidate_set import CandidateSet
+from ..bounded_cache import BoundedCache
+from .parallel_scoring import get_scoring_executor
+from .parallel_minimax import get_root_search
 import config
 
+# Transposition table shared by every MinimaxSolver in the process. Keys are
+# (dictionary digest, candidate set fingerprint, remaining depth, leaf
+# tie-break); values are (best guess, worst-case score, nodes searched to
+# compute them).
+_TRANSPOSITIONS = BoundedCache(
+    'minimax_transpositions', config.MINIMAX_TT_SIZE, config.MINIMAX_TT_BYTES)
+
+# Search nodes expanded, and nodes skipped thanks to transposition hits,
+# summed over all solvers in this process
+_SEARCH_STATS = {'nodes_searched': 0, 'nodes_saved': 0}
+_SEARCH_STATS_LOCK = threading.Lock()
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget has run out."""
+    pass
+
 
 class Node:
     def __init__(self, guess: str, remaining_words: List[str]):
         self.guess = guess
         self.remaining_words = remaining_words
-        # child nodes grouped by feedback patterns
+        # child nodes grouped by feedback pattern codes
         self.outcomes = defaultdict(list)
         self.best_score = float('inf')  # score for pruning
 
-    def add_outcome(self, feedback: Tuple[int, ...], word: str):
-        self.outcomes[feedback].append(word)
+    def add_outcome(self, pattern: int, word: str):
+        self.outcomes[pattern].append(word)
 
     def evaluate(self):
         """Evaluate the worst-case outcome for this node (minimax score)"""
@@ -30,17 +53,47 @@ class Node:
 class MinimaxSolver(BaseSolver):
     """A solver that uses minimax with alpha-beta pruning to minimize worst-case scenarios."""
 
-    def __init__(self, words: List[str], ordered_words: List[str], max_depth: int = config.MINIMAX_DEPTH):
+    def __init__(self, words: List[str], ordered_words: List[str], max_depth: int = config.MINIMAX_DEPTH,
+                 time_budget: Optional[float] = None,
+                 tie_break_buckets: bool = config.MINIMAX_TIE_BREAK_BUCKETS,
+                 root_workers: int = config.MINIMAX_ROOT_WORKERS):
         """Initialize the solver.
 
         Args:
             words: List of valid words
             ordered_words: List of valid 5-letter words (ordered by heuristic to improve alpha beta pruning)
+            max_depth: Search depth, or the deepest iteration when searching
+                with a time budget
+            time_budget: Optional seconds per guess; when set, searches with
+                iterative deepening and returns the best guess found in time
+            tie_break_buckets: Among leaf guesses with equal worst cases,
+                prefer the one splitting the candidates into more buckets
+            root_workers: Worker processes scoring the root guesses in
+                parallel (0 or 1 searches serially); results are identical
         """
-        self.ordered_words = [word for word in ordered_words if word in words]
+        self.feedback_matrix = get_feedback_matrix(words)
+        self.ordered_words = [
+            word for word in ordered_words if word in self.feedback_matrix.word_ids]
+        self._order_digest = dictionary_digest(self.ordered_words)
         self.max_depth = max_depth
-        # cache to avoid redundant computation
-        self.cache = {}
+        self.time_budget = time_budget
+        self.tie_break_buckets = tie_break_buckets
+        self.scoring = get_scoring_executor(self.feedback_matrix)
+        self.root_search = get_root_search(self.feedback_matrix, root_workers)
+        # Search nodes expanded and skipped by this solver (see _SEARCH_STATS)
+        self._nodes_searched = 0
+        self._nodes_saved = 0
+        # Whether the last search scored its root guesses in worker processes
+        self._root_parallel = False
+
+    def settings(self) -> Dict[str, Any]:
+        # Root workers return the same guess as a serial search, so are left out
+        return {
+            'max_depth': self.max_depth,
+            'time_budget': self.time_budget,
+            'tie_break_buckets': self.tie_break_buckets,
+            'ordered_words': self._order_digest,
+        }
 
     def starting_word(self) -> str:
         # handle base case -- (assuming ordered words is in order of estimates info gain)
@@ -59,109 +112,237 @@ class MinimaxSolver(BaseSolver):
         if len(candidates) <= 2:
             return candidates[0]
 
-        # clear cache for new search
-        self.cache = {}
+        searched, saved = self._nodes_searched, self._nodes_saved
+        self._root_parallel = False
+        try:
+            return self._search(candidates)
+        finally:
+            with _SEARCH_STATS_LOCK:
+                _SEARCH_STATS['nodes_searched'] += self._nodes_searched - searched
+                _SEARCH_STATS['nodes_saved'] += self._nodes_saved - saved
+
+    def _search(self, candidates: List[str]) -> str:
+        """Run the configured search over more than two candidates."""
+        # Search in dictionary order so a candidate set always yields the same
+        # result, whichever order it was passed in
+        candidate_ids = self.feedback_matrix.ids_of(candidates)
+        if not np.all(candidate_ids[1:] > candidate_ids[:-1]):
+            candidates = [self.feedback_matrix.words[i]
+                          for i in np.sort(candidate_ids)]
+
+        if self.time_budget is None:
+            # Find best guess using minimax search
+            best_guess, _ = self._minimax(candidates, 0, self.max_depth)
+            return best_guess
+        return self._iterative_deepening(candidates)
+
+    def _iterative_deepening(self, candidates: List[str]) -> str:
+        """Search depth 1, 2, 3... until the time budget runs out.
+
+        Each iteration reuses the previous one's best guesses (via the
+        transposition table) to order moves. The first iteration always
+        completes, so there is always an answer.
+
+        Args:
+            candidates: List of currently valid candidate words, in dictionary order
 
-        # Find best guess using minimax search
-        best_guess, _ = self._minimax(candidates, 0)
+        Returns:
+            The best guess of the deepest completed iteration
+        """
+        deadline = time.perf_counter() + self.time_budget
+        best_guess = None
+        for max_depth in range(1, self.max_depth + 1):
+            try:
+                best_guess, best_score = self._minimax(
+                    candidates, 0, max_depth, deadline if best_guess else None)
+            except _SearchTimeout:
+                break
+            # A perfect split cannot be improved by searching deeper
+            if best_score <= 1 or time.perf_counter() > deadline:
+                break
         return best_guess
 
-    def _minimax(self, candidates: List[str], depth: int) -> Tuple[str, int]:
+    def search_info(self) -> Dict[str, Any]:
+        return {'root_parallel': self._root_parallel}
+
+    @staticmethod
+    def transposition_stats() -> Dict[str, float]:
+        """Return transposition table counters and the search work they saved."""
+        with _SEARCH_STATS_LOCK:
+            search_stats = dict(_SEARCH_STATS)
+        return {**_TRANSPOSITIONS.stats(), **search_stats}
+
+    def _minimax(self, candidates: List[str], depth: int, max_depth: int,
+                 deadline: Optional[float] = None) -> Tuple[str, int]:
         """Find the best guess and its score using minimax algorithm with specified depth.
 
         Args:
             candidates: List of possible target words
             depth: Current depth in the search tree
+            max_depth: Depth at which the search stops and scores leaves
+            deadline: Optional `time.perf_counter()` value after which the
+                search is abandoned
 
         Returns:
             Tuple of (best guess word, worst-case score)
+
+        Raises:
+            _SearchTimeout: If the deadline passes before the search finishes
         """
-        cache_key = (tuple(sorted(candidates)), depth)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        # Subtree results depend only on the candidate set and the depth left
+        fingerprint = CandidateSet.from_words(self.feedback_matrix, candidates).fingerprint
+        cache_key = self._transposition_key(fingerprint, max_depth - depth)
+        cached = _TRANSPOSITIONS.get(cache_key)
+        if cached is not None:
+            best_guess, best_score, nodes = cached
+            self._nodes_saved += nodes
+            return best_guess, best_score
+
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _SearchTimeout()
+
+        nodes_before = self._nodes_searched
+        self._nodes_searched += 1
+
+        def store(best_guess: str, best_score: int) -> Tuple[str, int]:
+            nodes = self._nodes_searched - nodes_before
+            _TRANSPOSITIONS.put(cache_key, (best_guess, best_score, nodes))
+            return best_guess, best_score
 
         # base cases: max depth reached or few candidates remain
-        if depth >= self.max_depth or len(candidates) <= 2:
+        if depth >= max_depth or len(candidates) <= 2:
             best_guess = candidates[0] if len(
                 candidates) <= 2 else self._evaluate_guesses(candidates)
             best_score = 1 if len(candidates) <= 1 else len(candidates)
-            self.cache[cache_key] = (best_guess, best_score)
-            return best_guess, best_score
-
-        best_guess = None
+            return store(best_guess, best_score)
+
+        #   for optimization, only consider 15 best words based on ordering heuristic
+        #   I found that the best word found is always within the first 10 remaining words
+        #   because it is ordered by the heuristic, the subset of 15 did not jeapordize accuracy
+        guesses = candidates[:15]
+        guess_ids = self.feedback_matrix.ids_of(guesses)
+        candidate_ids = self.feedback_matrix.ids_of(candidates)
+
+        if depth + 1 >= max_depth:
+            # Every outcome is a leaf scored by its size, so each guess scores
+            # its largest bucket; score them all at once
+            index = self.scoring.best_worst_case(
+                guess_ids, candidate_ids, self.tie_break_buckets)
+            worst_case = int(self.feedback_matrix.partition_sizes(
+                guess_ids[index], candidate_ids).max())
+            return store(guesses[index], worst_case)
+
+        # guesses that perfectly split the candidates score the optimal 1
+        perfect = self.scoring.worst_case_sizes(guess_ids, candidate_ids) <= 1
+        order = self._move_order(guesses, fingerprint, max_depth - depth)
+
+        if depth == 0 and self.root_search.is_parallel(len(candidates)):
+            self._root_parallel = True
+            index, best_score = self.root_search.search(
+                self, candidate_ids, guesses, order, perfect, max_depth, deadline)
+            return store(guesses[index], best_score)
+
+        best_index = len(guesses)
         best_score = float('inf')
-        i = 0
-        for guess in candidates[:15]:
-            #   for optimization, only consider 15 best words based on ordering heuristic
-            #   I found that the best word found is always within the first 10 remaining words
-            #   because it is ordered by the heuristic, the subset of 15 did not jeapordize accuracy
-            outcomes = self._get_outcomes(guess, candidates)
-
-            # perfectly splits candidates - optimal
-            if all(len(words) <= 1 for words in outcomes.values()):
-                self.cache[cache_key] = (guess, 1)
-                return guess, 1
-
-            worst_case_score = 0
-            should_prune = False
-
-            for _, remaining_words in outcomes.items():
-                if not remaining_words:
-                    continue
-
-                if len(remaining_words) == 1:  # branch is solved
-                    outcome_score = 1
-                # max depth or few words
-                elif depth + 1 >= self.max_depth or len(remaining_words) <= 2:
-                    outcome_score = len(remaining_words)
-                else:
-                    # recursively find the best guess for this subset
-                    _, outcome_score = self._minimax(
-                        remaining_words, depth + 1)
-
-                worst_case_score = max(worst_case_score, outcome_score)
-
-                if worst_case_score >= best_score:  # prune
-                    should_prune = True
-                    break
-
-            if should_prune:
+        for index in order:
+            # nothing beats 1, and ties go to the earlier guess
+            if best_score == 1 and index > best_index:
+                break
+
+            if perfect[index]:
+                best_score, best_index = 1, index
                 continue
 
-            if worst_case_score < best_score:
-                best_score = worst_case_score
-                best_guess = guess
+            score = self._guess_score(
+                candidates, guesses[index], index, depth, max_depth, deadline,
+                lambda: (best_score, best_index))
+            if score is not None:
+                best_score, best_index = score, index
 
-                # perfect guess
-                if best_score == 1:
-                    break
-            i += 1
+        return store(guesses[best_index], best_score)
 
-        self.cache[cache_key] = (best_guess, best_score)
-        # print(i)
-        return best_guess, best_score
+    def _guess_score(self, candidates: List[str], guess: str, index: int, depth: int,
+                     max_depth: int, deadline: Optional[float],
+                     bound: Callable[[], Tuple[float, int]]) -> Optional[int]:
+        """Compute a guess's worst-case score, pruning against the best so far.
 
-    def _evaluate_guesses(self, candidates: List[str]) -> str:
-        """Evaluate all guesses and return the one with the lowest worst-case score."""
-        best_guess = None
-        best_score = float('inf')
+        Args:
+            candidates: List of possible target words
+            guess: The guess to score
+            index: Position of the guess in the heuristic order (breaks ties)
+            depth: Current depth in the search tree
+            max_depth: Depth at which the search stops and scores leaves
+            deadline: Optional `time.perf_counter()` deadline
+            bound: Returns the (score, index) of the best guess found so far
 
-        for guess in candidates:
-            outcomes = self._get_outcomes(guess, candidates)
-            worst_case = max(len(words)
-                             for words in outcomes.values()) if outcomes else 0
+        Returns:
+            The guess's worst-case score, or None if it was pruned because it
+            cannot beat the bound
+        """
+        outcomes = self._get_outcomes(guess, candidates)
 
-            if worst_case < best_score:
-                best_score = worst_case
-                best_guess = guess
+        worst_case_score = 0
+        for _, remaining_words in outcomes.items():
+            if not remaining_words:
+                continue
 
-                # perfect guess
-                if best_score == 1:
-                    break
+            if len(remaining_words) == 1:  # branch is solved
+                outcome_score = 1
+            # few words
+            elif len(remaining_words) <= 2:
+                outcome_score = len(remaining_words)
+            else:
+                # recursively find the best guess for this subset
+                _, outcome_score = self._minimax(
+                    remaining_words, depth + 1, max_depth, deadline)
 
-        return best_guess
+            worst_case_score = max(worst_case_score, outcome_score)
+
+            # prune; a tie only matters for a guess earlier in the heuristic order
+            best_score, best_index = bound()
+            if worst_case_score > best_score or \
+                    (worst_case_score == best_score and index > best_index):
+                return None
+
+        return worst_case_score
+
+    def _move_order(self, guesses: List[str], fingerprint: str, remaining_depth: int) -> List[int]:
+        """Order the guesses at a node for earlier alpha-beta cutoffs.
+
+        The best guess found for the same candidates by the previous, one
+        level shallower iteration is searched first; the rest keep their
+        heuristic order. Ties are still resolved by heuristic order, so the
+        ordering never changes the result, only how much gets pruned.
+
+        Args:
+            guesses: Guesses considered at the node, in heuristic order
+            fingerprint: Fingerprint of the node's candidate set
+            remaining_depth: Depth left below the node
+
+        Returns:
+            Indices into `guesses` in search order
+        """
+        order = list(range(len(guesses)))
+        previous = _TRANSPOSITIONS.get(
+            self._transposition_key(fingerprint, remaining_depth - 1))
+        if previous is not None and previous[0] in guesses:
+            first = guesses.index(previous[0])
+            order.remove(first)
+            order.insert(0, first)
+        return order
+
+    def _transposition_key(self, fingerprint: str, remaining_depth: int) -> tuple:
+        """Key of a node's entry in the shared transposition table."""
+        return (self.feedback_matrix.digest, fingerprint, remaining_depth,
+                self.tie_break_buckets)
 
-    def _get_outcomes(self, guess: str, remaining_words: List[str]) -> Dict[Tuple[int, ...], List[str]]:
+    def _evaluate_guesses(self, candidates: List[str]) -> str:
+        """Evaluate all guesses and return the one with the lowest worst-case score."""
+        candidate_ids = self.feedback_matrix.ids_of(candidates)
+        return candidates[self.scoring.best_worst_case(
+            candidate_ids, candidate_ids, self.tie_break_buckets)]
+
+    def _get_outcomes(self, guess: str, remaining_words: List[str]) -> Dict[int, List[str]]:
         """Get all possible outcomes for a given guess.
 
         Args:
@@ -169,34 +350,19 @@ class MinimaxSolver(BaseSolver):
             remaining_words: All possible target words
 
         Returns:
-            Dictionary mapping feedback patterns to lists of remaining words
+            Dictionary mapping feedback pattern codes to lists of remaining words
         """
         outcomes = defaultdict(list)
+        patterns = self.feedback_matrix.row(
+            self.feedback_matrix.id_of(guess),
+            self.feedback_matrix.ids_of(remaining_words))
 
-        # for each possible target word, compute the feedback and group by feedback pattern
-        for word in remaining_words:
-            feedback = compute_feedback(guess, word)
-            outcomes[feedback].append(word)
+        # for each possible target word, group by the precomputed feedback pattern
+        for word, pattern in zip(remaining_words, patterns.tolist()):
+            outcomes[pattern].append(word)
 
         return outcomes
 
     @classmethod
     def get_name(cls) -> str:
         return f"minimax_{config.MINIMAX_DEPTH}"
-
-    @staticmethod
-    def _estimate_feedback_spread(words):
-        """Ranks words with a heuristic to maximize pruning based on feedback spread.
-
-        Args:
-            words: List of words to rank
-
-        Returns:
-            Sorted list of words by estimated information gain
-        """
-        estimated_scores = {
-            word: sum(len(set(word) & set(other))
-                      for other in words) / len(words)
-            for word in words
-        }
-        return sorted(words, key=lambda w: (-estimated_scores[w], -len(set(w))))
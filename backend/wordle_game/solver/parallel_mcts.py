@@ -0,0 +1,221 @@
+"""
+Root-parallel Monte Carlo Tree Search.
+
+A search is split across a pool of worker processes: each worker grows its
+own tree from the same root for its share of the simulations, using a random
+generator seeded from a fixed per-worker schedule. The visits and values of
+the root moves are then summed per guess across workers, and the most visited
+guess is picked as in a single-tree search.
+
+Seeds depend only on `config.MCTS_ROOT_SEED` and the worker's position, and
+results are merged in worker order, so a search with a fixed simulation count
+is reproducible whatever the scheduling.
+"""
+
+import time
+import atexit
+import random
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import config
+from ..feedback_matrix import (FeedbackMatrix, FeedbackMatrixArtifactError, dictionary_digest,
+                               get_feedback_matrix, load_word_source, word_source)
+from ..word_order import get_word_order
+
+if TYPE_CHECKING:
+    from .mcts_solver import MCTSSolver
+
+# Guess id of a root move -> (visits, summed value)
+RootStatistics = Dict[int, Tuple[int, float]]
+
+# Root search pools already created in this process, keyed by dictionary
+# digest, word order digest and worker count
+_POOLS: Dict[Tuple[str, str, int], 'RootParallelPool'] = {}
+
+# Worker process state (set by _init_worker)
+_worker_words: Optional[List[str]] = None
+_worker_ordered_words: Optional[List[str]] = None
+_worker_solvers: Dict[Tuple[float, float, bool, bool], 'MCTSSolver'] = {}
+
+
+class RootParallelPool:
+    """Runs independent MCTS trees for one root in worker processes."""
+
+    def __init__(self, feedback_matrix: FeedbackMatrix, ordered_words: List[str],
+                 workers: int = config.MCTS_ROOT_WORKERS,
+                 seed: int = config.MCTS_ROOT_SEED):
+        """Initialize the pool.
+
+        Worker processes are started lazily by the first parallel search.
+
+        Args:
+            feedback_matrix: Feedback matrix for the dictionary
+            ordered_words: Heuristic word order the workers' solvers use
+            workers: Number of worker processes (0 or 1 always searches serially)
+            seed: Base of the per-worker seed schedule
+        """
+        self.feedback_matrix = feedback_matrix
+        self.ordered_words = ordered_words
+        self.order_digest = dictionary_digest(ordered_words)
+        self.workers = workers
+        self.seed = seed
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def is_parallel(self) -> bool:
+        """Whether searches are split across worker processes."""
+        return self.workers > 1
+
+    def worker_seeds(self) -> List[int]:
+        """Seed of each worker's random generator, in worker order."""
+        return [self.seed + worker for worker in range(self.workers)]
+
+    def search(self, solver: 'MCTSSolver', candidate_ids: np.ndarray,
+               simulations: Optional[int],
+               deadline: Optional[float] = None) -> Tuple[RootStatistics, int]:
+        """Grow one tree per worker and merge their root statistics.
+
+        Args:
+            solver: Solver whose settings the workers search with
+            candidate_ids: Ids of the root candidates
+            simulations: Total simulations to split across the workers, or
+                None for each worker to run until the deadline or convergence
+            deadline: Optional `time.perf_counter()` deadline
+
+        Returns:
+            Tuple of (visits and values of each root guess summed over the
+            workers, in order of first appearance; total simulations run)
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(word_source(self.feedback_matrix.words, config.DICTIONARY_PATH),
+                              self.feedback_matrix.digest, self._order_source(),
+                              self.order_digest))
+
+        # split the simulations as evenly as possible, earlier workers first
+        if simulations is None:
+            shares = [None] * self.workers
+        else:
+            share, extra = divmod(simulations, self.workers)
+            shares = [share + (worker < extra) for worker in range(self.workers)]
+        time_left = None if deadline is None else deadline - time.perf_counter()
+        futures = [
+            self._pool.submit(_search_tree, candidate_ids, share, seed, time_left,
+                              solver.exploration_constant, solver.reward_multiplier,
+                              solver.transpositions, solver.outcome_search)
+            for share, seed in zip(shares, self.worker_seeds())]
+
+        merged: RootStatistics = {}
+        playouts = 0
+        for future in futures:
+            children, worker_playouts = future.result()
+            playouts += worker_playouts
+            for guess_id, visits, value in children:
+                total_visits, total_value = merged.get(guess_id, (0, 0.0))
+                merged[guess_id] = (total_visits + visits, total_value + value)
+        return merged, playouts
+
+    def _order_source(self) -> Optional[Union[str, List[str]]]:
+        """Return what a worker needs to load the word order itself.
+
+        A `word_source` of the configured order file; without one, None when
+        it is the dictionary's built order (which the worker reads from its
+        file under `config.DATA_DIR`) and the words themselves otherwise.
+        """
+        if config.ORDERED_WORDS_PATH:
+            return word_source(self.ordered_words, config.ORDERED_WORDS_PATH)
+        if self.ordered_words == get_word_order(self.feedback_matrix):
+            return None
+        return list(self.ordered_words)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+def _init_worker(words: Union[str, List[str]], digest: str,
+                 ordered_words: Optional[Union[str, List[str]]], order_digest: str) -> None:
+    """Load the dictionary and word order in a worker process.
+
+    Raises:
+        FeedbackMatrixArtifactError: If either does not match its digest
+    """
+    global _worker_words, _worker_ordered_words
+    _worker_words = load_word_source(words, digest)
+    if ordered_words is not None:
+        _worker_ordered_words = load_word_source(ordered_words, order_digest)
+        return
+    _worker_ordered_words = get_word_order(get_feedback_matrix(_worker_words))
+    if dictionary_digest(_worker_ordered_words) != order_digest:
+        raise FeedbackMatrixArtifactError('Built word order does not match the search order')
+
+
+def _get_worker_solver(exploration_constant: float, reward_multiplier: float,
+                       transpositions: bool, outcome_search: bool) -> 'MCTSSolver':
+    """Return a serial, tree-discarding solver with the given settings."""
+    from .mcts_solver import MCTSSolver
+
+    key = (exploration_constant, reward_multiplier, transpositions, outcome_search)
+    solver = _worker_solvers.get(key)
+    if solver is None:
+        solver = MCTSSolver(_worker_words, _worker_ordered_words,
+                            exploration_constant=exploration_constant,
+                            reward_multiplier=reward_multiplier,
+                            reuse_tree=False, root_workers=0,
+                            transpositions=transpositions,
+                            outcome_search=outcome_search)
+        _worker_solvers[key] = solver
+    return solver
+
+
+def _search_tree(candidate_ids: np.ndarray, simulations: Optional[int], seed: int,
+                 time_left: Optional[float], exploration_constant: float,
+                 reward_multiplier: float,
+                 transpositions: bool,
+                 outcome_search: bool) -> Tuple[List[Tuple[int, int, float]], int]:
+    """Grow one tree in a worker and return its root moves' statistics.
+
+    Returns:
+        Tuple of (list of (guess id, visits, value) in the root's move
+        order; simulations run)
+    """
+    from .mcts_tree import ROOT
+    from ..candidate_set import CandidateSet
+
+    solver = _get_worker_solver(exploration_constant, reward_multiplier, transpositions,
+                                outcome_search)
+    tree = solver._new_tree(CandidateSet.from_ids(solver.feedback_matrix, candidate_ids))
+    deadline = None if time_left is None else time.perf_counter() + time_left
+    playouts = solver._run_simulations(tree, simulations, random.Random(seed), deadline)
+    children = [(tree.action_guess[action], tree.action_visits[action],
+                 tree.action_value[action])
+                for action in tree.actions(ROOT)]
+    return children, playouts
+
+
+def get_root_parallel_pool(feedback_matrix: FeedbackMatrix, ordered_words: List[str],
+                           workers: int = config.MCTS_ROOT_WORKERS) -> RootParallelPool:
+    """Get the process-wide root-parallel pool for a dictionary, order and size."""
+    key = (feedback_matrix.digest, dictionary_digest(ordered_words), workers)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = RootParallelPool(feedback_matrix, ordered_words, workers)
+        _POOLS[key] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _POOLS.values():
+        pool.shutdown()
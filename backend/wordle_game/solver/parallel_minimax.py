@@ -0,0 +1,230 @@
+"""
+Root-parallel minimax search.
+
+The guesses at the root of a minimax search are scored by a pool of worker
+processes. Workers share the best (score, guess index) found so far through a
+single int64 in a `multiprocessing.shared_memory` block and prune their own
+subtrees against it, so a good guess found by one worker cuts the others'
+work short.
+
+The result does not depend on scheduling: a guess is only pruned once it
+provably scores worse than the bound (or ties it with a later heuristic
+index), and the answer is the lowest (score, index) among the unpruned
+guesses, which is exactly what the serial search returns.
+"""
+
+import atexit
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import config
+from ..feedback_matrix import FeedbackMatrix, load_word_source, word_source
+
+if TYPE_CHECKING:
+    from .minimax_solver import MinimaxSolver
+
+# The shared bound packs (score, index) as score * _INDEX_SLOTS + index, so
+# comparing packed values compares scores first, then heuristic order
+_INDEX_SLOTS = 1 << 8
+_NO_BOUND = np.iinfo(np.int64).max
+
+# Root search pools already created in this process, keyed by dictionary
+# digest and worker count
+_POOLS: Dict[Tuple[str, int], 'RootSearchPool'] = {}
+
+# Worker process state (set by _init_worker)
+_worker_words: Optional[List[str]] = None
+_worker_bound: Optional[np.ndarray] = None
+_worker_block: Optional[SharedMemory] = None
+_worker_lock = None
+_worker_solvers: Dict[Tuple[int, bool], 'MinimaxSolver'] = {}
+
+
+class RootSearchPool:
+    """Scores the root guesses of minimax searches in worker processes."""
+
+    def __init__(self, feedback_matrix: FeedbackMatrix,
+                 workers: int = config.MINIMAX_ROOT_WORKERS,
+                 min_parallel_candidates: int = config.MINIMAX_PARALLEL_MIN_CANDIDATES):
+        """Initialize the pool.
+
+        Worker processes are started lazily by the first parallel search.
+
+        Args:
+            feedback_matrix: Feedback matrix for the dictionary
+            workers: Number of worker processes (0 or 1 always searches serially)
+            min_parallel_candidates: Smallest root candidate count searched in parallel
+        """
+        self.feedback_matrix = feedback_matrix
+        self.workers = workers
+        self.min_parallel_candidates = min_parallel_candidates
+        self._context = multiprocessing.get_context('spawn')
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._bound_block: Optional[SharedMemory] = None
+        self._bound: Optional[np.ndarray] = None
+        self._bound_lock = None
+        # Searches share one bound, so they run one at a time
+        self._lock = threading.Lock()
+
+    def is_parallel(self, candidate_count: int) -> bool:
+        """Whether a root with `candidate_count` candidates is searched in parallel."""
+        return self.workers > 1 and candidate_count >= self.min_parallel_candidates
+
+    def search(self, solver: 'MinimaxSolver', candidate_ids: np.ndarray, guesses: List[str],
+               order: List[int], perfect: np.ndarray, max_depth: int,
+               deadline: Optional[float]) -> Tuple[int, int]:
+        """Score the root guesses in parallel and return the best one.
+
+        Args:
+            solver: Solver whose settings the workers search with
+            candidate_ids: Ids of the root candidates, in dictionary order
+            guesses: Root guesses in heuristic order
+            order: Indices into `guesses` in search order
+            perfect: Whether each guess perfectly splits the candidates
+            max_depth: Depth at which the search stops and scores leaves
+            deadline: Optional `time.perf_counter()` deadline
+
+        Returns:
+            Tuple of (index into `guesses` of the best guess, its score)
+
+        Raises:
+            _SearchTimeout: If the deadline passes before the search finishes
+        """
+        from .minimax_solver import _SearchTimeout
+
+        # A perfect splitter scores the optimal 1; only earlier guesses that
+        # also score 1 could still take its place
+        first_perfect = int(np.argmax(perfect)) if perfect.any() else None
+        results = {}
+        if first_perfect is not None:
+            results[first_perfect] = 1
+        pending = [index for index in order
+                   if first_perfect is None or index < first_perfect]
+
+        with self._lock:
+            self._ensure_pool()
+            self._bound[0] = _NO_BOUND if first_perfect is None \
+                else _INDEX_SLOTS + first_perfect
+            time_left = None if deadline is None else deadline - time.perf_counter()
+            futures = [
+                self._pool.submit(_score_root_guess, candidate_ids, guesses[index], index,
+                                  max_depth, solver.tie_break_buckets, time_left)
+                for index in pending]
+            outcomes = [future.result() for future in futures]
+
+        for index, score, timed_out in outcomes:
+            if timed_out:
+                raise _SearchTimeout()
+            if score is not None:
+                results[index] = score
+
+        best_index = min(results, key=lambda index: (results[index], index))
+        return best_index, results[best_index]
+
+    def _ensure_pool(self) -> None:
+        """Create the shared bound and worker pool if needed."""
+        if self._pool is not None:
+            return
+        self._bound_block = SharedMemory(create=True, size=np.dtype(np.int64).itemsize)
+        self._bound = np.ndarray((1,), dtype=np.int64, buffer=self._bound_block.buf)
+        self._bound_lock = self._context.Lock()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(word_source(self.feedback_matrix.words, config.DICTIONARY_PATH),
+                      self.feedback_matrix.digest, self._bound_block.name, self._bound_lock))
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and release the shared bound."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            self._bound = None
+            if self._bound_block is not None:
+                self._bound_block.close()
+                self._bound_block.unlink()
+                self._bound_block = None
+
+
+def _init_worker(words: Union[str, List[str]], digest: str, bound_name: str,
+                 bound_lock) -> None:
+    """Load the dictionary and attach a worker process to the shared bound."""
+    global _worker_words, _worker_bound, _worker_block, _worker_lock
+    _worker_words = load_word_source(words, digest)
+    _worker_block = SharedMemory(name=bound_name)
+    _worker_bound = np.ndarray((1,), dtype=np.int64, buffer=_worker_block.buf)
+    _worker_lock = bound_lock
+
+
+def _get_worker_solver(max_depth: int, tie_break_buckets: bool) -> 'MinimaxSolver':
+    """Return a serial solver with the given settings for this worker."""
+    from .minimax_solver import MinimaxSolver
+    from .parallel_scoring import ScoringExecutor
+
+    key = (max_depth, tie_break_buckets)
+    solver = _worker_solvers.get(key)
+    if solver is None:
+        solver = MinimaxSolver(_worker_words, [], max_depth=max_depth,
+                               tie_break_buckets=tie_break_buckets, root_workers=0)
+        # Workers are already parallel; never start nested pools
+        solver.scoring = ScoringExecutor(solver.feedback_matrix, workers=0)
+        _worker_solvers[key] = solver
+    return solver
+
+
+def _read_bound() -> Tuple[int, int]:
+    """Return the shared best (score, index) found so far."""
+    packed = int(_worker_bound[0])
+    if packed == _NO_BOUND:
+        return float('inf'), _INDEX_SLOTS
+    return packed // _INDEX_SLOTS, packed % _INDEX_SLOTS
+
+
+def _score_root_guess(candidate_ids: np.ndarray, guess: str, index: int, max_depth: int,
+                      tie_break_buckets: bool,
+                      time_left: Optional[float]) -> Tuple[int, Optional[int], bool]:
+    """Score one root guess in a worker, pruning against the shared bound.
+
+    Returns:
+        Tuple of (index, score or None if pruned, whether the deadline passed)
+    """
+    from .minimax_solver import _SearchTimeout
+
+    solver = _get_worker_solver(max_depth, tie_break_buckets)
+    candidates = [_worker_words[i] for i in candidate_ids]
+    deadline = None if time_left is None else time.perf_counter() + time_left
+    try:
+        score = solver._guess_score(candidates, guess, index, 0, max_depth,
+                                    deadline, _read_bound)
+    except _SearchTimeout:
+        return index, None, True
+
+    if score is not None:
+        with _worker_lock:
+            packed = score * _INDEX_SLOTS + index
+            if packed < _worker_bound[0]:
+                _worker_bound[0] = packed
+    return index, score, False
+
+
+def get_root_search(feedback_matrix: FeedbackMatrix,
+                    workers: int = config.MINIMAX_ROOT_WORKERS) -> RootSearchPool:
+    """Get the process-wide root search pool for a feedback matrix and size."""
+    key = (feedback_matrix.digest, workers)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = RootSearchPool(feedback_matrix, workers)
+        _POOLS[key] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _POOLS.values():
+        pool.shutdown()
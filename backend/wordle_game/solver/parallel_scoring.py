@@ -0,0 +1,198 @@
+"""
+Process-pool guess scoring over the memory-mapped feedback matrix.
+
+Scoring a set of guesses is independent per guess, so large requests are
+split into contiguous shards of guesses and scored by a pool of worker
+processes, sidestepping the GIL of the web server's request threads.
+
+Workers never receive word lists or pattern data: each one memory-maps the
+dictionary's feedback matrix artifact by path (checking its digest), so they
+share the parent's physical pages, and each request writes its guess and
+candidate ids into a `multiprocessing.shared_memory` block. Only shard bounds
+and the resulting score slices cross the process boundary. Small requests, where IPC overhead would dominate, are
+scored serially in the calling process.
+"""
+
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import config
+from ..feedback_matrix import FeedbackMatrix, artifact_path, map_artifact
+from .scoring import (best_worst_case_from_patterns, best_worst_case_index,
+                      bucket_counts_from_patterns, information_gain_from_patterns,
+                      worst_case_from_patterns)
+
+# Scoring functions workers can run, keyed by the name sent with each shard
+_SCORERS: Dict[str, Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = {
+    'information_gain': information_gain_from_patterns,
+    'worst_case': worst_case_from_patterns,
+    'bucket_count': bucket_counts_from_patterns,
+}
+
+# Executors already created in this process, keyed by dictionary digest
+_EXECUTORS: Dict[str, 'ScoringExecutor'] = {}
+
+# Mapped artifact and shared ids held by a worker process (set by _attach_worker)
+_worker_block: Optional[SharedMemory] = None
+_worker_patterns: Optional[np.ndarray] = None
+_worker_ids: Optional[np.ndarray] = None
+
+
+class ScoringExecutor:
+    """Scores guesses serially or across a process pool, by request size."""
+
+    def __init__(self, feedback_matrix: FeedbackMatrix,
+                 workers: int = config.SCORING_WORKERS,
+                 min_parallel_candidates: int = config.SCORING_PARALLEL_MIN_CANDIDATES):
+        """Initialize the executor.
+
+        The pool and the shared ids block are created lazily on the first
+        request large enough to be scored in parallel.
+
+        Args:
+            feedback_matrix: Feedback matrix for the dictionary
+            workers: Number of worker processes (0 or 1 always scores serially)
+            min_parallel_candidates: Smallest candidate count scored in parallel
+        """
+        self.feedback_matrix = feedback_matrix
+        self.workers = workers
+        self.min_parallel_candidates = min_parallel_candidates
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._ids_block: Optional[SharedMemory] = None
+        self._ids: Optional[np.ndarray] = None
+        # Requests share one ids block, so they are scored one at a time
+        self._lock = threading.Lock()
+
+    def expected_information_gain(self, guess_ids: np.ndarray,
+                                  candidate_ids: np.ndarray) -> np.ndarray:
+        """Expected information gain (in bits) of each guess over the candidates."""
+        return self._score('information_gain', guess_ids, candidate_ids)
+
+    def rank_by_information_gain(self, guess_ids: np.ndarray,
+                                 candidate_ids: np.ndarray) -> np.ndarray:
+        """Positions into `guess_ids` from best to worst score, ties in order."""
+        scores = self.expected_information_gain(guess_ids, candidate_ids)
+        return np.argsort(-scores, kind='stable')
+
+    def worst_case_sizes(self, guess_ids: np.ndarray,
+                         candidate_ids: np.ndarray) -> np.ndarray:
+        """Largest pattern bucket each guess leaves among the candidates."""
+        return self._score('worst_case', guess_ids, candidate_ids)
+
+    def best_worst_case(self, guess_ids: np.ndarray, candidate_ids: np.ndarray,
+                        tie_break_buckets: bool = False) -> int:
+        """Position in `guess_ids` of the guess with the smallest worst case.
+
+        Serial requests stop at the first perfect splitter; parallel ones
+        score every guess, which selects the same guess.
+        """
+        if not self._uses_pool(guess_ids, candidate_ids):
+            return best_worst_case_from_patterns(
+                self.feedback_matrix.patterns, guess_ids, candidate_ids, tie_break_buckets)
+        sizes = self._score('worst_case', guess_ids, candidate_ids)
+        counts = self._score('bucket_count', guess_ids, candidate_ids) \
+            if tie_break_buckets else None
+        return best_worst_case_index(sizes, counts)
+
+    def is_parallel(self, candidate_count: int) -> bool:
+        """Whether a request over `candidate_count` candidates uses the pool."""
+        return self.workers > 1 and candidate_count >= self.min_parallel_candidates
+
+    def _uses_pool(self, guess_ids: np.ndarray, candidate_ids: np.ndarray) -> bool:
+        return self.is_parallel(len(candidate_ids)) and len(guess_ids) >= self.workers
+
+    def _score(self, scorer: str, guess_ids: np.ndarray,
+               candidate_ids: np.ndarray) -> np.ndarray:
+        """Score guesses with the named scorer, in parallel when worthwhile.
+
+        Args:
+            scorer: Name of the scoring function in `_SCORERS`
+            guess_ids: Ids of the guesses to score
+            candidate_ids: Ids of the remaining candidate words
+
+        Returns:
+            Scores aligned with `guess_ids`
+        """
+        if not self._uses_pool(guess_ids, candidate_ids):
+            return _SCORERS[scorer](self.feedback_matrix.patterns, guess_ids, candidate_ids)
+
+        with self._lock:
+            self._ensure_pool()
+            n_guesses, n_candidates = len(guess_ids), len(candidate_ids)
+            self._ids[:n_guesses] = guess_ids
+            self._ids[n_guesses:n_guesses + n_candidates] = candidate_ids
+
+            bounds = np.linspace(0, n_guesses, self.workers + 1, dtype=np.int64)
+            futures = [
+                self._pool.submit(_score_shard, scorer, int(start), int(stop),
+                                  n_guesses, n_candidates)
+                for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            return np.concatenate([future.result() for future in futures])
+
+    def _ensure_pool(self) -> None:
+        """Create the shared ids block and worker pool if needed."""
+        if self._pool is not None:
+            return
+
+        # Room for a full dictionary of guess ids followed by candidate ids
+        self._ids_block = SharedMemory(
+            create=True, size=2 * len(self.feedback_matrix) * np.dtype(np.int32).itemsize)
+        self._ids = np.ndarray((2 * len(self.feedback_matrix),), dtype=np.int32,
+                               buffer=self._ids_block.buf)
+
+        # Spawned workers do not inherit the web server's threads or locks
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_attach_worker,
+            initargs=(artifact_path(self.feedback_matrix.words), len(self.feedback_matrix),
+                      self.feedback_matrix.digest, self._ids_block.name))
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and release the shared ids block."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            self._ids = None
+            if self._ids_block is not None:
+                self._ids_block.close()
+                self._ids_block.unlink()
+                self._ids_block = None
+
+
+def _attach_worker(path: str, count: int, digest: str, ids_name: str) -> None:
+    """Map the matrix artifact and attach to the shared ids block in a worker."""
+    global _worker_block, _worker_patterns, _worker_ids
+    _worker_patterns = map_artifact(path, count, digest)
+    _worker_block = SharedMemory(name=ids_name)
+    _worker_ids = np.ndarray((_worker_block.size // np.dtype(np.int32).itemsize,),
+                             dtype=np.int32, buffer=_worker_block.buf)
+
+
+def _score_shard(scorer: str, start: int, stop: int, n_guesses: int,
+                 n_candidates: int) -> np.ndarray:
+    """Score guesses [start, stop) of the current request in a worker."""
+    guess_ids = _worker_ids[:n_guesses][start:stop]
+    candidate_ids = _worker_ids[n_guesses:n_guesses + n_candidates]
+    return _SCORERS[scorer](_worker_patterns, guess_ids, candidate_ids)
+
+
+def get_scoring_executor(feedback_matrix: FeedbackMatrix) -> ScoringExecutor:
+    """Get the process-wide scoring executor for a feedback matrix."""
+    executor = _EXECUTORS.get(feedback_matrix.digest)
+    if executor is None:
+        executor = ScoringExecutor(feedback_matrix)
+        _EXECUTORS[feedback_matrix.digest] = executor
+    return executor
+
+
+@atexit.register
+def _shutdown_executors() -> None:
+    for executor in _EXECUTORS.values():
+        executor.shutdown()
@@ -0,0 +1,185 @@
+"""
+Vectorized guess scoring from feedback pattern histograms.
+
+Scores for many guesses are computed at once: the pattern codes of each guess
+against every candidate are gathered from the feedback matrix, turned into
+per-guess bucket-size histograms with a single `bincount`, and reduced with a
+precomputed n*log2(n) table.
+
+The `*_from_patterns` variants take the raw pattern array instead of a
+FeedbackMatrix so worker processes can score against their own mapping.
+"""
+
+import numpy as np
+
+from ..feedback import PATTERN_COUNT
+from ..feedback_matrix import FeedbackMatrix
+
+# Upper bound on guess x candidate cells materialized per scoring block
+_BLOCK_CELLS = 1 << 22
+# Smaller blocks for searches that can stop early at a perfect splitter
+_EARLY_EXIT_BLOCK_CELLS = 1 << 16
+
+# _NLOG2N[n] == n * log2(n), grown on demand (entry 0 is 0 by convention)
+_NLOG2N = np.zeros(1)
+
+
+def nlog2n_table(size: int) -> np.ndarray:
+    """Return a table of n * log2(n) covering bucket sizes up to `size`."""
+    global _NLOG2N
+    if len(_NLOG2N) <= size:
+        n = np.arange(1, size + 1, dtype=np.float64)
+        _NLOG2N = np.concatenate(([0.0], n * np.log2(n)))
+    return _NLOG2N
+
+
+def pattern_histograms(patterns: np.ndarray) -> np.ndarray:
+    """Count how many candidates fall into each pattern bucket, per guess.
+
+    Args:
+        patterns: Pattern codes of shape (guesses, candidates)
+
+    Returns:
+        int array of shape (guesses, PATTERN_COUNT) of bucket sizes
+    """
+    rows = patterns.shape[0]
+    offsets = (np.arange(rows, dtype=np.int64) * PATTERN_COUNT)[:, None]
+    counts = np.bincount((patterns + offsets).ravel(),
+                         minlength=rows * PATTERN_COUNT)
+    return counts.reshape(rows, PATTERN_COUNT)
+
+
+def _blocks(patterns: np.ndarray, guess_ids: np.ndarray, candidate_ids: np.ndarray,
+            block_cells: int = _BLOCK_CELLS):
+    """Yield (start, histograms) for consecutive blocks of guesses."""
+    rows_per_block = max(1, block_cells // max(1, len(candidate_ids)))
+    for start in range(0, len(guess_ids), rows_per_block):
+        block = guess_ids[start:start + rows_per_block]
+        yield start, pattern_histograms(patterns[np.ix_(block, candidate_ids)])
+
+
+def expected_information_gain(feedback_matrix: FeedbackMatrix, guess_ids: np.ndarray,
+                              candidate_ids: np.ndarray) -> np.ndarray:
+    """Expected information gain (in bits) of each guess over the candidates.
+
+    Args:
+        feedback_matrix: Feedback matrix for the dictionary
+        guess_ids: Ids of the guesses to score
+        candidate_ids: Ids of the remaining candidate words
+
+    Returns:
+        float array of scores aligned with `guess_ids`
+    """
+    return information_gain_from_patterns(
+        feedback_matrix.patterns, guess_ids, candidate_ids)
+
+
+def information_gain_from_patterns(patterns: np.ndarray, guess_ids: np.ndarray,
+                                   candidate_ids: np.ndarray) -> np.ndarray:
+    """`expected_information_gain` over a raw pattern matrix."""
+    total = len(candidate_ids)
+    table = nlog2n_table(total)
+    scores = np.empty(len(guess_ids), dtype=np.float64)
+    for start, histograms in _blocks(patterns, guess_ids, candidate_ids):
+        expected_entropy = table[histograms].sum(axis=1) / total
+        scores[start:start + len(histograms)] = np.log2(total) - expected_entropy
+    return scores
+
+
+def worst_case_sizes(feedback_matrix: FeedbackMatrix, guess_ids: np.ndarray,
+                     candidate_ids: np.ndarray) -> np.ndarray:
+    """Size of the largest pattern bucket each guess leaves (minimax score).
+
+    Args:
+        feedback_matrix: Feedback matrix for the dictionary
+        guess_ids: Ids of the guesses to score
+        candidate_ids: Ids of the remaining candidate words
+
+    Returns:
+        int array of worst-case remaining candidates aligned with `guess_ids`
+    """
+    return worst_case_from_patterns(
+        feedback_matrix.patterns, guess_ids, candidate_ids)
+
+
+def worst_case_from_patterns(patterns: np.ndarray, guess_ids: np.ndarray,
+                             candidate_ids: np.ndarray) -> np.ndarray:
+    """`worst_case_sizes` over a raw pattern matrix."""
+    sizes = np.empty(len(guess_ids), dtype=np.int64)
+    for start, histograms in _blocks(patterns, guess_ids, candidate_ids):
+        sizes[start:start + len(histograms)] = histograms.max(axis=1)
+    return sizes
+
+
+def rank_by_information_gain(feedback_matrix: FeedbackMatrix, guess_ids: np.ndarray,
+                             candidate_ids: np.ndarray) -> np.ndarray:
+    """Return positions into `guess_ids` ordered from best to worst score.
+
+    Ties keep the order of `guess_ids`.
+    """
+    scores = expected_information_gain(feedback_matrix, guess_ids, candidate_ids)
+    return np.argsort(-scores, kind='stable')
+
+
+def bucket_counts_from_patterns(patterns: np.ndarray, guess_ids: np.ndarray,
+                                candidate_ids: np.ndarray) -> np.ndarray:
+    """Number of non-empty pattern buckets each guess splits the candidates into."""
+    counts = np.empty(len(guess_ids), dtype=np.int64)
+    for start, histograms in _blocks(patterns, guess_ids, candidate_ids):
+        counts[start:start + len(histograms)] = np.count_nonzero(histograms, axis=1)
+    return counts
+
+
+def best_worst_case_index(sizes: np.ndarray, bucket_counts: np.ndarray = None) -> int:
+    """Position of the guess with the smallest worst-case bucket.
+
+    Ties go to the guess with more buckets when `bucket_counts` is given, then
+    to the earliest guess.
+    """
+    if bucket_counts is None:
+        return int(np.argmin(sizes))
+    keys = sizes.astype(np.int64) * (PATTERN_COUNT + 1) - bucket_counts
+    return int(np.argmin(keys))
+
+
+def best_worst_case(feedback_matrix: FeedbackMatrix, guess_ids: np.ndarray,
+                    candidate_ids: np.ndarray, tie_break_buckets: bool = False) -> int:
+    """Find the guess leaving the smallest worst-case bucket (minimax leaf).
+
+    Guesses are scored a block at a time from pattern histograms, stopping at
+    the first perfect splitter (every bucket of size one), which no other
+    guess can beat.
+
+    Args:
+        feedback_matrix: Feedback matrix for the dictionary
+        guess_ids: Ids of the guesses to score, in preference order
+        candidate_ids: Ids of the remaining candidate words
+        tie_break_buckets: Prefer the guess with more buckets among equal
+            worst cases (otherwise the earliest guess wins)
+
+    Returns:
+        Position in `guess_ids` of the best guess
+    """
+    return best_worst_case_from_patterns(
+        feedback_matrix.patterns, guess_ids, candidate_ids, tie_break_buckets)
+
+
+def best_worst_case_from_patterns(patterns: np.ndarray, guess_ids: np.ndarray,
+                                  candidate_ids: np.ndarray,
+                                  tie_break_buckets: bool = False) -> int:
+    """`best_worst_case` over a raw pattern matrix."""
+    best_index, best_key = 0, None
+    for start, histograms in _blocks(patterns, guess_ids, candidate_ids,
+                                     _EARLY_EXIT_BLOCK_CELLS):
+        sizes = histograms.max(axis=1)
+        perfect = np.flatnonzero(sizes <= 1)
+        if len(perfect):
+            # All perfect splitters tie on both criteria; the earliest wins
+            return start + int(perfect[0])
+
+        counts = np.count_nonzero(histograms, axis=1) if tie_break_buckets else None
+        i = best_worst_case_index(sizes, counts)
+        key = (sizes[i], -counts[i] if tie_break_buckets else 0)
+        if best_key is None or key < best_key:
+            best_index, best_key = start + i, key
+    return best_index
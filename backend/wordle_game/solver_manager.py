@@ -1,5 +1,8 @@
 import config
 from wordle_game.dictionary import load_dictionary
+from .feedback_matrix import get_feedback_matrix
+from .opening_book import get_opening_book
+from .word_order import get_word_order
 from typing import Dict, Any, List, Optional, Type, Tuple
 from .solver import (
     BaseSolver,
@@ -23,9 +26,15 @@ class SolverManager:
         self.dictionary = dictionary_words
         self._solvers: Dict[str, BaseSolver] = {}
         self._active_solver: Optional[BaseSolver] = None
+        # Whether the active solver runs with default parameters (book hints apply)
+        self._active_solver_default = True
+        # Search details of the last hint (empty unless a search ran)
+        self.last_hint_info: Dict[str, Any] = {}
+        feedback_matrix = get_feedback_matrix(dictionary_words)
+        self.opening_book = get_opening_book(feedback_matrix)
         self.ordered_words = load_dictionary(config.ORDERED_WORDS_PATH) \
             if config.ORDERED_WORDS_PATH \
-            else MinimaxSolver._estimate_feedback_spread(self.dictionary)
+            else get_word_order(feedback_matrix)
 
     def get_solver(self, solver_type: str, solver_params: Optional[Dict[str, Any]] = None) -> BaseSolver:
         """Get or create a solver of the specified type.
@@ -37,8 +46,23 @@ class SolverManager:
                     - simulations: Number of simulations
                     - exploration_constant: UCB1 exploration parameter
                     - reward_multiplier: Reward scaling factor
+                    - reuse_tree: Keep the search tree between turns
+                    - root_workers: Processes growing independent trees
+                    - time_budget_ms: Per-hint time budget; runs simulations
+                      until it is spent or the best move converges
+                    - transpositions: Share nodes between move orders
+                      reaching the same candidates
+                    - outcome_search: Simulate targets among the candidates
+                      and search every feedback outcome of a move
                 Minimax specific:
                     - max_depth: Maximum search depth
+                    - time_budget_ms: Per-hint time budget; searches with
+                      iterative deepening and returns the best guess in time
+                    - tie_break_buckets: Prefer more feedback buckets among
+                      leaf guesses with equal worst cases
+                    - root_workers: Processes searching root guesses in parallel
+                Greedy specific:
+                    - probe_guesses: Also score non-candidate dictionary words
 
         Returns:
             The requested solver instance
@@ -81,15 +105,24 @@ class SolverManager:
         if solver_type:
             solver = self.get_solver(solver_type, solver_params)
             self._active_solver = solver
+            self._active_solver_default = not solver_params
         else:
             if not self._active_solver:
                 self._active_solver = self.get_solver(config.DEFAULT_SOLVER)
+                self._active_solver_default = True
             solver = self._active_solver
 
-        # Get hint from solver
-        hint = solver.starting_word() \
-            if first_guess \
-            else solver.select_guess(candidates)
+        # Get hint from solver, answering opening states from the book (which
+        # is built with default solver parameters) without any search
+        self.last_hint_info = {}
+        if first_guess:
+            hint = solver.starting_word()
+        else:
+            hint = self.opening_book.lookup(solver, candidates) \
+                if self._active_solver_default else None
+            if hint is None:
+                hint = solver.select_guess(candidates)
+                self.last_hint_info = solver.search_info()
 
         # Handle case where hint has already been guessed
         if hint in previous_guesses:
@@ -108,6 +141,16 @@ class SolverManager:
 
         return hint, solver.get_name(), len(candidates)
 
+    def observe_feedback(self, guess: str, pattern: int) -> None:
+        """Let every solver of the game update its state after a guess is played.
+
+        Args:
+            guess: The word that was played
+            pattern: Feedback pattern code observed for the guess
+        """
+        for solver in self._solvers.values():
+            solver.observe_feedback(guess, pattern)
+
     @staticmethod
     def _get_solver_class(solver_type: str) -> Type[BaseSolver]:
         """Get the solver class based on type."""
@@ -132,13 +175,23 @@ class SolverManager:
             dictionary: List of valid words
             solver_params: Optional parameters for the solver
         """
+        solver_params = solver_params or {}
         if solver_class == MinimaxSolver:
+            time_budget_ms = solver_params.get('time_budget_ms')
+            default_depth = config.MINIMAX_DEPTH if time_budget_ms is None \
+                else config.MINIMAX_MAX_ITERATIVE_DEPTH
             return solver_class(
                 dictionary,
                 self.ordered_words,
-                max_depth=solver_params.get('max_depth', config.MINIMAX_DEPTH),
+                max_depth=solver_params.get('max_depth', default_depth),
+                time_budget=None if time_budget_ms is None else time_budget_ms / 1000,
+                tie_break_buckets=solver_params.get(
+                    'tie_break_buckets', config.MINIMAX_TIE_BREAK_BUCKETS),
+                root_workers=solver_params.get(
+                    'root_workers', config.MINIMAX_ROOT_WORKERS),
             )
         elif solver_class == MCTSSolver:
+            time_budget_ms = solver_params.get('time_budget_ms')
             return solver_class(
                 dictionary,
                 self.ordered_words,
@@ -147,7 +200,22 @@ class SolverManager:
                 exploration_constant=solver_params.get(
                     'exploration_constant', config.MCTS_EXPLORATION_CONSTANT),
                 reward_multiplier=solver_params.get(
-                    'reward_multiplier', config.MCTS_REWARD_MULTIPLIER)
+                    'reward_multiplier', config.MCTS_REWARD_MULTIPLIER),
+                reuse_tree=solver_params.get(
+                    'reuse_tree', config.MCTS_REUSE_TREE),
+                root_workers=solver_params.get(
+                    'root_workers', config.MCTS_ROOT_WORKERS),
+                time_budget=None if time_budget_ms is None else time_budget_ms / 1000,
+                transpositions=solver_params.get(
+                    'transpositions', config.MCTS_TRANSPOSITIONS),
+                outcome_search=solver_params.get(
+                    'outcome_search', config.MCTS_OUTCOME_SEARCH)
+            )
+        elif solver_class == GreedySolver:
+            return solver_class(
+                dictionary,
+                probe_guesses=solver_params.get(
+                    'probe_guesses', config.GREEDY_PROBE_GUESSES)
             )
         else:
             return solver_class()
@@ -0,0 +1,175 @@
+"""
+Heuristic ordering of dictionary words for solver move ordering.
+
+Words are ranked by their average letter overlap with the rest of the
+dictionary: the number of distinct letters a word shares with each other
+word, averaged over the dictionary, with more distinct letters breaking ties.
+The overlap sum equals, for each distinct letter of the word, the number of
+dictionary words containing that letter, so the ranking is computed from a
+26-entry letter frequency table instead of comparing every pair of words.
+
+The order is cached as a small versioned JSON file under `config.DATA_DIR`,
+so dictionaries without a hand-made order file get one once. Build it offline
+with:
+    python -m wordle_game.word_order build
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+import config
+from .feedback_matrix import FeedbackMatrix, get_feedback_matrix
+
+ORDER_VERSION = 1
+
+# Orders already loaded in this process, keyed by dictionary digest
+_ORDERS: Dict[str, List[str]] = {}
+
+
+class WordOrderError(Exception):
+    """Raised when a word order file is missing, stale or corrupt."""
+    pass
+
+
+def letter_presence(feedback_matrix: FeedbackMatrix) -> np.ndarray:
+    """Return a (words, 26) bool array of the letters each word contains."""
+    n = len(feedback_matrix)
+    present = np.zeros((n, 26), dtype=bool)
+    present[np.arange(n)[:, None], feedback_matrix.letters] = True
+    return present
+
+
+def build_order(feedback_matrix: FeedbackMatrix) -> List[str]:
+    """Rank the dictionary words by estimated feedback spread.
+
+    Args:
+        feedback_matrix: Feedback matrix for the dictionary
+
+    Returns:
+        Dictionary words, best first; ties keep dictionary order
+    """
+    present = letter_presence(feedback_matrix).astype(np.int64)
+    # overlap of each word with every word, summed: one count per shared letter
+    scores = present @ present.sum(axis=0)
+    distinct = present.sum(axis=1)
+    order = np.lexsort((np.arange(len(present)), -distinct, -scores))
+    return [feedback_matrix.words[i] for i in order.tolist()]
+
+
+def order_path(feedback_matrix: FeedbackMatrix) -> str:
+    """Return the word order path for a dictionary under `config.DATA_DIR`."""
+    return os.path.join(
+        config.DATA_DIR,
+        f"word_order_v{ORDER_VERSION}_{feedback_matrix.digest[:16]}.json")
+
+
+def write_order(path: str, feedback_matrix: FeedbackMatrix, words: List[str]) -> None:
+    """Atomically write a word order file.
+
+    Args:
+        path: Destination path of the order
+        feedback_matrix: Feedback matrix defining the dictionary
+        words: Ordered words
+    """
+    content = {
+        'version': ORDER_VERSION,
+        'dictionary_digest': feedback_matrix.digest,
+        'words': words,
+    }
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(content, f, separators=(',', ':'))
+        # mkstemp creates the file owner-only; workers may run as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_order(path: str, feedback_matrix: FeedbackMatrix) -> List[str]:
+    """Load a word order file.
+
+    Args:
+        path: Path of the order
+        feedback_matrix: Feedback matrix the order is expected to match
+
+    Returns:
+        The ordered words
+
+    Raises:
+        WordOrderError: If the order is unreadable or built for another
+            dictionary or order version
+    """
+    try:
+        with open(path) as f:
+            content = json.load(f)
+    except (OSError, ValueError) as e:
+        raise WordOrderError(f"Cannot read word order {path}: {e}") from e
+
+    if (content.get('version') != ORDER_VERSION
+            or content.get('dictionary_digest') != feedback_matrix.digest):
+        raise WordOrderError(f"Word order does not match the dictionary: {path}")
+    return content['words']
+
+
+def get_word_order(feedback_matrix: FeedbackMatrix) -> List[str]:
+    """Get the heuristic word order for a dictionary, building it at most once.
+
+    The order is cached in memory for the process. It is read from its file
+    under `config.DATA_DIR`; if the file is missing or stale it is rebuilt
+    and written first.
+    """
+    words = _ORDERS.get(feedback_matrix.digest)
+    if words is None:
+        path = order_path(feedback_matrix)
+        try:
+            words = load_order(path, feedback_matrix)
+        except WordOrderError:
+            words = build_order(feedback_matrix)
+            write_order(path, feedback_matrix, words)
+        _ORDERS[feedback_matrix.digest] = words
+    return words
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build or inspect the word order for a dictionary."""
+    from .dictionary import load_dictionary
+
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the heuristic word order.")
+    parser.add_argument('command', choices=['build', 'info'])
+    parser.add_argument('--dictionary', default=config.DICTIONARY_PATH,
+                        help="Dictionary file (defaults to config.DICTIONARY_PATH)")
+    args = parser.parse_args(argv)
+
+    feedback_matrix = get_feedback_matrix(load_dictionary(args.dictionary))
+    path = order_path(feedback_matrix)
+
+    if args.command == 'info':
+        try:
+            words = load_order(path, feedback_matrix)
+        except WordOrderError as e:
+            print(f"Invalid word order: {e}")
+            return 1
+        print(f"{len(words)} words, best first: {' '.join(words[:10])}")
+        return 0
+
+    words = build_order(feedback_matrix)
+    write_order(path, feedback_matrix, words)
+    print(f"Wrote order of {len(words)} words to {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
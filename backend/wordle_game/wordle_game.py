@@ -1,7 +1,11 @@
 import config
 from typing import List, Tuple
 import random
-from .feedback import compute_feedback, filter_candidates
+from .feedback import ALL_GREEN_PATTERN, compute_feedback, encode_feedback, filter_candidates
+from .feedback_matrix import get_feedback_matrix
+from .candidate_set import CandidateSet
+from .letter_index import get_letter_index
+from .constraint_state import ConstraintState
 
 
 class WordleGame:
@@ -14,6 +18,7 @@ class WordleGame:
             target_word: Optional specific target word
         """
         self.dictionary = dictionary_words
+        self.feedback_matrix = get_feedback_matrix(dictionary_words)
         self.max_guesses = max_guesses
 
         # Randomly generate target word if not provided
@@ -22,15 +27,48 @@ class WordleGame:
         else:
             self.target_word = target_word
 
-        self.candidate_words: List[str] = self.dictionary.copy()
+        self.candidate_words: CandidateSet = CandidateSet.full(
+            self.feedback_matrix)
         self.guess_count: int = 0
-        self.history: List[Tuple[str, Tuple[int, ...]]] = []
+        self.history: List[Tuple[str, int]] = []
+        self.constraints: ConstraintState = ConstraintState.empty()
         self.game_won: bool = False
 
         # Track previous guesses to prevent repetition
         self.previous_guesses: set[str] = set()
 
-    def submit_guess(self, guess: str) -> Tuple[Tuple[int, ...], bool]:
+    @classmethod
+    def from_history(cls, dictionary_words: List[str], history: List[Tuple[str, int]],
+                     max_guesses: int = config.MAX_GUESSES, target_word: str = "") -> 'WordleGame':
+        """Restore a game from its guess history.
+
+        The remaining candidates are resolved from the letter index with a few
+        bitset intersections instead of re-filtering the dictionary per guess.
+
+        Args:
+            dictionary_words: List of valid n-letter words
+            history: List of (guess, pattern code) pairs already played
+            max_guesses: Maximum number of allowed guesses
+            target_word: Optional specific target word; defaults to a random
+                candidate consistent with the history
+
+        Returns:
+            A game in the state reached after playing the history
+        """
+        game = cls(dictionary_words, max_guesses, target_word)
+        game.history = list(history)
+        game.guess_count = len(game.history)
+        game.previous_guesses = {guess for guess, _ in game.history}
+        game.constraints = ConstraintState.from_history(game.history)
+        game.game_won = bool(game.history) and \
+            game.history[-1][1] == ALL_GREEN_PATTERN
+        game.candidate_words = get_letter_index(
+            game.feedback_matrix).query(game.history)
+        if target_word == "" and game.candidate_words:
+            game.target_word = random.choice(game.candidate_words.words())
+        return game
+
+    def submit_guess(self, guess: str) -> Tuple[int, bool]:
         """Submit a guess and get feedback.
 
         Args:
@@ -38,7 +76,7 @@ class WordleGame:
 
         Returns:
             Tuple containing:
-                - Feedback tuple (2: green, 1: yellow, 0: gray)
+                - Feedback pattern code (decode with `decode_pattern`)
                 - Boolean indicating if the game is over
         """
         if not self._is_valid_guess(guess):
@@ -47,21 +85,22 @@ class WordleGame:
         if self.is_game_over():
             raise ValueError("Game is already over")
 
-        feedback = compute_feedback(guess, self.target_word)
-        self.history.append((guess, feedback))
+        pattern = self._pattern(guess)
+        self.history.append((guess, pattern))
+        self.constraints = self.constraints.merge(guess, pattern)
         self.guess_count += 1
 
         # Add to previous guesses set
         self.previous_guesses.add(guess)
 
         # Update candidate words based on feedback
-        self.candidate_words = list(filter_candidates(
-            tuple(self.candidate_words), guess, feedback))
-        
+        self.candidate_words = filter_candidates(
+            self.candidate_words, guess, pattern)
+
         # Check if game is won
         self.game_won = (guess == self.target_word)
 
-        return feedback, self.is_game_over()
+        return pattern, self.is_game_over()
 
     def is_game_over(self) -> bool:
         """Check if the game is over (won or max guesses reached)."""
@@ -78,16 +117,24 @@ class WordleGame:
             "max_guesses": self.max_guesses,
             "remaining_guesses": self.max_guesses - self.guess_count,
             "history": self.history,
+            "constraint_key": self.constraints.key(),
             "game_over": self.is_game_over(),
             "game_won": self.game_won,
             "candidates_remaining": len(self.candidate_words),
             "previous_guesses": list(self.previous_guesses)
         }
 
+    def _pattern(self, guess: str) -> int:
+        """Look up the feedback pattern for a guess against the target."""
+        target_id = self.feedback_matrix.word_ids.get(self.target_word)
+        if target_id is None:
+            return encode_feedback(compute_feedback(guess, self.target_word))
+        return self.feedback_matrix.pattern(self.feedback_matrix.id_of(guess), target_id)
+
     def _is_valid_guess(self, guess: str) -> bool:
         """Check if a guess is valid."""
-        return guess in self.dictionary
+        return guess in self.feedback_matrix.word_ids
 
     def get_remaining_candidates(self) -> List[str]:
         """Get the list of remaining candidate words."""
-        return self.candidate_words
+        return self.candidate_words.words()